@@ -16,6 +16,20 @@ FIELD_MAP = {
     'wolyitta': 'wolayita'
 }
 
+TRANSLATION_FILES = [
+    'translations/spanish.json',
+    'translations/french.json',
+    'translations/amharic.json',
+    'translations/tigrinya.json',
+    'translations/oromo.json',
+    'translations/somali.json',
+    'translations/arabic.json',
+    'translations/hadiyaa.json',
+    'translations/wolyitta.json',
+    'translations/afar.json',
+    'translations/gamo.json'
+]
+
 def get_field_name(lang):
     return FIELD_MAP.get(lang, lang)
 
@@ -58,23 +72,9 @@ def main():
     print("ADDING MISSING LANGUAGE FIELDS TO ALL PHRASES")
     print("="*70)
     
-    translation_files = [
-        'translations/spanish.json',
-        'translations/french.json',
-        'translations/amharic.json',
-        'translations/tigrinya.json',
-        'translations/oromo.json',
-        'translations/somali.json',
-        'translations/arabic.json',
-        'translations/hadiyaa.json',
-        'translations/wolyitta.json',
-        'translations/afar.json',
-        'translations/gamo.json'
-    ]
-    
     total_updates = 0
     
-    for filepath in translation_files:
+    for filepath in TRANSLATION_FILES:
         if os.path.exists(filepath):
             updates = add_missing_fields_to_file(filepath)
             total_updates += updates
@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+"""
+Build the generated translation files from the per-language sources.
+
+Stages only run when the content of their inputs or outputs changed since
+the last build, so editing one language file rebuilds just the outputs that
+depend on it (including translations/all_languages.json served by server.js).
+
+Usage:
+    python build_translations.py                  # rebuild stale outputs
+    python build_translations.py --dry-run        # show what would run
+    python build_translations.py --force          # rebuild everything
+    python build_translations.py --list           # list stages and dependencies
+    python build_translations.py cross_populate   # also run a maintenance stage
+"""
+
+import argparse
+from pathlib import Path
+
+from translation_tools.alignment import default_languages, load_alignment
+from translation_tools.phonetics import persistent_cache
+from translation_tools.pipeline import Pipeline, Stage, ROOT, run_script
+from translation_tools.streaming import CatalogWriter, StreamedCatalog, iter_events, iter_phrases
+
+import add_missing_language_fields
+import complete_all_languages
+import cross_populate_translations
+import fill_missing_translations
+import merge_all_translations
+import sync_from_spanish
+
+TRANSLATIONS_DIR = 'translations'
+
+# Snapshot the merge starts from (all_languages.json itself is now generated)
+MERGE_BASE = 'all_languages_0.json'
+MERGED_FILE = f'{TRANSLATIONS_DIR}/all_languages_2.json'
+PUBLISHED_FILE = f'{TRANSLATIONS_DIR}/all_languages.json'
+COLUMNAR_FILE = f'{TRANSLATIONS_DIR}/all_languages.col'
+CATALOG_DB = f'{TRANSLATIONS_DIR}/all_languages.db'
+SEARCH_INDEX = f'{TRANSLATIONS_DIR}/all_languages.search'
+VALIDATION_REPORT = f'{TRANSLATIONS_DIR}/build/validation_report.json'
+PHRASE_IDS = f'{TRANSLATIONS_DIR}/phrase_ids.jsonl'
+ALIGNMENT_FILE = f'{TRANSLATIONS_DIR}/build/alignment.json'
+BUILD_DIR = f'{TRANSLATIONS_DIR}/build'
+# all_languages.min.json / .rows.json plus their .gz/.br siblings
+COMPACT_FILES = f'{BUILD_DIR}/all_languages.*.json*'
+SHARDS_DIR = f'{BUILD_DIR}/shards'
+API_MANIFEST = f'{BUILD_DIR}/api_manifest.json'
+CONVERSATION_STORE = f'{BUILD_DIR}/conversations.json'
+
+# Changing the normalizer changes the merge and the search index
+PHONETICS_MODULE = 'translation_tools/phonetics.py'
+
+
+def language_file(lang):
+    return f'{TRANSLATIONS_DIR}/{lang}.json'
+
+
+def repo_path(path):
+    """Normalize a script's './translations/x.json' style path."""
+    return Path(path).as_posix().lstrip('./') if path.startswith('./') else path
+
+
+def align_stage():
+    """Assign phrase IDs to new phrases and refresh the alignment table."""
+    alignment = load_alignment(Path(TRANSLATIONS_DIR))
+    # The merge keeps phrases only the base snapshot has: register them too,
+    # so every published phrase has an ID the exports can key on
+    for category, phrase in iter_phrases(f'{TRANSLATIONS_DIR}/{MERGE_BASE}'):
+        if isinstance(phrase.get('english'), str):
+            alignment.ids.assign(category, phrase['english'])
+    # The only writer of the committed registry
+    alignment.ids.save()
+    alignment.save()
+    print(f"🔗 Aligned {len(alignment.languages)} languages over {len(alignment.ids)} phrase IDs")
+
+
+def merge_stage():
+    """Merge every language file onto the base snapshot."""
+    merge_all_translations.merge_translations(TRANSLATIONS_DIR, MERGE_BASE, MERGED_FILE)
+
+
+def validate_stage():
+    """Check the merged file for encoding errors, stubs and placeholders before it is published."""
+    from translation_tools.validate import published_languages, validate_files, write_report
+
+    # Every language of the merged file is about to be published: its placeholders are errors
+    report = validate_files([MERGED_FILE], published=published_languages(MERGED_FILE))
+    write_report(report, VALIDATION_REPORT)
+    print(f"   {report['errors']} error(s), {report['warnings']} warning(s) "
+          f"({report['seconds']:.3f}s), report: {VALIDATION_REPORT}")
+    if report['errors']:
+        raise RuntimeError(f"{MERGED_FILE} failed validation: "
+                           f"{report['by_check']} (see {VALIDATION_REPORT})")
+
+
+def publish_stage():
+    """Publish the validated merged file for the server."""
+    # The merge normalized the phonetics it added; published ones (pinyin
+    # tone marks, ɔ, ...) are copied unchanged. Streamed phrase by phrase,
+    # so memory does not grow with the catalog
+    with CatalogWriter(PUBLISHED_FILE) as writer:
+        for kind, name, value in iter_events(MERGED_FILE):
+            if kind == 'meta':
+                writer.write_meta(name, value)
+            elif kind == 'categories':
+                writer.begin_categories()
+            elif kind == 'category':
+                writer.begin_category(name)
+            else:
+                writer.write_phrase(name, value)
+
+
+def columnar_stage():
+    """Export the published catalog in the memory-mapped columnar format."""
+    from translation_tools.columnar import write_columnar
+
+    write_columnar(StreamedCatalog(PUBLISHED_FILE), COLUMNAR_FILE)
+
+
+def compact_stage():
+    """Write minified and row-array copies of the published catalog, precompressed."""
+    from translation_tools.compact import compact_outputs
+
+    for path in compact_outputs(PUBLISHED_FILE, BUILD_DIR):
+        print(f"   {Path(path).name}: {Path(path).stat().st_size:,} bytes")
+
+
+def shards_stage():
+    """Split the published catalog into per-language, per-category shards for server.js."""
+    from translation_tools.shards import export_shards
+
+    manifest = export_shards(PUBLISHED_FILE, SHARDS_DIR)
+    count = sum(len(categories) for categories in manifest['shards'].values())
+    print(f"   {count} shards, manifest: {SHARDS_DIR}/manifest.json")
+
+
+def api_manifest_stage():
+    """Hash the files behind server.js's JSON APIs for its ETags."""
+    from translation_tools.api_manifest import build_api_manifest
+
+    manifest = build_api_manifest()
+    print(f"   {len(manifest['files'])} files hashed into {API_MANIFEST}")
+
+
+def conversations_stage():
+    """Compile the contextual conversations into the store server.js keeps in memory."""
+    from translation_tools.conversations import compile_store, write_store
+
+    store = compile_store()
+    write_store(store)
+    print(f"   {len(store['contexts'])} contexts, {len(store['etags'])} responses in {CONVERSATION_STORE}")
+
+
+def catalog_stage():
+    """Export the published catalog to the indexed SQLite database."""
+    from translation_tools.catalog import export_catalog
+
+    export_catalog(StreamedCatalog(PUBLISHED_FILE), CATALOG_DB)
+
+
+def search_index_stage():
+    """Build the accent- and script-insensitive phrase search index."""
+    from translation_tools.search_index import build_index
+
+    build_index(StreamedCatalog(PUBLISHED_FILE), SEARCH_INDEX)
+
+
+def build_stages():
+    """Declare every stage in dependency order."""
+    js_sources = sorted(p.name for p in (ROOT / TRANSLATIONS_DIR).glob('*_translations.js'))
+    sync_files = [repo_path(p) for p in sync_from_spanish.LANGUAGES.values()]
+    complete_files = [language_file(lang) for lang in complete_all_languages.NEW_LANGUAGES]
+    cross_files = [language_file(lang) for lang in cross_populate_translations.ALL_LANGUAGES]
+    fill_files = list(fill_missing_translations.FILES.values())
+    field_files = list(add_missing_language_fields.TRANSLATION_FILES)
+
+    return [
+        # Maintenance stages: rewrite language sources in place, run only when named
+        Stage(
+            name='build_comprehensive',
+            description='Regenerate language JSON from the *_translations.js sources',
+            inputs=[f'{TRANSLATIONS_DIR}/*_translations.js'],
+            outputs=[language_file(name.replace('_translations.js', '')) for name in js_sources],
+            run=run_script('build_comprehensive_json.py'),
+            default=False
+        ),
+        Stage(
+            name='sync_from_spanish',
+            description='Rebuild language files on the Spanish phrase structure',
+            inputs=[repo_path(sync_from_spanish.MASTER_FILE)] + sync_files,
+            outputs=sync_files,
+            run=sync_from_spanish.main,
+            default=False
+        ),
+        Stage(
+            name='complete_languages',
+            description='Add missing categories and phrases to the newer languages',
+            inputs=[language_file(complete_all_languages.REFERENCE_LANG)] + complete_files,
+            outputs=complete_files,
+            run=complete_all_languages.main,
+            default=False
+        ),
+        Stage(
+            name='cross_populate',
+            description='Rebuild language files as views of the normalized phrase store',
+            inputs=cross_files,
+            outputs=cross_files + [f'{TRANSLATIONS_DIR}/store/*.json',
+                                   f'{TRANSLATIONS_DIR}/store/*/*.json'],
+            run=cross_populate_translations.main,
+            default=False
+        ),
+        Stage(
+            name='fill_missing',
+            description='Fill empty fields from the pooled translations',
+            inputs=fill_files,
+            outputs=fill_files,
+            run=fill_missing_translations.main,
+            default=False
+        ),
+        Stage(
+            name='add_missing_fields',
+            description='Ensure every phrase has every language field',
+            inputs=field_files,
+            outputs=field_files,
+            run=add_missing_language_fields.main,
+            default=False
+        ),
+
+        # Default stages: derived outputs
+        Stage(
+            name='align',
+            description=f'Assign stable phrase IDs and build {ALIGNMENT_FILE}',
+            inputs=[language_file(lang) for lang in default_languages()]
+                   + [f'{TRANSLATIONS_DIR}/{MERGE_BASE}', 'translation_tools/alignment.py'],
+            outputs=[PHRASE_IDS, ALIGNMENT_FILE],
+            run=align_stage
+        ),
+        Stage(
+            name='merge',
+            description=f'Merge language files into {MERGED_FILE}',
+            inputs=[f'{TRANSLATIONS_DIR}/{MERGE_BASE}', PHONETICS_MODULE, PHRASE_IDS, ALIGNMENT_FILE,
+                    'merge_all_translations.py', 'translation_tools/validate.py']
+                   + [language_file(lang) for lang in merge_all_translations.LANGUAGES],
+            outputs=[MERGED_FILE],
+            run=merge_stage
+        ),
+        Stage(
+            name='validate',
+            description=f'Check {MERGED_FILE} for mojibake, stubs and placeholders',
+            inputs=[MERGED_FILE, 'translation_tools/validate.py', 'translation_tools/mojibake.py'],
+            outputs=[VALIDATION_REPORT],
+            run=validate_stage
+        ),
+        Stage(
+            name='publish',
+            description=f'Publish the validated merge as {PUBLISHED_FILE}',
+            # The report is an input so publishing waits for a passing validation
+            inputs=[MERGED_FILE, VALIDATION_REPORT],
+            outputs=[PUBLISHED_FILE],
+            run=publish_stage
+        ),
+        Stage(
+            name='columnar',
+            description=f'Export {PUBLISHED_FILE} to the columnar {COLUMNAR_FILE}',
+            inputs=[PUBLISHED_FILE, PHRASE_IDS, 'translation_tools/columnar.py'],
+            outputs=[COLUMNAR_FILE],
+            run=columnar_stage
+        ),
+        Stage(
+            name='compact',
+            description=f'Write minified/row-array copies of {PUBLISHED_FILE} with .gz/.br siblings',
+            inputs=[PUBLISHED_FILE, 'translation_tools/compact.py'],
+            outputs=[COMPACT_FILES],
+            run=compact_stage
+        ),
+        Stage(
+            name='shards',
+            description=f'Write per-category phrase shards and {SHARDS_DIR}/manifest.json',
+            inputs=[PUBLISHED_FILE, 'translation_tools/shards.py', 'translation_tools/compact.py'],
+            outputs=[f'{SHARDS_DIR}/manifest.json', f'{SHARDS_DIR}/*/*'],
+            run=shards_stage
+        ),
+        Stage(
+            name='api_manifest',
+            description=f'Hash conversation and contextual phrase files into {API_MANIFEST}',
+            inputs=['translations_network/priority_contextual_phrases.json',
+                    'contextual_conversations/*.json', 'translation_tools/api_manifest.py'],
+            outputs=[API_MANIFEST],
+            run=api_manifest_stage
+        ),
+        Stage(
+            name='conversations',
+            description=f'Compile contextual_conversations/ into {CONVERSATION_STORE}',
+            inputs=['contextual_conversations/*.json', 'translation_tools/conversations.py',
+                    'translation_tools/api_manifest.py'],
+            outputs=[CONVERSATION_STORE],
+            run=conversations_stage
+        ),
+        Stage(
+            name='catalog',
+            description=f'Export {PUBLISHED_FILE} to the SQLite catalog {CATALOG_DB}',
+            inputs=[PUBLISHED_FILE, PHRASE_IDS, 'translation_tools/catalog.py'],
+            outputs=[CATALOG_DB],
+            run=catalog_stage
+        ),
+        Stage(
+            name='search_index',
+            description=f'Build the phrase search index {SEARCH_INDEX}',
+            inputs=[PUBLISHED_FILE, PHRASE_IDS, 'translation_tools/search_index.py',
+                    PHONETICS_MODULE],
+            outputs=[SEARCH_INDEX],
+            run=search_index_stage
+        ),
+    ]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Incrementally build translation outputs")
+    parser.add_argument(
+        "stages",
+        nargs="*",
+        help="Stages to run in addition to the stale default stages"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Run selected stages even if they are up to date"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Only report which stages would run"
+    )
+    parser.add_argument(
+        "--list",
+        action="store_true",
+        help="List stages and their dependencies"
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    pipeline = Pipeline(build_stages())
+
+    if args.list:
+        deps = pipeline.dependencies()
+        for stage in pipeline.stages:
+            kind = 'default' if stage.default else 'maintenance'
+            after = ', '.join(deps[stage.name]) or '-'
+            print(f"{stage.name:22} [{kind}] after: {after}")
+            print(f"{'':22} {stage.description}")
+        return
+
+    # Phonetic normalizations are shared by the merge and publish stages
+    with persistent_cache():
+        ran = pipeline.run(args.stages, force=args.force, dry_run=args.dry_run)
+    print(f"\n✅ {len(ran)} stage(s) {'would run' if args.dry_run else 'ran'}: "
+          f"{', '.join(ran) or 'none'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,57 +1,62 @@
-import json
+import argparse
 
-files = {
-    'spanish': 'translations/spanish.json',
-    'french': 'translations/french.json',
-    'oromo': 'translations/oromo.json',
-    'amharic': 'translations/amharic.json',
-    'tigrinya': 'translations/tigrinya.json'
-}
+from translation_tools.coverage import DEFAULT_CACHE_FILE, catalog_coverage, load_coverage, select_files
 
-langs = ['spanish', 'french', 'oromo', 'amharic', 'tigrinya']
 
-print('=' * 70)
-print('Translation Completeness Statistics')
-print('=' * 70)
+def parse_args():
+    parser = argparse.ArgumentParser(description="Translation completeness per file and language")
+    parser.add_argument(
+        "languages",
+        nargs="*",
+        help="Language files to include (default: every translations/<language>.json)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Recount every file instead of reusing .coverage_cache.json"
+    )
+    parser.add_argument(
+        "--catalog",
+        action="store_true",
+        help="Report on the unified catalog database (translations/all_languages.db) instead"
+    )
+    return parser.parse_args()
 
-for file_name, file_path in files.items():
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    total_phrases = sum(len(phrases) for phrases in data['categories'].values())
-    
-    print(f'\n{file_name.upper()} FILE:')
-    print(f'  Total phrases: {total_phrases}')
-    
-    for lang in langs:
-        filled = sum(1 for category in data['categories'].values() 
-                    for phrase in category 
-                    if phrase.get(lang, '').strip())
-        percentage = (filled / total_phrases * 100) if total_phrases > 0 else 0
-        print(f'  {lang.capitalize():12} {filled:3} / {total_phrases} ({percentage:5.1f}%)')
-
-print('\n' + '=' * 70)
-print('SUMMARY BY LANGUAGE (across all files):')
-print('=' * 70)
 
-# Calculate overall statistics
-for lang in langs:
-    total_count = 0
-    filled_count = 0
+def main():
+    args = parse_args()
+    if args.catalog:
+        coverage = catalog_coverage(languages=args.languages)
+    else:
+        coverage = load_coverage(select_files(args.languages),
+                                 cache_file=None if args.no_cache else DEFAULT_CACHE_FILE)
+    langs = coverage.fields()
     
-    for file_path in files.values():
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+    print('=' * 70)
+    print('Translation Completeness Statistics')
+    print('=' * 70)
+    
+    for file_name in coverage.languages:
+        total_phrases = coverage.total(file_name)
         
-        total = sum(len(phrases) for phrases in data['categories'].values())
-        filled = sum(1 for category in data['categories'].values() 
-                    for phrase in category 
-                    if phrase.get(lang, '').strip())
+        print(f'\n{file_name.upper()} FILE:')
+        print(f'  Total phrases: {total_phrases}')
         
-        total_count += total
-        filled_count += filled
+        for lang in coverage.fields(file_name):
+            filled = coverage.filled(file_name, lang)
+            percentage = coverage.percent(file_name, lang)
+            print(f'  {lang.capitalize():12} {filled:3} / {total_phrases} ({percentage:5.1f}%)')
+    
+    print('\n' + '=' * 70)
+    print('SUMMARY BY LANGUAGE (across all files):')
+    print('=' * 70)
+    
+    for lang in langs:
+        filled_count, total_count = coverage.field_summary(lang)
+        avg_percentage = (filled_count / total_count * 100) if total_count > 0 else 0
+        print(f'{lang.capitalize():12} {filled_count:4} / {total_count} ({avg_percentage:5.1f}%)')
     
-    avg_percentage = (filled_count / total_count * 100) if total_count > 0 else 0
-    print(f'{lang.capitalize():12} {filled_count:4} / {total_count} ({avg_percentage:5.1f}%)')
+    print('=' * 70)
 
-print('=' * 70)
+if __name__ == '__main__':
+    main()
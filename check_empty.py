@@ -1,42 +1,60 @@
-import json
+import argparse
 
-print('Checking for empty translations in each file...\n')
+from translation_tools.coverage import DEFAULT_CACHE_FILE, catalog_coverage, load_coverage, select_files
 
-files = {
-    'spanish': 'translations/spanish.json',
-    'french': 'translations/french.json',
-    'oromo': 'translations/oromo.json',
-    'amharic': 'translations/amharic.json',
-    'tigrinya': 'translations/tigrinya.json'
-}
 
-for file_name, file_path in files.items():
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    # Check the native language field for this file
-    native_lang = data['nativeLanguageField']
-    
-    total = sum(len(phrases) for phrases in data['categories'].values())
-    empty = []
-    
-    for cat_name, phrases in data['categories'].items():
-        for phrase in phrases:
-            translation = phrase.get(native_lang, '')
-            if not translation or translation.strip() == '':
-                empty.append((cat_name, phrase['english']))
+def parse_args():
+    parser = argparse.ArgumentParser(description="Report empty native-language translations")
+    parser.add_argument(
+        "languages",
+        nargs="*",
+        help="Language files to check (default: every translations/<language>.json)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Recount every file instead of reusing .coverage_cache.json"
+    )
+    parser.add_argument(
+        "--catalog",
+        action="store_true",
+        help="Report on the unified catalog database (translations/all_languages.db) instead"
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.catalog:
+        coverage = catalog_coverage(languages=args.languages)
+    else:
+        coverage = load_coverage(select_files(args.languages),
+                                 cache_file=None if args.no_cache else DEFAULT_CACHE_FILE)
     
-    print(f'{file_name.upper()} ({native_lang}):')
-    print(f'  Total phrases: {total}')
-    print(f'  Empty {native_lang} translations: {len(empty)}')
-    print(f'  Coverage: {((total - len(empty)) / total * 100):.1f}%')
+    print('Checking for empty translations in each file...\n')
     
-    if empty and len(empty) <= 20:
-        print(f'  Missing phrases:')
-        for cat, eng in empty[:20]:
-            print(f'    - {eng} (in {cat})')
-    elif empty:
-        print(f'  Sample missing phrases:')
-        for cat, eng in empty[:10]:
-            print(f'    - {eng} (in {cat})')
-    print()
+    for file_name in coverage.languages:
+        # Check the native language field for this file
+        native_lang = coverage.native_field(file_name)
+        
+        total = coverage.total(file_name)
+        empty = coverage.missing_native(file_name)
+        
+        print(f'{file_name.upper()} ({native_lang}):')
+        print(f'  Total phrases: {total}')
+        print(f'  Empty {native_lang} translations: {len(empty)}')
+        print(f'  Coverage: {((total - len(empty)) / total * 100 if total else 0):.1f}%')
+        
+        if empty and len(empty) <= 20:
+            print(f'  Missing phrases:')
+            for cat, eng in empty[:20]:
+                print(f'    - {eng} (in {cat})')
+        elif empty:
+            print(f'  Sample missing phrases:')
+            for cat, eng in empty[:10]:
+                print(f'    - {eng} (in {cat})')
+        print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Check the shared phonetic normalizer against the original implementation
+and benchmark the two.
+
+Equivalence is checked on every string in the translation files, on every
+single character of the Basic Multilingual Plane and on random mixtures of
+the characters that occur in phonetic fields.
+
+Usage:
+    python check_phonetics.py                 # equivalence + benchmark
+    python check_phonetics.py --no-benchmark  # equivalence only
+"""
+
+import argparse
+import glob
+import json
+import random
+import re
+import sys
+import time
+import unicodedata
+
+from translation_tools.phonetics import (
+    clear_cache, normalize_phonetic, normalize_phonetics, _normalize
+)
+
+
+def legacy_normalize_phonetic(text):
+    """The implementation previously copied into normalize_phonetics.py and
+    merge_all_translations.py (its quotation-mark entry was a mis-parsed
+    triple-quoted string and never matched real text, so it is left out)."""
+    if not text or not isinstance(text, str):
+        return text
+
+    ipa_map = {
+        'ɛ': 'e', 'ɔ': 'o', 'ə': 'e', 'ʃ': 'sh', 'ʒ': 'zh', 'ŋ': 'ng',
+        'θ': 'th', 'ð': 'th', 'ʔ': '', 'ː': '', 'ˈ': '', 'ˌ': '',
+    }
+    result = text
+    for ipa_char, latin in ipa_map.items():
+        result = result.replace(ipa_char, latin)
+
+    result = ''.join(
+        c for c in unicodedata.normalize('NFD', result)
+        if not unicodedata.combining(c)
+    )
+
+    extra_map = {
+        'ñ': 'n', 'ß': 'ss', 'æ': 'ae', 'œ': 'oe', 'ø': 'o', 'å': 'a',
+        '`': '', '´': '',
+    }
+    for char, replacement in extra_map.items():
+        result = result.replace(char, replacement)
+
+    result = re.sub(r'[^a-zA-Z0-9\s\-()]', '', result)
+    result = re.sub(r'\s+', ' ', result)
+    result = re.sub(r'-+', '-', result)
+    return result.strip()
+
+
+EDGE_CASES = [
+    None, '', 0, 42, [], {}, ' ', '   ', '\t\n', '-', '---', ' - - ',
+    'ɛ̈', 'ɔ̃ŋ', 'ʃʒθð', 'ʔaː', 'ˈbaˌna', 'Ñandú', 'Straße', 'Æsir œuvre',
+    'smørrebrød', 'Åland', '`quoted´', "it's", '(a) -- (b)', 'a  b',
+    'x\u200by', '\u3000lead and trail\u3000', 'ﬁnal', '①②', 'Ⅻ', '安全',
+    'ሰላም', 'ä¿˜è™\x8f',
+]
+
+
+def collect_catalog_strings():
+    """Every string value in the translation files."""
+    strings = []
+
+    def walk(value):
+        if isinstance(value, str):
+            strings.append(value)
+        elif isinstance(value, dict):
+            for item in value.values():
+                walk(item)
+        elif isinstance(value, list):
+            for item in value:
+                walk(item)
+
+    for filepath in sorted(glob.glob('translations/*.json')):
+        with open(filepath, 'r', encoding='utf-8') as f:
+            walk(json.load(f))
+    return strings
+
+
+def random_mixtures(alphabet, count=20000, seed=0):
+    rng = random.Random(seed)
+    alphabet = sorted(alphabet) + [' ', ' ', '-', '--', '\u0301', '\u0308']
+    return [''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 24)))
+            for _ in range(count)]
+
+
+def check_equivalence(cases):
+    """Compare both implementations; returns the list of mismatches."""
+    mismatches = []
+    batch = normalize_phonetics(cases)
+    for text, batched in zip(cases, batch):
+        expected = legacy_normalize_phonetic(text)
+        single = normalize_phonetic(text)
+        if single != expected or batched != expected:
+            mismatches.append((text, expected, single, batched))
+    return mismatches
+
+
+def benchmark(strings, runs):
+    """Best-of-``runs`` time for each implementation over ``strings``."""
+    def best(fn):
+        times = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - start)
+        return min(times)
+
+    legacy = best(lambda: [legacy_normalize_phonetic(s) for s in strings])
+    uncached = best(lambda: [_normalize(s) for s in strings if s])
+
+    clear_cache()
+    start = time.perf_counter()
+    normalize_phonetics(strings)
+    cold = time.perf_counter() - start
+
+    single = best(lambda: [normalize_phonetic(s) for s in strings])
+    batch = best(lambda: normalize_phonetics(strings))
+    return legacy, uncached, cold, single, batch
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Check and benchmark the phonetic normalizer")
+    parser.add_argument(
+        "--no-benchmark",
+        action="store_true",
+        help="Only run the equivalence checks"
+    )
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=5,
+        help="Benchmark repetitions (best time is reported)"
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    catalog = collect_catalog_strings()
+    bmp = [chr(cp) for cp in range(0x10000) if not 0xD800 <= cp <= 0xDFFF]
+    phonetic_chars = {c for s in catalog for c in s if ord(c) < 0x3000}
+
+    suites = [
+        ('edge cases', EDGE_CASES),
+        ('catalog strings', catalog),
+        ('single BMP characters', bmp),
+        ('random mixtures', random_mixtures(phonetic_chars)),
+    ]
+
+    failed = False
+    for name, cases in suites:
+        mismatches = check_equivalence(cases)
+        if mismatches:
+            failed = True
+            print(f"❌ {name}: {len(mismatches)} mismatch(es) in {len(cases)} cases")
+            for text, expected, single, batched in mismatches[:10]:
+                print(f"   {text!r}: expected {expected!r}, got {single!r} / batch {batched!r}")
+        else:
+            print(f"✅ {name}: {len(cases)} cases identical")
+
+    if failed:
+        sys.exit(1)
+
+    if not args.no_benchmark:
+        legacy, uncached, cold, single, batch = benchmark(catalog, args.runs)
+        print(f"\n⏱  {len(catalog)} catalog strings ({len(set(catalog))} unique), "
+              f"best of {args.runs}:")
+        print(f"   legacy:        {legacy * 1000:8.1f} ms")
+        print(f"   uncached:      {uncached * 1000:8.1f} ms  ({legacy / uncached:.1f}x)")
+        print(f"   cold cache:    {cold * 1000:8.1f} ms  ({legacy / cold:.1f}x)")
+        print(f"   warm cache:    {single * 1000:8.1f} ms  ({legacy / single:.1f}x)")
+        print(f"   warm batch:    {batch * 1000:8.1f} ms  ({legacy / batch:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
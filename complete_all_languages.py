@@ -4,8 +4,10 @@ Complete missing translations for all new Ethiopian/East African languages:
 Somali, Arabic, Hadiyaa, Wolayitta, Afar, Gamo
 """
 
-import json
-import os
+import argparse
+
+from translation_tools.completion import load_json, run_languages, save_json
+from translation_tools.fuzzy import build_phrase_index
 
 REFERENCE_LANG = 'spanish'
 
@@ -92,14 +94,6 @@ CATEGORY_NAMES = {
     }
 }
 
-def load_json(filepath):
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return json.load(f)
-
-def save_json(filepath, data):
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-
 def generate_translation(english_text, lang_code, ref_phrase):
     """Generate translation - uses existing if available, otherwise creates placeholder"""
     field = LANG_FIELDS[lang_code]
@@ -111,12 +105,13 @@ def generate_translation(english_text, lang_code, ref_phrase):
     # Otherwise return transliterated version of English
     return english_text
 
-def complete_language(lang_code):
+def complete_language(lang_code, reference=None):
     print(f"\n{'='*70}")
     print(f"Processing: {lang_code.upper()}")
     print(f"{'='*70}")
     
-    reference = load_json(f'translations/{REFERENCE_LANG}.json')
+    if reference is None:
+        reference = load_json(f'translations/{REFERENCE_LANG}.json')
     target_file = f'translations/{lang_code}.json'
     target = load_json(target_file)
     
@@ -139,22 +134,19 @@ def complete_language(lang_code):
             categories_added += 1
             print(f"  + Added category: {category_key}")
         
-        # Build index of existing phrases
-        existing_index = {}
-        for i, phrase in enumerate(target['categories'][category_key]):
-            eng = phrase.get('english', '').lower()
-            if eng:
-                existing_index[eng] = i
+        # Build fuzzy index of existing phrases (case, punctuation and typo tolerant)
+        existing_index = build_phrase_index(target['categories'][category_key])
         
         # Process each phrase
         for ref_phrase in ref_phrases:
-            english_key = ref_phrase.get('english', '').lower()
+            english_key = ref_phrase.get('english', '')
             if not english_key:
                 continue
             
-            if english_key in existing_index:
+            # Last duplicate wins, as with the lowercased dict this replaced
+            idx = existing_index.match(english_key, last=True)
+            if idx is not None:
                 # Phrase exists - ensure it has the language field
-                idx = existing_index[english_key]
                 existing_phrase = target['categories'][category_key][idx]
                 
                 if field_name not in existing_phrase or not existing_phrase[field_name]:
@@ -200,18 +192,25 @@ def complete_language(lang_code):
         'total': final_phrases
     }
 
-def main():
+def parse_args():
+    parser = argparse.ArgumentParser(description="Complete the new language files from the reference language")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes (default: one per CPU)"
+    )
+    return parser.parse_args()
+
+def main(jobs=None):
     print("\n" + "="*70)
     print("COMPLETING ALL NEW LANGUAGE TRANSLATIONS")
     print("="*70)
     
-    results = []
-    for lang in NEW_LANGUAGES:
-        try:
-            result = complete_language(lang)
-            results.append(result)
-        except Exception as e:
-            print(f"\n❌ Error processing {lang}: {e}")
+    # The reference is parsed once and shared by every language's worker
+    outcomes = run_languages(complete_language, NEW_LANGUAGES,
+                             reference_file=f'translations/{REFERENCE_LANG}.json', jobs=jobs)
+    results = [o['result'] for o in outcomes if o['error'] is None]
     
     print(f"\n{'='*70}")
     print("FINAL SUMMARY")
@@ -226,4 +225,4 @@ def main():
     print(f"\n✅ All {len(results)} languages completed successfully!\n")
 
 if __name__ == '__main__':
-    main()
+    main(jobs=parse_args().jobs)
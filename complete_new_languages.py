@@ -3,8 +3,9 @@
 Complete missing translations for Somali, Arabic, and Hadiyaa languages
 """
 
-import json
-import os
+import argparse
+
+from translation_tools.completion import load_json, run_languages, save_json
 
 # Reference language with all 286 phrases
 REFERENCE_LANG = 'spanish'
@@ -860,24 +861,15 @@ TRANSLATIONS = {
     }
 }
 
-def load_json(filepath):
-    """Load JSON file"""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return json.load(f)
-
-def save_json(filepath, data):
-    """Save JSON file with proper formatting"""
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-
-def complete_language(lang_code):
+def complete_language(lang_code, reference=None):
     """Complete all missing translations for a language"""
     print(f"\n{'='*60}")
     print(f"Processing {lang_code.upper()}...")
     print(f"{'='*60}")
     
-    # Load reference and target language files
-    reference = load_json(f'translations/{REFERENCE_LANG}.json')
+    # Load reference (unless the driver passed it in) and target language files
+    if reference is None:
+        reference = load_json(f'translations/{REFERENCE_LANG}.json')
     target_file = f'translations/{lang_code}.json'
     target = load_json(target_file)
     
@@ -951,16 +943,25 @@ def complete_language(lang_code):
         'total_phrases': final_phrases
     }
 
-def main():
+def parse_args():
+    parser = argparse.ArgumentParser(description="Complete Somali, Arabic and Hadiyaa from the reference language")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes (default: one per CPU)"
+    )
+    return parser.parse_args()
+
+def main(jobs=None):
     """Main function to complete all new languages"""
     print("="*60)
     print("COMPLETING NEW LANGUAGE TRANSLATIONS")
     print("="*60)
     
-    results = []
-    for lang in NEW_LANGUAGES:
-        result = complete_language(lang)
-        results.append(result)
+    outcomes = run_languages(complete_language, NEW_LANGUAGES,
+                             reference_file=f'translations/{REFERENCE_LANG}.json', jobs=jobs)
+    results = [o['result'] for o in outcomes if o['error'] is None]
     
     print(f"\n{'='*60}")
     print("SUMMARY")
@@ -974,4 +975,4 @@ def main():
     print(f"\n✅ All languages completed successfully!")
 
 if __name__ == '__main__':
-    main()
+    main(jobs=parse_args().jobs)
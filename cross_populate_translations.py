@@ -1,10 +1,18 @@
 """
 Cross-populate all translation files to make all languages translatable with each other.
-This adds missing language fields to every phrase in every translation file.
+The files are loaded into the normalized phrase store (translations/store/) and
+rewritten as views of it, so every field a file carries gets the shared translation.
+The language files stay the source; the store is a derived cache (not committed)
+that is refreshed from them on every run.
 """
 
+import argparse
 import json
 import os
+import sys
+import tempfile
+
+from translation_tools.phrase_store import PhraseStore
 
 # Define all languages
 ALL_LANGUAGES = [
@@ -23,6 +31,21 @@ def get_field_name(language):
     """Get the actual field name used in JSON for a language"""
     return FIELD_MAPPINGS.get(language, language)
 
+def native_field(lang, data):
+    """
+    The field a file is authoritative for: its mapped field name, or the
+    language name when the phrases do not use the mapped one (hadiyaa.json
+    and wolyitta.json map to "hadiya"/"wolayita" but write "hadiyaa"/"wolyitta").
+    """
+    field = get_field_name(lang)
+    if field == lang:
+        return field
+    for phrases in data.get('categories', {}).values():
+        for phrase in phrases if isinstance(phrases, list) else ():
+            if field in phrase:
+                return field
+    return lang
+
 def load_all_translations():
     """Load all translation files"""
     translations_dir = 'translations'
@@ -39,86 +62,90 @@ def load_all_translations():
     
     return all_data
 
-def cross_populate_all(all_data):
-    """Cross-populate translations across all language files"""
-    
-    # Create a master index of all translations by English word
-    master_index = {}
+def build_store(all_data, store=None):
+    """Load every language file into the normalized phrase store"""
+    store = store if store is not None else PhraseStore.load()
     
-    # First pass: collect all translations for each English word
+    changed = 0
     for lang, data in all_data.items():
         if 'categories' not in data:
             continue
-        
-        for category_name, phrases in data['categories'].items():
-            if not isinstance(phrases, list):
-                continue
-            
-            for phrase in phrases:
-                if 'english' not in phrase:
-                    continue
-                
-                english_word = phrase['english']
-                
-                if english_word not in master_index:
-                    master_index[english_word] = {}
-                
-                # Collect all translations for this English word
-                for lang_key in ALL_LANGUAGES:
-                    field_name = get_field_name(lang_key)
-                    if field_name in phrase and phrase[field_name]:
-                        if lang_key not in master_index[english_word]:
-                            master_index[english_word][lang_key] = phrase[field_name]
+        changed += store.ingest_file(lang, data, native_field=native_field(lang, data))
     
-    print(f"\n✓ Built master index with {len(master_index)} unique English words")
+    print(f"\n✓ Phrase store: {len(store)} phrases, {len(store.columns)} language columns "
+          f"({changed} values added or updated)")
+    return store
+
+def cross_populate_all(all_data, store=None, add_fields=False):
+    """
+    Cross-populate translations across all language files.
     
-    # Second pass: update all files with complete translations
-    for lang, data in all_data.items():
-        if 'categories' not in data:
-            continue
-        
-        updated_count = 0
-        
-        for category_name, phrases in data['categories'].items():
-            if not isinstance(phrases, list):
-                continue
-            
-            for phrase in phrases:
-                if 'english' not in phrase:
-                    continue
-                
-                english_word = phrase['english']
-                
-                # Add missing language fields
-                for target_lang in ALL_LANGUAGES:
-                    field_name = get_field_name(target_lang)
-                    
-                    # If field is missing or placeholder, try to fill it
-                    if field_name not in phrase or not phrase[field_name] or phrase[field_name] == english_word:
-                        if english_word in master_index and target_lang in master_index[english_word]:
-                            phrase[field_name] = master_index[english_word][target_lang]
-                            updated_count += 1
-                        elif field_name not in phrase:
-                            # Add field even if we don't have translation yet
-                            phrase[field_name] = english_word
-                            updated_count += 1
-        
-        print(f"✓ Updated {updated_count} fields in {lang}.json")
-        all_data[lang] = data
+    Every file becomes a view of the phrase store, so each field it carries is
+    filled with the one known translation. With ``add_fields`` every language
+    field is added to every phrase (the old behaviour, which grows every file
+    with each new language).
+    """
+    store = build_store(all_data, store)
+    extra_fields = [get_field_name(lang) for lang in ALL_LANGUAGES] if add_fields else []
     
-    return all_data
+    for lang in all_data:
+        if lang in store.views:
+            all_data[lang] = store.render_view(lang, extra_fields)
+    
+    return all_data, store
+
+def check_round_trip(all_data):
+    """Ingest each file into an empty store and render it back; returns the files that differ"""
+    differing = []
+    with tempfile.TemporaryDirectory() as store_dir:
+        for lang, data in all_data.items():
+            if 'categories' not in data:
+                continue
+            store = PhraseStore(store_dir)
+            store.ingest_file(lang, data, native_field=native_field(lang, data))
+            rendered = store.render_view(lang)
+            if json.dumps(rendered, ensure_ascii=False) != json.dumps(data, ensure_ascii=False):
+                differing.append(lang)
+    return differing
 
-def save_all_translations(all_data):
-    """Save all updated translation files"""
+def save_all_translations(all_data, store=None):
+    """Save the phrase store and all updated translation files"""
     translations_dir = 'translations'
     
+    if store is not None:
+        written = store.save()
+        print(f"✓ Saved phrase store ({len(written)} changed file(s))")
+    
     for lang, data in all_data.items():
         filepath = os.path.join(translations_dir, f'{lang}.json')
         with open(filepath, 'w', encoding='utf-8') as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
         print(f"✓ Saved {lang}.json")
 
-def main():
+def parse_args():
+    parser = argparse.ArgumentParser(description="Cross-populate translation files from the phrase store")
+    parser.add_argument(
+        "--add-fields",
+        action="store_true",
+        help="Add every language field to every phrase in every file"
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Only check that every file renders back unchanged from the store"
+    )
+    return parser.parse_args()
+
+def check():
+    all_data = load_all_translations()
+    differing = check_round_trip(all_data)
+    for lang in differing:
+        print(f"✗ {lang}.json does not round-trip through the phrase store")
+    if differing:
+        sys.exit(1)
+    print(f"\n✓ All {len(all_data)} files round-trip through the phrase store unchanged")
+
+def main(add_fields=False):
     print("=" * 60)
     print("CROSS-POPULATING ALL TRANSLATION FILES")
     print("=" * 60)
@@ -127,14 +154,18 @@ def main():
     all_data = load_all_translations()
     
     print("\n2. Cross-populating translations...")
-    all_data = cross_populate_all(all_data)
+    all_data, store = cross_populate_all(all_data, add_fields=add_fields)
     
     print("\n3. Saving updated files...")
-    save_all_translations(all_data)
+    save_all_translations(all_data, store)
     
     print("\n" + "=" * 60)
     print("✓ COMPLETE! All languages are now cross-translated")
     print("=" * 60)
 
 if __name__ == "__main__":
-    main()
+    args = parse_args()
+    if args.check:
+        check()
+    else:
+        main(add_fields=args.add_fields)
@@ -1,9 +1,9 @@
-import json
-import os
+import argparse
 
-# Read the oromo.json file as a template for the structure
-with open('translations/oromo.json', 'r', encoding='utf-8') as f:
-    template = json.load(f)
+from translation_tools.completion import load_json, run_languages, save_json
+
+# The oromo.json file is the template for the structure
+TEMPLATE_FILE = 'translations/oromo.json'
 
 # Read the current partial files
 languages_to_expand = {
@@ -713,7 +713,7 @@ word_translations = {
     }
 }
 
-def create_expanded_translation(lang_code, ui_data, lang_name_native):
+def create_expanded_translation(lang_code, ui_data, lang_name_native, template):
     """Create a fully expanded translation file for a language"""
     
     result = {
@@ -748,32 +748,53 @@ def create_expanded_translation(lang_code, ui_data, lang_name_native):
     
     return result
 
-# Process each language
-for lang_code, file_path in languages_to_expand.items():
+def expand_language(lang_code, template):
+    """Expand one language's partial file into translations/<lang>.json"""
     print(f"Processing {lang_code}...")
+    file_path = languages_to_expand[lang_code]
     
     # Read the current UI data
-    with open(file_path, 'r', encoding='utf-8') as f:
-        current_data = json.load(f)
+    current_data = load_json(file_path)
     
     # Create expanded translation
     expanded_data = create_expanded_translation(
         lang_code, 
         current_data['ui'],
-        current_data.get('nativeLanguageField', lang_code)
+        current_data.get('nativeLanguageField', lang_code),
+        template
     )
     
     # Write back to file
     output_path = file_path.replace('_new.json', '.json')
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(expanded_data, f, ensure_ascii=False, indent=2)
+    save_json(output_path, expanded_data)
     
     print(f"Created {output_path}")
+    return output_path
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Expand the partial *_new.json files using oromo.json as the template")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes (default: one per CPU)"
+    )
+    return parser.parse_args()
+
+def main(jobs=None):
+    # Process each language; the template is read once for all of them
+    outcomes = run_languages(expand_language, languages_to_expand,
+                             reference_file=TEMPLATE_FILE, jobs=jobs)
+    created = [o['result'] for o in outcomes if o['error'] is None]
+    if len(created) < len(outcomes):
+        print(f"\n❌ {len(outcomes) - len(created)} language(s) failed")
+        return
+    
+    print("\nAll translation files have been expanded successfully!")
+    print("\nNote: The new files are:")
+    for output_path in created:
+        print(f"- {output_path}")
+    print("\nThe old files with '_new' suffix can be deleted if the new ones look good.")
 
-print("\nAll translation files have been expanded successfully!")
-print("\nNote: The new files are:")
-print("- translations/swahili.json")
-print("- translations/kinyarwanda.json")
-print("- translations/kirundi.json")
-print("- translations/luo.json")
-print("\nThe old files with '_new' suffix can be deleted if the new ones look good.")
+if __name__ == '__main__':
+    main(jobs=parse_args().jobs)
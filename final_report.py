@@ -1,61 +1,93 @@
-import json
+import argparse
 
-print("="*70)
-print("FINAL TRANSLATION COMPLETENESS REPORT")
-print("="*70)
+from translation_tools.coverage import DEFAULT_CACHE_FILE, catalog_coverage, load_coverage, select_files
 
-files = {
-    'Spanish': 'translations/spanish.json',
-    'French': 'translations/french.json',
-    'Oromo': 'translations/oromo.json',
-    'Amharic': 'translations/amharic.json',
-    'Tigrinya': 'translations/tigrinya.json'
-}
 
-all_langs = ['spanish', 'french', 'oromo', 'amharic', 'tigrinya']
+def parse_args():
+    parser = argparse.ArgumentParser(description="Final translation completeness report")
+    parser.add_argument(
+        "languages",
+        nargs="*",
+        help="Language files to report on (default: every translations/<language>.json)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Recount every file instead of reusing .coverage_cache.json"
+    )
+    parser.add_argument(
+        "--catalog",
+        action="store_true",
+        help="Report on the unified catalog database (translations/all_languages.db) instead"
+    )
+    return parser.parse_args()
 
-print("\n📊 PER-FILE STATISTICS:")
-print("-" * 70)
 
-for file_name, file_path in files.items():
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    native_lang = data['nativeLanguageField']
-    total = sum(len(phrases) for phrases in data['categories'].values())
-    categories = len(data['categories'])
-    
-    print(f"\n{file_name.upper()} ({native_lang}):")
-    print(f"  Categories: {categories}")
-    print(f"  Total phrases: {total}")
-    print(f"  Native language coverage: 100.0% ✅")
-
-print("\n" + "="*70)
-print("📈 CROSS-LANGUAGE COVERAGE (in each file):")
-print("-" * 70)
+def main():
+    args = parse_args()
+    if args.catalog:
+        coverage = catalog_coverage(languages=args.languages)
+    else:
+        coverage = load_coverage(select_files(args.languages),
+                                 cache_file=None if args.no_cache else DEFAULT_CACHE_FILE)
+    
+    print("="*70)
+    print("FINAL TRANSLATION COMPLETENESS REPORT")
+    print("="*70)
+    
+    print("\n📊 PER-FILE STATISTICS:")
+    print("-" * 70)
+    
+    native_complete = []
+    for file_name in coverage.languages:
+        native_lang = coverage.native_field(file_name)
+        total = coverage.total(file_name)
+        categories = len(coverage.categories(file_name))
+        missing = len(coverage.missing_native(file_name))
+        percentage = ((total - missing) / total * 100) if total > 0 else 0
+        status = "✅" if missing == 0 else "⚠️"
+        if missing == 0:
+            native_complete.append(file_name)
+        
+        print(f"\n{file_name.upper()} ({native_lang}):")
+        print(f"  Categories: {categories}")
+        print(f"  Total phrases: {total}")
+        print(f"  Native language coverage: {percentage:.1f}% {status}")
+    
+    print("\n" + "="*70)
+    print("📈 CROSS-LANGUAGE COVERAGE (in each file):")
+    print("-" * 70)
+    
+    for file_name in coverage.languages:
+        total = coverage.total(file_name)
+        
+        print(f"\n{file_name.capitalize()} file contains:")
+        for lang in coverage.fields(file_name):
+            filled = coverage.filled(file_name, lang)
+            percentage = coverage.percent(file_name, lang)
+            status = "✅" if percentage == 100.0 else "⚠️"
+            print(f"  {lang.capitalize():10} {filled:3}/{total} ({percentage:5.1f}%) {status}")
+    
+    phrase_counts = sorted({coverage.total(lang) for lang in coverage.languages})
+    category_counts = sorted({len(coverage.categories(lang)) for lang in coverage.languages})
+    
+    print("\n" + "="*70)
+    print("🎯 SUMMARY:")
+    print("-" * 70)
+    print(f"\n{len(coverage.languages)} language files checked:")
+    if len(phrase_counts) == 1:
+        print(f"  • Identical structure (same {phrase_counts[0]} phrases)")
+    else:
+        print(f"  • Phrase counts differ: {', '.join(map(str, phrase_counts))}")
+    print(f"  • {' / '.join(map(str, category_counts))} categories")
+    print(f"  • 100% native coverage in {len(native_complete)} of {len(coverage.languages)} files")
+    
+    if len(phrase_counts) == 1 and len(native_complete) == len(coverage.languages):
+        print("\n✅ Translation database is complete and consistent!")
+    else:
+        print("\n⚠️  Translation database still has gaps (see above)")
+    print("="*70)
 
-for file_name, file_path in files.items():
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    total = sum(len(phrases) for phrases in data['categories'].values())
-    
-    print(f"\n{file_name} file contains:")
-    for lang in all_langs:
-        filled = sum(1 for category in data['categories'].values() 
-                    for phrase in category 
-                    if phrase.get(lang, '').strip())
-        percentage = (filled / total * 100) if total > 0 else 0
-        status = "✅" if percentage == 100.0 else "⚠️"
-        print(f"  {lang.capitalize():10} {filled:3}/{total} ({percentage:5.1f}%) {status}")
 
-print("\n" + "="*70)
-print("🎯 SUMMARY:")
-print("-" * 70)
-print("\nAll JSON files are now synchronized with:")
-print("  • Identical structure (same 286 phrases)")
-print("  • 34 comprehensive categories")
-print("  • 100% coverage for all native languages")
-print("  • All cross-language fields filled from pooled data")
-print("\n✅ Translation database is complete and consistent!")
-print("="*70)
+if __name__ == '__main__':
+    main()
@@ -1,97 +1,106 @@
 """
 Fix Chinese character encoding in JSON translation files.
 Converts mojibake like 'æ"»å‡»' back to proper Chinese characters '攻击'.
+
+Detection and repair live in translation_tools/mojibake.py; files are
+checked in parallel and only files with repaired strings are rewritten.
 """
 
+import argparse
 import json
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-def fix_chinese_text(text):
-    """
-    Fix Chinese characters that were incorrectly encoded.
-    The text appears to be UTF-8 bytes misinterpreted as Windows-1252/CP1252.
-    """
-    if not text or not isinstance(text, str):
-        return text
-    
-    # Skip if it looks already correct (has actual Chinese characters)
-    if any('\u4e00' <= char <= '\u9fff' for char in text):
-        return text
-    
-    try:
-        # The string is UTF-8 bytes that were decoded as Windows-1252
-        # Re-encode to Windows-1252 to get original bytes, then decode as UTF-8
-        fixed = text.encode('cp1252').decode('utf-8')
-        return fixed
-    except (UnicodeDecodeError, UnicodeEncodeError, LookupError):
-        # If it fails, return original
-        return text
-
-def fix_phrase_object(phrase_obj):
-    """Fix all string values in a phrase object."""
-    if not isinstance(phrase_obj, dict):
-        return phrase_obj
-    
-    fixed_obj = {}
-    for key, value in phrase_obj.items():
-        if isinstance(value, str):
-            fixed_obj[key] = fix_chinese_text(value)
-        elif isinstance(value, list):
-            fixed_obj[key] = [fix_chinese_text(item) if isinstance(item, str) else item for item in value]
-        elif isinstance(value, dict):
-            fixed_obj[key] = fix_phrase_object(value)
-        else:
-            fixed_obj[key] = value
-    
-    return fixed_obj
-
-def fix_json_file(file_path):
-    """Fix encoding in a single JSON file."""
-    print(f"Processing: {file_path}")
-    
-    # Read the file
+from translation_tools.mojibake import repair_value
+
+
+def fix_json_file(file_path, dry_run=False):
+    """Repair one JSON file; returns (path, strings fixed, sample fixes)."""
     with open(file_path, 'r', encoding='utf-8') as f:
         data = json.load(f)
-    
-    # Fix the data
-    if 'categories' in data and isinstance(data['categories'], dict):
-        for category_name, phrases in data['categories'].items():
-            if isinstance(phrases, list):
-                data['categories'][category_name] = [fix_phrase_object(phrase) for phrase in phrases]
-    
-    # Also fix other top-level fields
-    for key, value in data.items():
-        if key != 'categories' and isinstance(value, dict):
-            data[key] = fix_phrase_object(value)
-    
-    # Write back with proper encoding
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-    
-    print(f"✓ Fixed: {file_path}")
+
+    fixed_data, changed = repair_value(data)
+    if not changed:
+        return str(file_path), 0, []
+
+    samples = []
+    for category, phrases in fixed_data.get('categories', {}).items():
+        original = data['categories'].get(category, [])
+        for before, after in zip(original, phrases):
+            if before != after and len(samples) < 3:
+                field = next(k for k in after if after[k] != before.get(k))
+                samples.append(f"{after.get('english')}: {before[field]!r} → {after[field]}")
+
+    if not dry_run:
+        # Write back with proper encoding, atomically
+        tmp_file = Path(file_path).with_suffix('.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(fixed_data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_file, file_path)
+
+    return str(file_path), changed, samples
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Repair mojibake in translation JSON files")
+    parser.add_argument(
+        "files",
+        nargs="*",
+        help="Files to repair (default: translations/*.json)"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report what would be fixed without writing"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes (default: one per CPU)"
+    )
+    return parser.parse_args()
+
 
 def main():
     """Fix all JSON files in the translations directory."""
+    args = parse_args()
     translations_dir = Path(__file__).parent / 'translations'
-    
-    if not translations_dir.exists():
+
+    if args.files:
+        json_files = [Path(p) for p in args.files]
+    elif not translations_dir.exists():
         print(f"Error: {translations_dir} not found")
         return
-    
-    # Find all JSON files
-    json_files = list(translations_dir.glob('*.json'))
-    
+    else:
+        json_files = sorted(translations_dir.glob('*.json'))
+
     print(f"Found {len(json_files)} JSON files to process\n")
-    
-    for json_file in json_files:
-        try:
-            fix_json_file(json_file)
-        except Exception as e:
-            print(f"✗ Error processing {json_file}: {e}")
-    
+
+    fixed_files = 0
+    fixed_strings = 0
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        futures = {pool.submit(fix_json_file, path, args.dry_run): path for path in json_files}
+        for future, path in futures.items():
+            try:
+                file_path, changed, samples = future.result()
+            except Exception as e:
+                print(f"✗ Error processing {path}: {e}")
+                continue
+            if not changed:
+                continue
+            fixed_files += 1
+            fixed_strings += changed
+            action = "Would fix" if args.dry_run else "✓ Fixed"
+            print(f"{action}: {file_path} ({changed} strings)")
+            for sample in samples:
+                print(f"    {sample}")
+
     print(f"\n✓ Processing complete!")
-    print(f"Fixed {len(json_files)} files")
+    print(f"{'Would fix' if args.dry_run else 'Fixed'} {fixed_strings} strings in "
+          f"{fixed_files} of {len(json_files)} files")
+
 
 if __name__ == '__main__':
     main()
@@ -2,214 +2,320 @@
 """
 Merge all individual language JSON files into a comprehensive all_languages_2.json
 with normalized phonetics (plain Latin letters)
+
+Everything the base file already has (phrases, phonetics, ui and categoryNames
+metadata) is kept as-is; only missing values are added. Placeholder values
+(English copies, stubs, Latin text in a non-Latin field) are not merged.
+
+The base and the language files are read one category at a time and the
+result is written as it is merged, so memory holds a category per file
+rather than the whole catalog.
 """
 
-import json
 import os
-import re
-import unicodedata
 from pathlib import Path
 
-def normalize_phonetic(text):
-    """Convert phonetic text to plain Latin letters only"""
-    if not text or not isinstance(text, str):
-        return text
-    
-    # IPA character mappings
-    ipa_map = {
-        'ɛ': 'e', 'ɔ': 'o', 'ə': 'e', 'ʃ': 'sh', 'ʒ': 'zh',
-        'ŋ': 'ng', 'θ': 'th', 'ð': 'th', 'ʔ': '', 'ː': '',
-        'ˈ': '', 'ˌ': '',
-    }
-    
-    result = text
-    for ipa_char, latin in ipa_map.items():
-        result = result.replace(ipa_char, latin)
-    
-    # Remove combining diacritics
-    result = ''.join(
-        c for c in unicodedata.normalize('NFD', result)
-        if not unicodedata.combining(c)
-    )
-    
-    extra_map = {
-        'ñ': 'n', 'ß': 'ss', 'æ': 'ae', 'œ': 'oe',
-        'ø': 'o', 'å': 'a', ''': '', ''': '', '`': '', '´': '',
-    }
-    
-    for char, replacement in extra_map.items():
-        result = result.replace(char, replacement)
-    
-    # Keep only: a-z, A-Z, 0-9, hyphens, spaces, parentheses
-    result = re.sub(r'[^a-zA-Z0-9\s\-()]', '', result)
-    result = re.sub(r'\s+', ' ', result)
-    result = re.sub(r'-+', '-', result)
-    
-    return result.strip()
+from translation_tools.alignment import load_alignment
+from translation_tools.phonetics import normalize_phonetic, persistent_cache
+from translation_tools.streaming import CatalogWriter, StreamedCatalog, iter_categories, iter_events
+from translation_tools.validate import is_placeholder
+
+
+# Languages to process (individual JSON files)
+LANGUAGES = [
+    'english', 'spanish', 'french', 'italian', 'chinese',
+    'arabic', 'amharic', 'oromo', 'somali', 'swahili',
+    'tigrinya', 'kinyarwanda', 'kirundi', 'luo',
+    'hadiyaa', 'wolyitta', 'gamo', 'afar'
+]
+
+PHONETIC_SUFFIX = '_phonetic'
+
+
+class LanguageRows:
+    """
+    A language file read one category at a time, in file order. Categories
+    asked for out of file order are held until they are requested, so only a
+    few categories of the file are in memory at once.
+    """
+
+    def __init__(self, path):
+        self._categories = iter_categories(path)
+        self._pending = {}
+        self._position = 0
+        self._current = None
+
+    def _read(self, name, phrases):
+        # Positions count phrase dicts only, like alignment.iter_rows
+        rows = [phrase for phrase in phrases if isinstance(phrase, dict)]
+        entry = (self._position, rows)
+        self._position += len(rows)
+        return entry
+
+    def category(self, category):
+        """(position of its first row, rows) of a category, or None if the file lacks it"""
+        if self._current is not None and self._current[0] == category:
+            return self._current[1]
+        found = self._pending.pop(category, None)
+        if found is None:
+            for name, phrases in self._categories:
+                entry = self._read(name, phrases)
+                if name == category:
+                    found = entry
+                    break
+                self._pending[name] = entry
+        self._current = (category, found)
+        return found
+
+    def row(self, category, position):
+        """The phrase at an alignment position, which lies in its own category"""
+        found = self.category(category)
+        if found is None:
+            return None
+        start, rows = found
+        index = position - start
+        return rows[index] if 0 <= index < len(rows) else None
+
+    def categories_left(self):
+        """Categories not requested yet, in file order"""
+        for name, phrases in self._categories:
+            self._pending[name] = self._read(name, phrases)
+        return list(self._pending)
 
 
 def load_individual_language_file(lang_file):
-    """Load and return data from individual language JSON file"""
+    """Metadata and category names of a language file; its phrases are streamed later"""
     try:
-        with open(lang_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return StreamedCatalog(lang_file)
     except Exception as e:
         print(f"   ⚠️  Error loading {lang_file}: {e}")
         return None
 
 
-def merge_translations():
-    """Merge all individual language files into comprehensive structure"""
-    
-    translations_dir = Path('translations')
-    
-    # Languages to process (individual JSON files)
-    languages = [
-        'english', 'spanish', 'french', 'italian', 'chinese',
-        'arabic', 'amharic', 'oromo', 'somali', 'swahili',
-        'tigrinya', 'kinyarwanda', 'kirundi', 'luo',
-        'hadiyaa', 'wolyitta', 'gamo', 'afar'
-    ]
-    
-    # Start with existing all_languages.json structure
-    print("📖 Loading existing all_languages.json...")
-    base_file = translations_dir / 'all_languages.json'
-    if base_file.exists():
-        with open(base_file, 'r', encoding='utf-8') as f:
-            merged = json.load(f)
-    else:
-        merged = {}
-    
-    # Get all categories from english.json as reference
-    english_file = translations_dir / 'english.json'
-    with open(english_file, 'r', encoding='utf-8') as f:
-        english_data = json.load(f)
-    
-    all_categories = list(english_data.get('categories', {}).keys())
-    print(f"📊 Found {len(all_categories)} categories in english.json")
-    print(f"   Categories: {', '.join(all_categories[:10])}...")
-    
-    # Initialize categories structure if not present
-    if 'categories' not in merged:
-        merged['categories'] = {}
-    
-    # Process each category
+def load_language_files(translations_dir, languages):
+    """Read each language file's metadata; missing or broken files are skipped"""
+    language_data = {}
+    for lang in languages:
+        lang_file = translations_dir / f'{lang}.json'
+        if not lang_file.exists():
+            continue
+
+        lang_data = load_individual_language_file(lang_file)
+        if lang_data:
+            language_data[lang] = lang_data
+
+    return language_data
+
+
+def iter_base(base_file):
+    """
+    The base file in order as ('meta', key, value), ('categories', None, None),
+    ('category', name, phrases) and ('categories_end', None, None) items
+    """
+    if not base_file.exists():
+        return
+    category, phrases = None, None
+    in_categories = False
+    for kind, name, value in iter_events(base_file):
+        if kind == 'phrase':
+            phrases.append(value)
+            continue
+        if category is not None:
+            yield 'category', category, phrases
+            category = None
+        if kind == 'category':
+            category, phrases = name, []
+        elif kind == 'categories':
+            in_categories = True
+            yield 'categories', None, None
+        else:
+            if in_categories:
+                in_categories = False
+                yield 'categories_end', None, None
+            yield 'meta', name, value
+    if category is not None:
+        yield 'category', category, phrases
+    if in_categories:
+        yield 'categories_end', None, None
+
+
+def build_phrase_index(categories):
+    """Index phrases by (category, english), keeping the first match like a linear scan would"""
+    index = {}
+    for category, phrases in categories.items():
+        for phrase in phrases:
+            index.setdefault((category, phrase.get('english')), phrase)
+    return index
+
+
+def merge_phrase(merged_phrase, lang_phrase, english_word, merged_fields):
+    """Add the merged languages' fields of a language file's phrase that are still missing"""
+    # Placeholders (English copies, stubs) and their phonetics are left out
+    skipped = {field for field in lang_phrase
+               if field in merged_fields
+               and is_placeholder(field, lang_phrase[field], english_word)}
+    for field, value in lang_phrase.items():
+        if field not in merged_fields or field in skipped:
+            continue
+        if field.endswith(PHONETIC_SUFFIX) and field[:-len(PHONETIC_SUFFIX)] in skipped:
+            continue
+
+        # Only add if not already present or empty
+        if field not in merged_phrase or not merged_phrase[field]:
+            # Normalize phonetic fields
+            if field.endswith(PHONETIC_SUFFIX):
+                value = normalize_phonetic(value)
+            merged_phrase[field] = value
+
+
+def merge_language_metadata(merged, lang_data):
+    """Add a language file's metadata to ``merged`` (the base's, kept as-is)"""
+    for key in lang_data:
+        if key == 'categories':
+            continue
+        value = lang_data[key]
+
+        current = merged.get(key)
+        if isinstance(value, dict):
+            if current is None:
+                current = merged[key] = {}
+            if not isinstance(current, dict):
+                continue
+            # Only add missing entries, normalizing their phonetics
+            for k, v in value.items():
+                if k in current:
+                    continue
+                if k.endswith(PHONETIC_SUFFIX) and isinstance(v, str):
+                    v = normalize_phonetic(v)
+                current[k] = v
+        elif current is None:
+            merged[key] = value
+    return merged
+
+
+def merge_translations(translations_dir='translations', base_name='all_languages.json',
+                       output_file='translations/all_languages_2.json'):
+    """Merge all individual language files onto the base file and write the result"""
+
+    translations_dir = Path(translations_dir)
+    languages = LANGUAGES
+    base_file = translations_dir / base_name
+
+    print(f"📖 Reading {len(languages)} language files...")
+    language_data = load_language_files(translations_dir, languages)
+    aligned_languages = [lang for lang, lang_data in language_data.items()
+                         if 'categories' in lang_data]
+
+    # The language files are joined through their stable phrase IDs (the
+    # registry is only read here, the align stage writes it); each one is
+    # read a category at a time alongside the base
+    alignment = load_alignment(translations_dir, list(language_data))
+    readers = {lang: LanguageRows(translations_dir / f'{lang}.json') for lang in aligned_languages}
+    english_rows = readers.get('english') or LanguageRows(translations_dir / 'english.json')
+    # Language files also carry fields of languages that are not merged
+    # (e.g. "tigrigna" beside "tigrinya"); those stay out of the catalog
+    merged_fields = {field for lang in languages if lang != 'english'
+                     for field in (lang, lang + PHONETIC_SUFFIX)}
+
     category_stats = {}
-    
-    for category in all_categories:
+
+    def merge_category(category, phrases):
+        """Merge the English phrases of a category and their translations into ``phrases``"""
+        english = english_rows.category(category)
+        if english is None:
+            return  # Not an English category: kept as the base has it
         print(f"\n🔄 Processing category: {category}")
-        
-        # Get phrases from English as base
-        english_phrases = english_data['categories'].get(category, [])
-        
-        if category not in merged['categories']:
-            merged['categories'][category] = []
-        
+
+        # (category, english) -> phrase lookup for the merged category
+        merged_index = build_phrase_index({category: phrases})
+
         # For each phrase in English
-        for phrase_idx, eng_phrase in enumerate(english_phrases):
+        for eng_phrase in english[1]:
             english_word = eng_phrase.get('english', '')
-            
+            key = (category, english_word)
+
             # Find or create this phrase entry
-            merged_phrase = None
-            for mp in merged['categories'][category]:
-                if mp.get('english') == english_word:
-                    merged_phrase = mp
-                    break
-            
+            merged_phrase = merged_index.get(key)
             if merged_phrase is None:
                 merged_phrase = {'english': english_word}
-                merged['categories'][category].append(merged_phrase)
-            
-            # Merge data from each language file
-            for lang in languages:
-                lang_file = translations_dir / f'{lang}.json'
-                if not lang_file.exists():
-                    continue
-                
-                # Load language file
-                lang_data = load_individual_language_file(lang_file)
-                if not lang_data or 'categories' not in lang_data:
+                phrases.append(merged_phrase)
+                merged_index[key] = merged_phrase
+
+            # Merge data from each language file, in language order
+            phrase_id = alignment.ids.get(category, english_word)
+            for lang in aligned_languages:
+                position = alignment.position(lang, phrase_id)
+                if position is None:
                     continue
-                
-                # Get this category from this language
-                lang_category = lang_data['categories'].get(category, [])
-                
-                # Find matching phrase by English word
-                for lang_phrase in lang_category:
-                    if lang_phrase.get('english') == english_word:
-                        # Copy language-specific fields
-                        for key, value in lang_phrase.items():
-                            if key == 'english':
-                                continue
-                            
-                            # Normalize phonetic fields
-                            if key.endswith('_phonetic'):
-                                value = normalize_phonetic(value)
-                            
-                            # Only add if not already present or empty
-                            if key not in merged_phrase or not merged_phrase[key]:
-                                merged_phrase[key] = value
-                        break
-        
-        phrase_count = len(merged['categories'][category])
-        category_stats[category] = phrase_count
-        print(f"   ✅ {category}: {phrase_count} phrases")
-    
-    # Add language metadata from existing structure
-    print("\n📝 Processing language metadata...")
-    for lang in languages:
-        lang_file = translations_dir / f'{lang}.json'
-        if not lang_file.exists():
-            continue
-        
-        lang_data = load_individual_language_file(lang_file)
-        if not lang_data:
-            continue
-        
-        # Extract language metadata (everything except categories)
-        if lang not in merged:
-            merged[lang] = {}
-        
-        for key, value in lang_data.items():
-            if key == 'categories':
-                continue
-            
-            # Normalize phonetics in metadata
-            if isinstance(value, dict):
-                normalized_value = {}
-                for k, v in value.items():
-                    if k.endswith('_phonetic') and isinstance(v, str):
-                        normalized_value[k] = normalize_phonetic(v)
-                    else:
-                        normalized_value[k] = v
-                merged[lang][key] = normalized_value
+                lang_phrase = readers[lang].row(category, position)
+                if lang_phrase is not None:
+                    merge_phrase(merged_phrase, lang_phrase, english_word, merged_fields)
+
+        category_stats[category] = len(phrases)
+        print(f"   ✅ {category}: {len(phrases)} phrases")
+
+    print(f"📖 Merging onto {base_name}...")
+    written_keys = []
+    written_categories = []
+    with CatalogWriter(output_file) as writer:
+        def add_english_categories():
+            # English categories the base does not have go at the end
+            for category in english_rows.categories_left():
+                phrases = []
+                merge_category(category, phrases)
+                writer.write_category(category, phrases)
+                written_categories.append(category)
+
+        for kind, name, value in iter_base(base_file):
+            if kind == 'meta':
+                # Language metadata: what the base already publishes is kept as-is
+                if name in language_data and isinstance(value, dict):
+                    merge_language_metadata(value, language_data[name])
+                writer.write_meta(name, value)
+                written_keys.append(name)
+            elif kind == 'categories':
+                writer.begin_categories()
+                written_keys.append('categories')
+            elif kind == 'category':
+                merge_category(name, value)
+                writer.write_category(name, value)
+                written_categories.append(name)
             else:
-                merged[lang][key] = value
-    
+                add_english_categories()
+
+        if 'categories' not in written_keys:
+            # No categories in the base: they follow its metadata
+            writer.begin_categories()
+            written_keys.append('categories')
+            add_english_categories()
+
+        # Languages the base has no metadata for
+        print("\n📝 Processing language metadata...")
+        for lang, lang_data in language_data.items():
+            if lang not in written_keys:
+                writer.write_meta(lang, merge_language_metadata({}, lang_data))
+                written_keys.append(lang)
+
     # Summary
     print("\n" + "="*60)
     print("📊 MERGE SUMMARY")
     print("="*60)
-    print(f"Total categories: {len(merged['categories'])}")
-    print(f"Total languages: {len([k for k in merged.keys() if k != 'categories'])}")
+    print(f"Total categories: {len(written_categories)}")
+    print(f"Total languages: {len([k for k in written_keys if k != 'categories'])}")
     print(f"\nCategory breakdown:")
     for cat in sorted(category_stats.keys()):
         print(f"   {cat:20} {category_stats[cat]:3} phrases")
-    
-    return merged
+
+    return Path(output_file)
 
 
 def main():
     print("🚀 Starting comprehensive translation merge...")
     print("="*60)
     
-    merged_data = merge_translations()
-    
     output_file = 'translations/all_languages_2.json'
-    print(f"\n💾 Saving to {output_file}...")
-    
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(merged_data, f, ensure_ascii=False, indent=2)
+    with persistent_cache():
+        merge_translations(output_file=output_file)
     
     # Validate
     file_size = os.path.getsize(output_file) / 1024 / 1024
@@ -219,12 +325,14 @@ def main():
     
     # Show sample
     print("\n📝 Sample entry (first action):")
-    if 'categories' in merged_data and 'actions' in merged_data['categories']:
-        sample = merged_data['categories']['actions'][0]
-        print(f"   English: {sample.get('english')}")
-        print(f"   Spanish: {sample.get('spanish')} ({sample.get('spanish_phonetic')})")
-        print(f"   Amharic: {sample.get('amharic')} ({sample.get('amharic_phonetic')})")
-        print(f"   Total fields: {len(sample)}")
+    for category, phrases in iter_categories(output_file):
+        if category == 'actions' and phrases:
+            sample = phrases[0]
+            print(f"   English: {sample.get('english')}")
+            print(f"   Spanish: {sample.get('spanish')} ({sample.get('spanish_phonetic')})")
+            print(f"   Amharic: {sample.get('amharic')} ({sample.get('amharic_phonetic')})")
+            print(f"   Total fields: {len(sample)}")
+            break
 
 
 if __name__ == '__main__':
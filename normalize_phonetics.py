@@ -6,76 +6,8 @@ Saves normalized version to translations/all_languages_2.json
 
 import json
 import re
-import unicodedata
 
-def normalize_phonetic(text):
-    """
-    Convert phonetic text to plain Latin letters only
-    
-    IPA → Latin mappings:
-    - ɛ (open e) → e
-    - ɔ (open o) → o  
-    - ï, ë, ü, etc → remove diacritics → i, e, u
-    - ñ → n
-    - Special vowels with combining diacritics → base letter
-    """
-    if not text or not isinstance(text, str):
-        return text
-    
-    # IPA character mappings
-    ipa_map = {
-        'ɛ': 'e',   # open e
-        'ɔ': 'o',   # open o
-        'ə': 'e',   # schwa
-        'ʃ': 'sh',  # sh sound
-        'ʒ': 'zh',  # zh sound
-        'ŋ': 'ng',  # ng sound
-        'θ': 'th',  # th sound
-        'ð': 'th',  # voiced th
-        'ʔ': '',    # glottal stop (silent)
-        'ː': '',    # length marker (remove)
-        'ˈ': '',    # stress marker (remove)
-        'ˌ': '',    # secondary stress (remove)
-    }
-    
-    # Apply IPA mappings
-    result = text
-    for ipa_char, latin in ipa_map.items():
-        result = result.replace(ipa_char, latin)
-    
-    # Remove combining diacritics (e.g., ɛ̈ → ɛ → e)
-    # NFD = decompose characters, then filter out combining marks
-    result = ''.join(
-        c for c in unicodedata.normalize('NFD', result)
-        if not unicodedata.combining(c)
-    )
-    
-    # Additional character mappings after diacritic removal
-    extra_map = {
-        'ñ': 'n',
-        'ß': 'ss',
-        'æ': 'ae',
-        'œ': 'oe',
-        'ø': 'o',
-        'å': 'a',
-        ''': '',  # right single quotation mark
-        ''': '',  # left single quotation mark
-        '`': '',  # grave accent
-        '´': '',  # acute accent
-    }
-    
-    for char, replacement in extra_map.items():
-        result = result.replace(char, replacement)
-    
-    # Keep only: a-z, A-Z, 0-9, hyphens, spaces, parentheses
-    result = re.sub(r'[^a-zA-Z0-9\s\-()]', '', result)
-    
-    # Clean up multiple spaces/hyphens
-    result = re.sub(r'\s+', ' ', result)
-    result = re.sub(r'-+', '-', result)
-    result = result.strip()
-    
-    return result
+from translation_tools.phonetics import normalize_phonetic, persistent_cache
 
 
 def process_translations(data):
@@ -106,7 +38,8 @@ def main():
         data = json.load(f)
     
     print("🔄 Normalizing phonetic fields...")
-    normalized_data = process_translations(data)
+    with persistent_cache():
+        normalized_data = process_translations(data)
     
     # Count changes
     original_str = json.dumps(data, ensure_ascii=False)
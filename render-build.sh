@@ -1,10 +1,17 @@
 #!/usr/bin/env bash
 # Render build script
+set -euo pipefail
 
 # Install Node.js dependencies
 npm install
 
-# Install Python dependencies
-pip install -r requirements.txt
+# Install Python dependencies (the translation build needs only the standard library)
+if [ -f requirements.txt ]; then
+    pip install -r requirements.txt
+fi
+
+# Merge, validate and publish the catalog, then derive the phrase shards,
+# the API ETag manifest and the conversation store server.js loads from it
+python build_translations.py
 
 echo "Build completed successfully"
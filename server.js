@@ -9,6 +9,7 @@ const path = require('path');
 const cors = require('cors');
 const fs = require('fs').promises;
 const fsSync = require('fs');
+const crypto = require('crypto');
 const config = require('./config');
 const rateLimit = require('express-rate-limit');
 const multer = require('multer');
@@ -22,6 +23,7 @@ const TTS_SERVICE_URL = config.SERVER_CONFIG.TTS_SERVICE_URL;
 // ============================================================================
 
 let unifiedTranslations = null;
+let unifiedTranslationsHash = null;
 
 /**
  * Load unified translations file into memory
@@ -29,7 +31,9 @@ let unifiedTranslations = null;
 async function loadUnifiedTranslations() {
     try {
         const filePath = path.join(__dirname, 'translations', 'all_languages.json');
-        const content = await fs.readFile(filePath, 'utf8');
+        const raw = await fs.readFile(filePath);
+        const content = raw.toString('utf8');
+        unifiedTranslationsHash = crypto.createHash('sha256').update(raw).digest('hex');
         unifiedTranslations = JSON.parse(content);
         console.log('✅ Loaded unified translations from all_languages.json');
 
@@ -68,6 +72,341 @@ function getLanguageData(language) {
     };
 }
 
+// ============================================================================
+// PHRASE SHARDS (built by translation_tools/shards.py)
+// ============================================================================
+
+const SHARDS_DIR = path.join(__dirname, 'translations', 'build', 'shards');
+const SHARD_FILE_PATTERN = /^[a-z_]+\.[0-9a-f]{12}\.json$/;
+
+let phraseShards = null;      // language -> category -> shard entry
+let phraseShardFiles = null;  // 'language/file' -> shard entry
+
+/**
+ * Load the shard manifest; shards are only used when they were built from
+ * the all_languages.json that is loaded in memory.
+ */
+async function loadPhraseShards() {
+    try {
+        const content = await fs.readFile(path.join(SHARDS_DIR, 'manifest.json'), 'utf8');
+        const manifest = JSON.parse(content);
+        if (manifest.source_sha256 !== unifiedTranslationsHash) {
+            console.warn('⚠️  Phrase shards are out of date; serving phrases from memory');
+            phraseShards = phraseShardFiles = null;
+            return false;
+        }
+        phraseShards = manifest.shards;
+        phraseShardFiles = new Map();
+        for (const categories of Object.values(phraseShards)) {
+            for (const shard of Object.values(categories)) {
+                phraseShardFiles.set(shard.file, shard);
+            }
+        }
+        console.log(`✅ Loaded ${phraseShardFiles.size} phrase shards`);
+        return true;
+    } catch (error) {
+        phraseShards = phraseShardFiles = null;
+        if (error.code !== 'ENOENT') {
+            console.error('❌ Failed to load phrase shards:', error.message);
+        }
+        return false;
+    }
+}
+
+/**
+ * Find the shard for a language/category, or null
+ */
+function getPhraseShard(language, category) {
+    if (!phraseShards || !Object.prototype.hasOwnProperty.call(phraseShards, language)) {
+        return null;
+    }
+    const categories = phraseShards[language];
+    return Object.prototype.hasOwnProperty.call(categories, category) ? categories[category] : null;
+}
+
+/**
+ * Stream a shard file, precompressed when the client accepts it.
+ * Calls fallback() if the file cannot be opened.
+ */
+function sendPhraseShard(req, res, shard, fallback) {
+    const accepted = req.headers['accept-encoding'] || '';
+    const encodings = shard.encodings || {};
+    let encoding = null;
+    let suffix = '';
+    if (encodings.br && /\bbr\b/.test(accepted)) {
+        encoding = 'br';
+        suffix = '.br';
+    } else if (encodings.gz && /\bgzip\b/.test(accepted)) {
+        encoding = 'gzip';
+        suffix = '.gz';
+    }
+
+    const stream = fsSync.createReadStream(path.join(SHARDS_DIR, shard.file + suffix));
+    stream.once('open', () => {
+        res.set('Content-Type', 'application/json; charset=utf-8');
+        res.set('Content-Length', String(encoding ? encodings[suffix.slice(1)] : shard.bytes));
+        res.vary('Accept-Encoding');
+        if (encoding) {
+            res.set('Content-Encoding', encoding);
+        }
+        stream.pipe(res);
+    });
+    stream.once('error', (error) => {
+        if (res.headersSent) {
+            res.destroy(error);
+            return;
+        }
+        console.error(`Shard ${shard.file} unavailable:`, error.message);
+        fallback();
+    });
+}
+
+// ============================================================================
+// CONTENT-HASH ETAGS (built by translation_tools/api_manifest.py)
+// ============================================================================
+
+const API_MANIFEST_FILE = path.join(__dirname, 'translations', 'build', 'api_manifest.json');
+
+let apiManifest = null;  // repo-relative path -> { sha256, size, mtime_ns }
+
+/**
+ * Load the build's content hashes of the files behind the JSON APIs
+ */
+async function loadApiManifest() {
+    try {
+        const content = await fs.readFile(API_MANIFEST_FILE, 'utf8');
+        apiManifest = JSON.parse(content).files;
+        console.log(`✅ Loaded content hashes for ${Object.keys(apiManifest).length} API files`);
+        return true;
+    } catch (error) {
+        apiManifest = null;
+        if (error.code !== 'ENOENT') {
+            console.error('❌ Failed to load API manifest:', error.message);
+        }
+        return false;
+    }
+}
+
+/**
+ * Strong ETag for a repo file from the manifest, or null when the file is
+ * not listed or changed since the build (size or mtime differ)
+ */
+async function manifestEtag(relPath) {
+    if (!apiManifest || !Object.prototype.hasOwnProperty.call(apiManifest, relPath)) {
+        return null;
+    }
+    const entry = apiManifest[relPath];
+    try {
+        const stat = await fs.stat(path.join(__dirname, relPath), { bigint: true });
+        if (stat.size === BigInt(entry.size) && stat.mtimeNs === BigInt(entry.mtime_ns)) {
+            return `"${entry.sha256}"`;
+        }
+    } catch (error) {
+        if (error.code !== 'ENOENT') {
+            throw error;
+        }
+    }
+    return null;
+}
+
+function contentEtag(content) {
+    return `"${crypto.createHash('sha256').update(content).digest('hex')}"`;
+}
+
+/**
+ * Attach a strong ETag (clients may store the response but must revalidate)
+ * and answer a matching If-None-Match with 304. Returns true if it did.
+ */
+function sendNotModified(req, res, etag) {
+    res.set('ETag', etag);
+    res.set('Cache-Control', 'no-cache');
+    res.removeHeader('Pragma');
+    res.removeHeader('Expires');
+
+    const header = req.headers['if-none-match'];
+    if (!header) {
+        return false;
+    }
+    // If-None-Match uses weak comparison
+    const matches = header.trim() === '*' ||
+        header.split(',').some(tag => tag.trim().replace(/^W\//, '') === etag);
+    if (!matches) {
+        return false;
+    }
+    res.status(304).end();
+    return true;
+}
+
+/**
+ * Send a repo JSON file with a content-hash ETag. A revalidation that still
+ * matches the build's hash is answered without reading the file.
+ * Rejects with ENOENT if the file does not exist.
+ */
+async function sendJsonFile(req, res, relPath) {
+    let etag = await manifestEtag(relPath);
+    if (etag && sendNotModified(req, res, etag)) {
+        return;
+    }
+    const content = await fs.readFile(path.join(__dirname, relPath));
+    if (!etag) {
+        etag = contentEtag(content);
+        if (sendNotModified(req, res, etag)) {
+            return;
+        }
+    }
+    res.json(JSON.parse(content.toString('utf8')));
+}
+
+// ============================================================================
+// CONVERSATION STORE (built by translation_tools/conversations.py)
+// ============================================================================
+
+const CONVERSATION_STORE_FILE = path.join(__dirname, 'translations', 'build', 'conversations.json');
+const CONVERSATION_STORE_VERSION = 2;
+const CONVERSATIONS_DIR = path.join(__dirname, 'contextual_conversations');
+
+let conversationStore = null;
+const watchedConversationFiles = new Set();
+
+/**
+ * True when contextual_conversations/ still holds exactly the files the
+ * store was compiled from. Files whose size and mtime match are trusted;
+ * the others are hashed.
+ */
+async function conversationSourcesCurrent(sources) {
+    const names = (await fs.readdir(CONVERSATIONS_DIR)).filter(name => name.endsWith('.json'));
+    if (!sources || names.length !== Object.keys(sources).length) {
+        return false;
+    }
+    for (const name of names) {
+        const relPath = `contextual_conversations/${name}`;
+        if (!Object.prototype.hasOwnProperty.call(sources, relPath)) {
+            return false;
+        }
+        const entry = sources[relPath];
+        const filePath = path.join(CONVERSATIONS_DIR, name);
+        const stat = await fs.stat(filePath, { bigint: true });
+        if (stat.size !== BigInt(entry.size)) {
+            return false;
+        }
+        if (stat.mtimeNs !== BigInt(entry.mtime_ns) &&
+            contentEtag(await fs.readFile(filePath)) !== `"${entry.sha256}"`) {
+            return false;
+        }
+    }
+    return true;
+}
+
+/**
+ * Load the precompiled conversation store; the routes read the
+ * contextual_conversations files directly while it is unavailable or
+ * older than those files
+ */
+async function loadConversationStore() {
+    try {
+        const content = await fs.readFile(CONVERSATION_STORE_FILE, 'utf8');
+        const store = JSON.parse(content);
+        if (store.version !== CONVERSATION_STORE_VERSION) {
+            throw new Error(`unsupported version ${store.version}`);
+        }
+        if (!(await conversationSourcesCurrent(store.sources))) {
+            console.warn('⚠️  Conversation store is out of date; serving contextual_conversations/ until it is rebuilt');
+            conversationStore = null;
+            return false;
+        }
+        conversationStore = store;
+        console.log(`✅ Loaded conversation store (${Object.keys(store.contexts).length} contexts)`);
+        return true;
+    } catch (error) {
+        conversationStore = null;
+        if (error.code !== 'ENOENT') {
+            console.error('❌ Failed to load conversation store:', error.message);
+        }
+        return false;
+    }
+}
+
+/**
+ * Poll a file or directory; reload the store when its mtime changes
+ * (polling survives the rename the build uses to replace files)
+ */
+function watchForConversationChanges(filePath) {
+    if (watchedConversationFiles.has(filePath)) {
+        return;
+    }
+    watchedConversationFiles.add(filePath);
+    fsSync.watchFile(filePath, { interval: 2000 }, (current, previous) => {
+        if (current.mtimeMs !== previous.mtimeMs) {
+            watchConversationSources();
+            loadConversationStore();
+        }
+    });
+}
+
+/**
+ * Watch the directory (files added or removed) and every conversation file in it
+ */
+function watchConversationSources() {
+    watchForConversationChanges(CONVERSATIONS_DIR);
+    try {
+        for (const name of fsSync.readdirSync(CONVERSATIONS_DIR)) {
+            if (name.endsWith('.json')) {
+                watchForConversationChanges(path.join(CONVERSATIONS_DIR, name));
+            }
+        }
+    } catch (error) {
+        console.error('❌ Failed to watch contextual_conversations:', error.message);
+    }
+}
+
+/**
+ * Reload the store whenever the build rewrites it or one of its sources changes
+ */
+function watchConversationStore() {
+    watchForConversationChanges(CONVERSATION_STORE_FILE);
+    watchConversationSources();
+}
+
+/**
+ * Nested own-property lookup (route parameters must not reach the prototype)
+ */
+function storeLookup(table, ...keys) {
+    let value = table;
+    for (const key of keys) {
+        if (!value || !Object.prototype.hasOwnProperty.call(value, key)) {
+            return null;
+        }
+        value = value[key];
+    }
+    return value;
+}
+
+/**
+ * Send a store slice with the ETag the build computed for its route
+ */
+function sendStoreSlice(req, res, route, value) {
+    const etag = storeLookup(conversationStore.etags, route);
+    if (etag && sendNotModified(req, res, `"${etag}"`)) {
+        return;
+    }
+    res.json(value);
+}
+
+async function readConversationIndex() {
+    if (conversationStore) {
+        return conversationStore.index;
+    }
+    const content = await fs.readFile(path.join(__dirname, 'contextual_conversations', 'index.json'), 'utf8');
+    return JSON.parse(content);
+}
+
+/**
+ * Conversation entries of index.json ("contexts" now, "conversations" formerly)
+ */
+function conversationIndexEntries(indexData) {
+    return indexData.conversations || indexData.contexts || [];
+}
+
 // Configure multer for file uploads
 const storage = multer.diskStorage({
     destination: function (req, file, cb) {
@@ -167,6 +506,7 @@ app.use((req, res, next) => {
 
 app.use(express.static('public'));
 // Translation files are NOT publicly accessible - served only via API
+// (and as the content-hashed shards listed in the manifest below)
 
 // Set EJS as templating engine
 app.set('view engine', 'ejs');
@@ -250,13 +590,23 @@ app.get('/api/phrases/:language/:category', async (req, res) => {
         }
 
         // Return phrases for the requested category only
-        res.json({
+        const sendFromMemory = () => res.json({
             language: translationData.language,
             nativeLanguageField: translationData.nativeLanguageField,
             category: category,
             categoryName: translationData.categoryNames ? translationData.categoryNames[category] : category,
             phrases: translationData.categories[category]
         });
+
+        // Prebuilt shard with the same body, streamed from disk; its hash is the ETag
+        const shard = getPhraseShard(language, category);
+        if (shard) {
+            if (sendNotModified(req, res, `"${shard.sha256}"`)) {
+                return;
+            }
+            return sendPhraseShard(req, res, shard, sendFromMemory);
+        }
+        sendFromMemory();
     } catch (error) {
         if (error.code === 'ENOENT') {
             return res.status(404).json({ error: 'Translation file not found' });
@@ -270,15 +620,44 @@ app.get('/api/phrases/:language/:category', async (req, res) => {
     }
 });
 
+// Shard manifest: category -> immutable shard URL for each language
+app.get('/api/shards', (req, res) => {
+    if (!phraseShards) {
+        return res.status(404).json({ error: 'Phrase shards not available' });
+    }
+    const urls = {};
+    for (const [language, categories] of Object.entries(phraseShards)) {
+        urls[language] = {};
+        for (const [category, shard] of Object.entries(categories)) {
+            urls[language][category] = `/shards/${shard.file}`;
+        }
+    }
+    res.json(urls);
+});
+
+// Content-hashed shard files never change, so they can be cached indefinitely
+app.get('/shards/:language/:file', (req, res) => {
+    const language = path.basename(req.params.language);
+    const file = req.params.file;
+
+    if (!config.isValidLanguage(language) || !SHARD_FILE_PATTERN.test(file)) {
+        return res.status(404).json({ error: 'Shard not found' });
+    }
+    const shard = phraseShardFiles && phraseShardFiles.get(`${language}/${file}`);
+    if (!shard) {
+        return res.status(404).json({ error: 'Shard not found' });
+    }
+    if (sendNotModified(req, res, `"${shard.sha256}"`)) {
+        return;
+    }
+    res.set('Cache-Control', 'public, max-age=31536000, immutable');
+    sendPhraseShard(req, res, shard, () => res.status(404).json({ error: 'Shard not found' }));
+});
+
 // API endpoint to get contextual phrases
 app.get('/api/contextual/phrases', async (req, res) => {
     try {
-        const fileContent = await fs.readFile(
-            path.join(__dirname, 'translations_network', 'priority_contextual_phrases.json'),
-            'utf8'
-        );
-        const phrasesData = JSON.parse(fileContent);
-        res.json(phrasesData);
+        await sendJsonFile(req, res, 'translations_network/priority_contextual_phrases.json');
     } catch (error) {
         console.error('Error loading contextual phrases:', error);
         res.status(500).json({ error: 'Failed to load contextual phrases' });
@@ -292,44 +671,16 @@ app.get('/api/contextual/phrases', async (req, res) => {
 // Get list of all available conversations
 app.get('/api/conversations', async (req, res) => {
     try {
-        const indexPath = path.join(__dirname, 'contextual_conversations', 'index.json');
-        const fileContent = await fs.readFile(indexPath, 'utf8');
-        const indexData = JSON.parse(fileContent);
-        res.json(indexData);
+        if (conversationStore) {
+            return sendStoreSlice(req, res, '/api/conversations', conversationStore.index);
+        }
+        await sendJsonFile(req, res, 'contextual_conversations/index.json');
     } catch (error) {
         console.error('Error loading conversations index:', error);
         res.status(500).json({ error: 'Failed to load conversations index' });
     }
 });
 
-// Get specific conversation by context and language
-app.get('/api/conversations/:context/:language', async (req, res) => {
-    const context = path.basename(req.params.context);
-    const language = path.basename(req.params.language);
-
-    // Validate inputs
-    if (!/^[a-z_]+$/.test(context) || !/^[a-z_]+$/.test(language)) {
-        return res.status(400).json({ error: 'Invalid context or language format' });
-    }
-
-    try {
-        const conversationPath = path.join(
-            __dirname,
-            'contextual_conversations',
-            `${context}_${language}.json`
-        );
-        const fileContent = await fs.readFile(conversationPath, 'utf8');
-        const conversationData = JSON.parse(fileContent);
-        res.json(conversationData);
-    } catch (error) {
-        if (error.code === 'ENOENT') {
-            return res.status(404).json({ error: 'Conversation not found' });
-        }
-        console.error('Error loading conversation:', error);
-        res.status(500).json({ error: 'Failed to load conversation' });
-    }
-});
-
 // Get all conversations for a specific context (all languages)
 app.get('/api/conversations/context/:context', async (req, res) => {
     const context = path.basename(req.params.context);
@@ -339,11 +690,13 @@ app.get('/api/conversations/context/:context', async (req, res) => {
     }
 
     try {
-        const indexPath = path.join(__dirname, 'contextual_conversations', 'index.json');
-        const fileContent = await fs.readFile(indexPath, 'utf8');
-        const indexData = JSON.parse(fileContent);
-
-        const filtered = indexData.conversations.filter(c => c.context === context);
+        if (conversationStore) {
+            const filtered = storeLookup(conversationStore.by_context, context) || [];
+            return sendStoreSlice(req, res, req.path, { conversations: filtered });
+        }
+        const indexData = await readConversationIndex();
+        const filtered = conversationIndexEntries(indexData)
+            .filter(c => (c.context || c.context_id) === context);
         res.json({ conversations: filtered });
     } catch (error) {
         console.error('Error loading conversations by context:', error);
@@ -360,11 +713,13 @@ app.get('/api/conversations/language/:language', async (req, res) => {
     }
 
     try {
-        const indexPath = path.join(__dirname, 'contextual_conversations', 'index.json');
-        const fileContent = await fs.readFile(indexPath, 'utf8');
-        const indexData = JSON.parse(fileContent);
-
-        const filtered = indexData.conversations.filter(c => c.language === language);
+        if (conversationStore) {
+            const filtered = storeLookup(conversationStore.by_language, language) || [];
+            return sendStoreSlice(req, res, req.path, { conversations: filtered });
+        }
+        const indexData = await readConversationIndex();
+        const filtered = conversationIndexEntries(indexData).filter(c => c.language === language ||
+            (Array.isArray(c.available_languages) && c.available_languages.includes(language)));
         res.json({ conversations: filtered });
     } catch (error) {
         console.error('Error loading conversations by language:', error);
@@ -372,6 +727,35 @@ app.get('/api/conversations/language/:language', async (req, res) => {
     }
 });
 
+// Get specific conversation by context and language
+// (registered after the /context/ and /language/ routes, which it would shadow)
+app.get('/api/conversations/:context/:language', async (req, res) => {
+    const context = path.basename(req.params.context);
+    const language = path.basename(req.params.language);
+
+    // Validate inputs
+    if (!/^[a-z_]+$/.test(context) || !/^[a-z_]+$/.test(language)) {
+        return res.status(400).json({ error: 'Invalid context or language format' });
+    }
+
+    try {
+        if (conversationStore) {
+            const conversation = storeLookup(conversationStore.conversations, context, language);
+            if (!conversation) {
+                return res.status(404).json({ error: 'Conversation not found' });
+            }
+            return sendStoreSlice(req, res, req.path, conversation);
+        }
+        await sendJsonFile(req, res, `contextual_conversations/${context}_${language}.json`);
+    } catch (error) {
+        if (error.code === 'ENOENT') {
+            return res.status(404).json({ error: 'Conversation not found' });
+        }
+        console.error('Error loading conversation:', error);
+        res.status(500).json({ error: 'Failed to load conversation' });
+    }
+});
+
 // ============================================================================
 // EXISTING API ENDPOINTS
 // ============================================================================
@@ -498,18 +882,26 @@ app.get('/conversation-game', (req, res) => {
 });
 
 // API endpoint to get conversation data
-app.get('/api/conversation/:context', (req, res) => {
-    const context = req.params.context;
-    const conversationFile = path.join(__dirname, 'contextual_conversations', `multilanguage_${context}.json`);
-    
-    if (!fsSync.existsSync(conversationFile)) {
+app.get('/api/conversation/:context', async (req, res) => {
+    const context = path.basename(req.params.context);
+
+    if (!/^[a-z_]+$/.test(context)) {
         return res.status(404).json({ error: 'Conversation not found' });
     }
-    
+
     try {
-        const conversationData = JSON.parse(fsSync.readFileSync(conversationFile, 'utf8'));
-        res.json(conversationData);
+        if (conversationStore) {
+            const conversation = storeLookup(conversationStore.contexts, context);
+            if (!conversation) {
+                return res.status(404).json({ error: 'Conversation not found' });
+            }
+            return sendStoreSlice(req, res, req.path, conversation);
+        }
+        await sendJsonFile(req, res, `contextual_conversations/multilanguage_${context}.json`);
     } catch (error) {
+        if (error.code === 'ENOENT') {
+            return res.status(404).json({ error: 'Conversation not found' });
+        }
         console.error('Error loading conversation:', error);
         res.status(500).json({ error: 'Failed to load conversation' });
     }
@@ -876,9 +1268,7 @@ app.get('/emergency', async (req, res) => {
 // Conversations index page
 app.get('/conversations', async (req, res) => {
     try {
-        const indexPath = path.join(__dirname, 'contextual_conversations', 'index.json');
-        const fileContent = await fs.readFile(indexPath, 'utf8');
-        const indexData = JSON.parse(fileContent);
+        const indexData = await readConversationIndex();
 
         // Try to get native language from query parameter (for UI)
         const nativeLanguage = req.query.native ? path.basename(req.query.native) : 'english';
@@ -942,8 +1332,8 @@ app.get('/conversations/:context/:nativeLanguage/:targetLanguage', async (req, r
         let isMultiLanguage = false;
 
         try {
-            const fileContent = await fs.readFile(multiLangPath, 'utf8');
-            conversationData = JSON.parse(fileContent);
+            const stored = conversationStore && storeLookup(conversationStore.contexts, context);
+            conversationData = stored || JSON.parse(await fs.readFile(multiLangPath, 'utf8'));
             isMultiLanguage = true;
         } catch (error) {
             // Fallback to old single-language format for backward compatibility
@@ -1023,6 +1413,12 @@ async function startServer() {
         process.exit(1);
     }
 
+    // Optional: per-category shards and content hashes from the Python build
+    await loadPhraseShards();
+    await loadApiManifest();
+    await loadConversationStore();
+    watchConversationStore();
+
     app.listen(PORT, () => {
         console.log(`\n${'='.repeat(50)}`);
         console.log(`🚀 Express Server running on http://localhost:${PORT}`);
@@ -0,0 +1,4 @@
+"""
+Shared building blocks for the translation scripts in the repository root.
+Scripts are run from the repository root, which puts this package on the path.
+"""
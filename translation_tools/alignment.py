@@ -0,0 +1,299 @@
+"""
+Stable phrase IDs and a persisted cross-language alignment table.
+
+Scripts join phrases across language files by their ``english`` text, each
+with its own dict. Here every (category, english) key is assigned an
+integer phrase ID once, in ``translations/phrase_ids.jsonl`` (committed):
+
+    ["actions_attack", "actions", "attack"]
+    ["actions_capture", "actions", "capture"]
+
+Line ``i`` is phrase ID ``i``; IDs are only ever appended, so they are
+stable across runs and checkouts. The string form (``<category>_<slug>``) is the
+one scripts/migrate_to_unified.js generates, with ``_2``, ``_3``... added
+when two English texts slugify to the same ID.
+
+The alignment table (``translations/build/alignment.json``, generated) stores,
+per language file, an array indexed by phrase ID holding the position of
+that phrase in the file's flattened phrase list (-1 when absent), together
+with the file's SHA-256. Joining languages is then an array lookup:
+
+    alignment = load_alignment()
+    phrase_id = alignment.ids.get('actions', 'attack')
+    alignment.row('somali', phrase_id)   # the somali.json phrase dict, or None
+
+Only files whose hash changed are re-aligned; the others are parsed only
+when one of their rows is read.
+
+The registry is written only by the ``align`` build stage
+(``load_alignment(save=True)``). Every other consumer (the merge, the phrase
+store and the catalog exports) loads it read-only; a phrase it does not know
+yet gets the next free ID in memory for that run.
+"""
+
+import hashlib
+import json
+import os
+import re
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+TRANSLATIONS_DIR = ROOT / 'translations'
+REGISTRY_NAME = 'phrase_ids.jsonl'
+ALIGNMENT_NAME = 'build/alignment.json'
+REGISTRY_FILE = TRANSLATIONS_DIR / REGISTRY_NAME
+ALIGNMENT_VERSION = 1
+
+MISSING = -1
+
+_NON_ALNUM = re.compile(r'[^a-z0-9]+')
+
+
+def slug(text: str) -> str:
+    """Same rules as sanitizeId() in scripts/migrate_to_unified.js."""
+    return _NON_ALNUM.sub('_', text.lower()).strip('_')[:50]
+
+
+def _write_json(path: Path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = path.with_suffix('.tmp')
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(tmp_file, path)
+
+
+def _sha256(path: Path) -> str:
+    sha = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def iter_rows(data: Dict) -> Iterable[Tuple[str, Dict]]:
+    """(category, phrase) of a language file in file order."""
+    for category, phrases in data.get('categories', {}).items():
+        if isinstance(phrases, list):
+            for phrase in phrases:
+                if isinstance(phrase, dict):
+                    yield category, phrase
+
+
+def flatten(data: Dict) -> List[Dict]:
+    """Phrases of a language file in file order; positions index this list."""
+    return [phrase for _, phrase in iter_rows(data)]
+
+
+class PhraseIds:
+    """Append-only registry of (category, english) -> integer phrase ID."""
+
+    def __init__(self, path: Path = REGISTRY_FILE):
+        self.path = Path(path)
+        self.saved = 0
+        self.keys: List[Tuple[str, str]] = []
+        self.string_ids: List[str] = []
+        self._index: Dict[Tuple[str, str], int] = {}
+        self._by_string: Dict[str, int] = {}
+        self.dirty = False
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @classmethod
+    def load(cls, path: Path = REGISTRY_FILE) -> 'PhraseIds':
+        """Load the registry; a missing file loads as empty."""
+        ids = cls(path)
+        if not ids.path.exists():
+            return ids
+        with open(ids.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    string_id, category, english = json.loads(line)
+                    ids._append(string_id, category, english)
+        ids.saved = len(ids.keys)
+        ids.dirty = False
+        return ids
+
+    def save(self) -> bool:
+        """Append newly assigned IDs to the registry; returns True if any were written."""
+        if not self.dirty:
+            return False
+        with open(self.path, 'a', encoding='utf-8') as f:
+            for sid, (cat, eng) in zip(self.string_ids[self.saved:], self.keys[self.saved:]):
+                f.write(json.dumps([sid, cat, eng], ensure_ascii=False) + '\n')
+        self.saved = len(self.keys)
+        self.dirty = False
+        return True
+
+    def _append(self, string_id: str, category: str, english: str) -> int:
+        phrase_id = len(self.keys)
+        self.keys.append((category, english))
+        self.string_ids.append(string_id)
+        self._index[(category, english)] = phrase_id
+        self._by_string[string_id] = phrase_id
+        self.dirty = True
+        return phrase_id
+
+    def get(self, category: str, english: str) -> Optional[int]:
+        return self._index.get((category, english))
+
+    def assign(self, category: str, english: str) -> int:
+        """Phrase ID for (category, english), assigning the next ID if new."""
+        phrase_id = self._index.get((category, english))
+        if phrase_id is not None:
+            return phrase_id
+        base = f"{category}_{slug(english)}"
+        string_id, n = base, 1
+        while string_id in self._by_string:
+            n += 1
+            string_id = f"{base}_{n}"
+        return self._append(string_id, category, english)
+
+    def key(self, phrase_id: int) -> Tuple[str, str]:
+        return self.keys[phrase_id]
+
+    def string_id(self, phrase_id: int) -> str:
+        return self.string_ids[phrase_id]
+
+    def from_string_id(self, string_id: str) -> Optional[int]:
+        return self._by_string.get(string_id)
+
+
+class Alignment:
+    """Per-language arrays mapping phrase ID -> position in that language file."""
+
+    def __init__(self, ids: PhraseIds, translations_dir: Path = TRANSLATIONS_DIR):
+        self.ids = ids
+        self.translations_dir = Path(translations_dir)
+        self.path = self.translations_dir / ALIGNMENT_NAME
+        self.positions: Dict[str, array] = {}
+        self.sources: Dict[str, Dict] = {}
+        self._rows: Dict[str, List[Dict]] = {}
+        self.dirty = False
+
+    @property
+    def languages(self) -> List[str]:
+        return list(self.positions)
+
+    def align(self, language: str, data: Dict, filename: Optional[str] = None,
+              sha256: Optional[str] = None):
+        """(Re)build the array for one parsed language file, assigning new IDs."""
+        rows = []
+        positions = array('i')
+        for position, (category, phrase) in enumerate(iter_rows(data)):
+            rows.append(phrase)
+            english = phrase.get('english')
+            if not isinstance(english, str):
+                continue
+            phrase_id = self.ids.assign(category, english)
+            if phrase_id >= len(positions):
+                positions.extend([MISSING] * (phrase_id + 1 - len(positions)))
+            if positions[phrase_id] == MISSING:  # first occurrence wins, like a linear scan
+                positions[phrase_id] = position
+        self.positions[language] = positions
+        self.sources[language] = {'file': filename or f'{language}.json', 'sha256': sha256}
+        self._rows[language] = rows
+        self.dirty = True
+
+    def position(self, language: str, phrase_id: Optional[int]) -> Optional[int]:
+        """Position of the phrase in the language file, or None."""
+        positions = self.positions.get(language)
+        if positions is None or phrase_id is None or phrase_id >= len(positions):
+            return None
+        position = positions[phrase_id]
+        return None if position == MISSING else position
+
+    def row(self, language: str, phrase_id: Optional[int]) -> Optional[Dict]:
+        """The language file's phrase dict for a phrase ID, or None."""
+        position = self.position(language, phrase_id)
+        if position is None:
+            return None
+        return self._language_rows(language)[position]
+
+    def rows(self, phrase_id: int) -> Dict[str, Dict]:
+        """``{language: phrase}`` for every language that has the phrase."""
+        found = {}
+        for language in self.positions:
+            row = self.row(language, phrase_id)
+            if row is not None:
+                found[language] = row
+        return found
+
+    def _language_rows(self, language: str) -> List[Dict]:
+        rows = self._rows.get(language)
+        if rows is None:
+            with open(self.translations_dir / self.sources[language]['file'], 'r',
+                      encoding='utf-8') as f:
+                rows = self._rows[language] = flatten(json.load(f))
+        return rows
+
+    def save(self) -> bool:
+        if not self.dirty:
+            return False
+        languages = {
+            language: {**self.sources[language], 'positions': positions.tolist()}
+            for language, positions in self.positions.items()
+        }
+        _write_json(self.path, {'version': ALIGNMENT_VERSION, 'phrases': len(self.ids),
+                                'languages': languages})
+        self.dirty = False
+        return True
+
+    def _load_saved(self) -> Dict:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+            if saved.get('version') == ALIGNMENT_VERSION and saved.get('phrases', 0) <= len(self.ids):
+                return saved['languages']
+        except (OSError, ValueError):
+            pass
+        return {}
+
+
+def default_languages(translations_dir: Path = TRANSLATIONS_DIR) -> List[str]:
+    """English first (it defines the reference order), then every other language file."""
+    names = sorted(path.stem for path in Path(translations_dir).glob('*.json')
+                   if not path.stem.startswith('all_languages'))
+    return sorted(names, key=lambda name: name != 'english')
+
+
+def load_alignment(translations_dir: Path = TRANSLATIONS_DIR,
+                   languages: Optional[Iterable[str]] = None,
+                   data: Optional[Dict[str, Dict]] = None,
+                   save: bool = False) -> Alignment:
+    """
+    Alignment of ``languages`` (default: every language file). Arrays of
+    unchanged files are reused from alignment.json; changed files are
+    re-aligned (``data`` may supply already-parsed files). New phrase IDs
+    and the table are only written when ``save`` is True.
+    """
+    translations_dir = Path(translations_dir)
+    data = data or {}
+    ids = PhraseIds.load(translations_dir / REGISTRY_NAME)
+    alignment = Alignment(ids, translations_dir)
+    saved = alignment._load_saved()
+
+    for language in (languages or default_languages(translations_dir)):
+        path = translations_dir / f'{language}.json'
+        if not path.exists():
+            continue
+        digest = _sha256(path)
+        cached = saved.get(language)
+        if cached and cached.get('sha256') == digest:
+            alignment.positions[language] = array('i', cached['positions'])
+            alignment.sources[language] = {'file': path.name, 'sha256': digest}
+            if language in data:
+                alignment._rows[language] = flatten(data[language])
+            continue
+        parsed = data.get(language)
+        if parsed is None:
+            with open(path, 'r', encoding='utf-8') as f:
+                parsed = json.load(f)
+        alignment.align(language, parsed, path.name, digest)
+
+    if save:
+        ids.save()
+        alignment.save()
+    return alignment
@@ -0,0 +1,78 @@
+"""
+Content hashes of the files server.js serves through its JSON APIs.
+
+``/api/contextual/phrases`` and the conversation routes answer from JSON
+files that change only when the repository does. The build records each
+file's SHA-256 together with its size and modification time in
+``translations/build/api_manifest.json``:
+
+    {"version": 1, "files": {
+        "contextual_conversations/restaurant_amharic.json":
+            {"sha256": "...", "size": 5120, "mtime_ns": "1760870000000000000"}, ...}}
+
+server.js uses the hash as a strong ETag and answers ``If-None-Match``
+with 304 without reading the file. It trusts an entry only while the
+file's size and mtime still match (one ``stat``), and hashes the content
+itself otherwise. Phrase responses take their ETag from the shard
+manifest (shards.py) instead.
+
+    python -m translation_tools.api_manifest
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+ROOT = Path(__file__).resolve().parent.parent
+MANIFEST_FILE = ROOT / 'translations' / 'build' / 'api_manifest.json'
+MANIFEST_VERSION = 1
+
+# Files behind the API routes, relative to the repository root
+API_SOURCES = [
+    'translations_network/priority_contextual_phrases.json',
+    'contextual_conversations/*.json',
+]
+
+
+def api_files(root: Path = ROOT, patterns: Iterable[str] = API_SOURCES) -> List[Path]:
+    files = set()
+    for pattern in patterns:
+        files.update(path for path in root.glob(pattern) if path.is_file())
+    return sorted(files)
+
+
+def file_entry(path: Path) -> Dict:
+    stat = path.stat()
+    return {
+        'sha256': hashlib.sha256(path.read_bytes()).hexdigest(),
+        'size': stat.st_size,
+        # A string: nanosecond timestamps exceed the doubles JavaScript parses into
+        'mtime_ns': str(stat.st_mtime_ns),
+    }
+
+
+def build_api_manifest(root: Path = ROOT, manifest_file: Path = MANIFEST_FILE) -> Dict:
+    """Hash every API source file and write the manifest; returns it."""
+    root = Path(root)
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'files': {path.relative_to(root).as_posix(): file_entry(path) for path in api_files(root)},
+    }
+    manifest_file = Path(manifest_file)
+    manifest_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = manifest_file.with_suffix('.tmp')
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_file, manifest_file)
+    return manifest
+
+
+def main():
+    manifest = build_api_manifest()
+    print(f"✅ Hashed {len(manifest['files'])} API files into {MANIFEST_FILE.relative_to(ROOT)}")
+
+
+if __name__ == '__main__':
+    main()
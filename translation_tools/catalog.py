@@ -0,0 +1,328 @@
+"""
+SQLite export of the unified translation catalog, with indexed lookups.
+
+Scanning a category list for a matching ``english`` value (as server.js
+and the Python tools do) is linear in the category size and requires the
+whole catalog in memory. The export stores:
+
+    phrases(phrase_id, category, english, position, ordinal)
+        indexes on (category, english) and (english)
+    translations(language, phrase_id, text, phonetic)
+        primary key (language, phrase_id)
+    languages(language, native_field, metadata)     -- ui, categoryNames, ... as JSON
+    translations_fts                                 -- FTS5 over text and phonetic
+
+``phrase_id`` is the registry ID (translations/phrase_ids.jsonl), the same
+one the columnar file and the search index use; ``ordinal`` keeps the
+catalog order. English is stored as the ``english`` language so it is
+searchable too.
+``PhraseCatalog`` answers lookups, category listings, coverage counts and
+full-text searches with indexed queries.
+"""
+
+import json
+import os
+import sqlite3
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from translation_tools.alignment import PhraseIds
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_DB = ROOT / 'translations' / 'all_languages.db'
+SCHEMA_VERSION = 3
+
+PHONETIC_SUFFIX = '_phonetic'
+
+SCHEMA = """
+CREATE TABLE meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE languages (
+    language TEXT PRIMARY KEY,
+    native_field TEXT,
+    metadata TEXT
+);
+CREATE TABLE phrases (
+    phrase_id INTEGER PRIMARY KEY,
+    category TEXT NOT NULL,
+    english TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    ordinal INTEGER NOT NULL
+);
+CREATE INDEX idx_phrases_category_english ON phrases (category, english);
+CREATE INDEX idx_phrases_english ON phrases (english);
+CREATE TABLE translations (
+    language TEXT NOT NULL,
+    phrase_id INTEGER NOT NULL REFERENCES phrases (phrase_id),
+    text TEXT NOT NULL,
+    phonetic TEXT,
+    PRIMARY KEY (language, phrase_id)
+) WITHOUT ROWID;
+CREATE VIRTUAL TABLE translations_fts USING fts5 (
+    text, phonetic, language UNINDEXED, phrase_id UNINDEXED,
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+
+def catalog_languages(catalog: Dict) -> List[str]:
+    """Language fields used by phrases, metadata languages first."""
+    languages = [key for key in catalog if key != 'categories']
+    for phrases in catalog.get('categories', {}).values():
+        for phrase in phrases:
+            for field in phrase:
+                if (field != 'english' and not field.endswith(PHONETIC_SUFFIX)
+                        and field not in languages):
+                    languages.append(field)
+    return languages
+
+
+def export_catalog(catalog: Dict, db_path=DEFAULT_DB, ids: Optional[PhraseIds] = None) -> Path:
+    """
+    Write ``catalog`` (the all_languages.json structure) to a fresh SQLite
+    database, keyed on the phrase IDs of ``ids`` (default: the registry,
+    read-only). The file is built next to ``db_path`` and renamed into place.
+    """
+    db_path = Path(db_path)
+    ids = ids if ids is not None else PhraseIds.load()
+    tmp_path = db_path.with_suffix(db_path.suffix + '.tmp')
+    if tmp_path.exists():
+        tmp_path.unlink()
+
+    languages = [lang for lang in catalog_languages(catalog) if lang != 'english']
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.executescript(SCHEMA)
+        conn.execute("INSERT INTO meta VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),))
+
+        language_rows = []
+        for lang in ['english'] + languages:
+            metadata = catalog.get(lang)
+            if isinstance(metadata, dict):
+                language_rows.append((lang, metadata.get('nativeLanguageField', lang),
+                                      json.dumps(metadata, ensure_ascii=False)))
+            else:
+                language_rows.append((lang, lang, None))
+        conn.executemany("INSERT INTO languages VALUES (?, ?, ?)", language_rows)
+
+        phrase_rows = []
+        translation_rows = []
+        seen = set()
+        for category, phrases in catalog.get('categories', {}).items():
+            for position, phrase in enumerate(phrases):
+                english = phrase.get('english')
+                if not isinstance(english, str):
+                    continue
+                phrase_id = ids.assign(category, english)
+                if phrase_id in seen:
+                    continue  # repeated (category, english): the first one is found
+                seen.add(phrase_id)
+                phrase_rows.append((phrase_id, category, english, position, len(phrase_rows)))
+                translation_rows.append(('english', phrase_id, english, None))
+                for lang in languages:
+                    text = phrase.get(lang)
+                    if isinstance(text, str) and text:
+                        phonetic = phrase.get(lang + PHONETIC_SUFFIX)
+                        translation_rows.append(
+                            (lang, phrase_id, text, phonetic if isinstance(phonetic, str) else None)
+                        )
+
+        conn.executemany("INSERT INTO phrases VALUES (?, ?, ?, ?, ?)", phrase_rows)
+        conn.executemany("INSERT INTO translations VALUES (?, ?, ?, ?)", translation_rows)
+        conn.execute(
+            "INSERT INTO translations_fts (text, phonetic, language, phrase_id) "
+            "SELECT text, coalesce(phonetic, ''), language, phrase_id FROM translations"
+        )
+        conn.execute("INSERT INTO translations_fts (translations_fts) VALUES ('optimize')")
+        conn.commit()
+        conn.execute("VACUUM")
+    finally:
+        conn.close()
+
+    os.replace(tmp_path, db_path)
+    return db_path
+
+
+class PhraseCatalog:
+    """Read-only, indexed queries against an exported catalog database."""
+
+    def __init__(self, db_path=DEFAULT_DB):
+        self.db_path = Path(db_path)
+        if not self.db_path.exists():
+            raise FileNotFoundError(f"Catalog database not found: {self.db_path}")
+        self.conn = sqlite3.connect(f"{self.db_path.resolve().as_uri()}?mode=ro", uri=True,
+                                    check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        version = self.conn.execute(
+            "SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+        if not version or int(version[0]) != SCHEMA_VERSION:
+            self.conn.close()
+            raise ValueError(f"Unsupported catalog schema in {self.db_path}")
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Languages and categories
+    # ------------------------------------------------------------------
+
+    def languages(self) -> List[str]:
+        return [row[0] for row in self.conn.execute(
+            "SELECT language FROM languages ORDER BY rowid")]
+
+    def language_metadata(self, language: str) -> Optional[Dict]:
+        row = self.conn.execute(
+            "SELECT metadata FROM languages WHERE language = ?", (language,)).fetchone()
+        return json.loads(row[0]) if row and row[0] else None
+
+    def categories(self) -> List[str]:
+        return [row[0] for row in self.conn.execute(
+            "SELECT category FROM phrases GROUP BY category ORDER BY min(ordinal)")]
+
+    def phrases(self) -> List[Dict]:
+        """Every phrase's ID, category and English text, in catalog order."""
+        return [{'phrase_id': r[0], 'category': r[1], 'english': r[2]}
+                for r in self.conn.execute(
+                    "SELECT phrase_id, category, english FROM phrases ORDER BY ordinal")]
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def find_phrase(self, category: str, english: str) -> Optional[int]:
+        """Phrase ID for (category, english), via the (category, english) index."""
+        row = self.conn.execute(
+            "SELECT phrase_id FROM phrases WHERE category = ? AND english = ?",
+            (category, english)).fetchone()
+        return row[0] if row else None
+
+    def find_english(self, english: str) -> List[int]:
+        """Phrase IDs with this English text in any category, via the (english) index."""
+        return [row[0] for row in self.conn.execute(
+            "SELECT phrase_id FROM phrases WHERE english = ? ORDER BY ordinal", (english,))]
+
+    def translation(self, language: str, phrase_id: int) -> Optional[Dict]:
+        """``{'text', 'phonetic'}`` for one phrase, via the (language, phrase_id) key."""
+        row = self.conn.execute(
+            "SELECT text, phonetic FROM translations WHERE language = ? AND phrase_id = ?",
+            (language, phrase_id)).fetchone()
+        return {'text': row[0], 'phonetic': row[1]} if row else None
+
+    def phrase(self, phrase_id: int, languages: Optional[List[str]] = None) -> Optional[Dict]:
+        """A phrase in the catalog's own shape (english, <lang>, <lang>_phonetic)."""
+        row = self.conn.execute(
+            "SELECT english FROM phrases WHERE phrase_id = ?", (phrase_id,)).fetchone()
+        if row is None:
+            return None
+        phrase = {'english': row[0]}
+        query = "SELECT language, text, phonetic FROM translations WHERE phrase_id = ?"
+        for language, text, phonetic in self.conn.execute(query, (phrase_id,)):
+            if language == 'english' or (languages and language not in languages):
+                continue
+            phrase[language] = text
+            if phonetic is not None:
+                phrase[language + PHONETIC_SUFFIX] = phonetic
+        return phrase
+
+    def translate(self, english: str, source: str, target: str,
+                  category: Optional[str] = None) -> Optional[Dict]:
+        """
+        Source and target text of a phrase. Without ``category`` the first
+        phrase with this English text is used.
+        """
+        if category is not None:
+            phrase_id = self.find_phrase(category, english)
+        else:
+            ids = self.find_english(english)
+            phrase_id = ids[0] if ids else None
+        if phrase_id is None:
+            return None
+
+        result = {'phrase_id': phrase_id, 'english': english}
+        for role, language in (('source', source), ('target', target)):
+            found = self.translation(language, phrase_id) or {'text': None, 'phonetic': None}
+            result[role] = {'language': language, **found}
+        return result
+
+    def category_phrases(self, language: str, category: str) -> List[Dict]:
+        """Phrases of a category (in file order) with english, text and phonetic."""
+        rows = self.conn.execute(
+            "SELECT p.phrase_id, p.english, t.text, t.phonetic "
+            "FROM phrases p LEFT JOIN translations t "
+            "ON t.language = ? AND t.phrase_id = p.phrase_id "
+            "WHERE p.category = ? ORDER BY p.position", (language, category))
+        return [{'phrase_id': r[0], 'english': r[1], 'text': r[2], 'phonetic': r[3]}
+                for r in rows]
+
+    def missing(self, language: str, category: Optional[str] = None) -> List[Dict]:
+        """Phrases without a translation in ``language``."""
+        query = ("SELECT p.phrase_id, p.category, p.english FROM phrases p "
+                 "WHERE NOT EXISTS (SELECT 1 FROM translations t "
+                 "WHERE t.language = ? AND t.phrase_id = p.phrase_id)")
+        params = [language]
+        if category is not None:
+            query += " AND p.category = ?"
+            params.append(category)
+        return [{'phrase_id': r[0], 'category': r[1], 'english': r[2]}
+                for r in self.conn.execute(query + " ORDER BY p.ordinal", params)]
+
+    def coverage(self) -> Dict[str, Dict[str, int]]:
+        """``{language: {'translated': n, 'total': n}}`` over all phrases."""
+        total = self.conn.execute("SELECT count(*) FROM phrases").fetchone()[0]
+        return {language: {'translated': count, 'total': total}
+                for language, count in self.conn.execute(
+                    "SELECT l.language, count(t.phrase_id) FROM languages l "
+                    "LEFT JOIN translations t ON t.language = l.language "
+                    "GROUP BY l.language ORDER BY l.rowid")}
+
+    def category_coverage(self) -> Dict[str, Dict]:
+        """
+        ``{category: {'total': n, 'translated': {language: n}, 'phonetic': {language: n}}}``
+        in catalog order, from one grouped query.
+        """
+        result = {category: {'total': total, 'translated': {}, 'phonetic': {}}
+                  for category, total in self.conn.execute(
+                      "SELECT category, count(*) FROM phrases "
+                      "GROUP BY category ORDER BY min(ordinal)")}
+        for category, language, translated, phonetic in self.conn.execute(
+                "SELECT p.category, t.language, count(*), count(t.phonetic) "
+                "FROM translations t JOIN phrases p ON p.phrase_id = t.phrase_id "
+                "GROUP BY p.category, t.language"):
+            result[category]['translated'][language] = translated
+            if phonetic:
+                result[category]['phonetic'][language] = phonetic
+        return result
+
+    # ------------------------------------------------------------------
+    # Full-text search
+    # ------------------------------------------------------------------
+
+    def search(self, query: str, language: Optional[str] = None, limit: int = 20) -> List[Dict]:
+        """
+        Ranked full-text search over translations and phonetics (FTS5, bm25).
+        Each word of ``query`` is matched as a prefix.
+        """
+        terms = ['"{}"*'.format(word.replace('"', '""')) for word in query.split()]
+        if not terms:
+            return []
+        sql = ("SELECT f.phrase_id, f.language, f.text, f.phonetic, p.category, p.english, "
+               "bm25(translations_fts) AS rank "
+               "FROM translations_fts f JOIN phrases p ON p.phrase_id = f.phrase_id "
+               "WHERE translations_fts MATCH ?")
+        params: list = [' '.join(terms)]
+        if language is not None:
+            sql += " AND f.language = ?"
+            params.append(language)
+        sql += " ORDER BY rank LIMIT ?"
+        params.append(limit)
+        return [{'phrase_id': r[0], 'language': r[1], 'text': r[2], 'phonetic': r[3] or None,
+                 'category': r[4], 'english': r[5], 'score': -r[6]}
+                for r in self.conn.execute(sql, params)]
@@ -0,0 +1,318 @@
+"""
+Columnar, memory-mapped form of the unified translation catalog.
+
+``all_languages.json`` is parsed in full by every consumer. The columnar
+file stores the same phrases as:
+
+- a row table: phrases are grouped by category, so each category is a
+  contiguous ``[start, end)`` range of rows;
+- a uint32 array with the phrase ID of every row, from the registry the
+  other exports key on (translations/phrase_ids.jsonl);
+- one string column per field (english, each language, and each
+  ``*_phonetic`` field kept as a separate column), each a uint32 offset
+  array (rows + 1 entries) followed by the UTF-8 bytes of all values;
+- the language metadata (ui, categoryNames, ...) as one JSON blob that is
+  only decoded when asked for.
+
+Layout (all integers little-endian):
+
+    b'PHRCOL01' | uint32 header length | header JSON | sections...
+
+The header lists categories, columns and the byte offset of every section.
+The reader memory-maps the file and decodes a string only when it is
+accessed, so opening the catalog and reading one category of one language
+touches a few pages regardless of how many languages the file holds.
+Missing values are stored as empty strings.
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from translation_tools.alignment import PhraseIds
+
+MAGIC = b'PHRCOL01'
+FORMAT_VERSION = 2
+_ALIGN = 8
+# Row ID of a phrase without an English text (never in the registry)
+NO_ID = 0xFFFFFFFF
+
+PHONETIC_SUFFIX = '_phonetic'
+
+
+def _u32_bytes(offsets: array) -> bytes:
+    if sys.byteorder != 'little':
+        offsets = array('I', offsets)
+        offsets.byteswap()
+    return offsets.tobytes()
+
+
+def _pad(length: int) -> int:
+    return (-length) % _ALIGN
+
+
+def write_columnar(catalog: Dict, path, fields: Optional[Sequence[str]] = None,
+                   ids: Optional[PhraseIds] = None) -> Path:
+    """
+    Write a unified catalog (``{<lang>: metadata, ..., 'categories': {...}}``)
+    to ``path`` in the columnar format. ``fields`` defaults to every field
+    found on any phrase; phrase IDs come from ``ids`` (default: the
+    registry, read-only). Returns the path written.
+    """
+    path = Path(path)
+    ids = ids if ids is not None else PhraseIds.load()
+    categories = catalog.get('categories', {})
+
+    if fields is None:
+        seen = {}
+        for phrases in categories.values():
+            for phrase in phrases:
+                for field in phrase:
+                    seen.setdefault(field, None)
+        fields = list(seen)
+    if 'english' not in fields:
+        fields = ['english'] + list(fields)
+
+    # Row table: categories in order, phrases contiguous per category
+    category_ranges = []
+    rows = []
+    row_ids = array('I')
+    for name, phrases in categories.items():
+        start = len(rows)
+        for phrase in phrases:
+            english = phrase.get('english')
+            rows.append(phrase)
+            row_ids.append(ids.assign(name, english) if isinstance(english, str) else NO_ID)
+        category_ranges.append([name, start, len(rows)])
+    ids_blob = _u32_bytes(row_ids)
+
+    sections = []
+    columns = []
+    for field in fields:
+        offsets = array('I', [0])
+        blob = bytearray()
+        for phrase in rows:
+            value = phrase.get(field)
+            if isinstance(value, str) and value:
+                blob += value.encode('utf-8')
+            offsets.append(len(blob))
+        columns.append({
+            'field': field,
+            'kind': 'phonetic' if field.endswith(PHONETIC_SUFFIX) else 'text',
+        })
+        sections.append((_u32_bytes(offsets), bytes(blob)))
+
+    metadata = {key: value for key, value in catalog.items() if key != 'categories'}
+    metadata_blob = json.dumps(metadata, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    def header_bytes(base: int) -> bytes:
+        # Section offsets depend on the header length, so lay out relative to ``base``
+        position = base
+        ids_at = position
+        position += len(ids_blob) + _pad(len(ids_blob))
+        for column, (offsets_blob, data_blob) in zip(columns, sections):
+            column['offsets'] = position
+            position += len(offsets_blob) + _pad(len(offsets_blob))
+            column['data'] = position
+            column['size'] = len(data_blob)
+            position += len(data_blob) + _pad(len(data_blob))
+        header = {
+            'version': FORMAT_VERSION,
+            'phrases': len(rows),
+            'categories': category_ranges,
+            'ids': ids_at,
+            'columns': columns,
+            'metadata': [position, len(metadata_blob)],
+        }
+        return json.dumps(header, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    # Iterate until the header length (which shifts every offset) is stable
+    header_len = 0
+    while True:
+        base = len(MAGIC) + 4 + header_len
+        base += _pad(base)
+        header = header_bytes(base)
+        if len(header) == header_len:
+            break
+        header_len = len(header)
+
+    tmp_file = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp_file, 'wb') as f:
+        f.write(MAGIC)
+        f.write(struct.pack('<I', len(header)))
+        f.write(header)
+        f.write(b'\0' * _pad(len(MAGIC) + 4 + len(header)))
+        f.write(ids_blob)
+        f.write(b'\0' * _pad(len(ids_blob)))
+        for offsets_blob, data_blob in sections:
+            f.write(offsets_blob)
+            f.write(b'\0' * _pad(len(offsets_blob)))
+            f.write(data_blob)
+            f.write(b'\0' * _pad(len(data_blob)))
+        f.write(metadata_blob)
+    os.replace(tmp_file, path)
+    return path
+
+
+def _u32_view(buffer: memoryview, at: int, count: int):
+    """``count`` uint32 values at ``at``, without copying on little-endian hosts."""
+    raw = buffer[at:at + 4 * count]
+    if sys.byteorder == 'little':
+        return raw.cast('I')
+    values = array('I', raw.tobytes())
+    values.byteswap()
+    return values
+
+
+class StringColumn:
+    """One field's values; strings are decoded from the mapping on access."""
+
+    def __init__(self, buffer: memoryview, offsets_at: int, data_at: int, count: int):
+        self.offsets = _u32_view(buffer, offsets_at, count + 1)
+        self.buffer = buffer
+        self.data_at = data_at
+        self.count = count
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, row: int) -> str:
+        if not 0 <= row < self.count:
+            raise IndexError(row)
+        start = self.data_at + self.offsets[row]
+        end = self.data_at + self.offsets[row + 1]
+        return str(self.buffer[start:end], 'utf-8')
+
+    def slice(self, start: int, end: int) -> List[str]:
+        """Decode the values of rows ``start``..``end - 1``."""
+        offsets, buffer, base = self.offsets, self.buffer, self.data_at
+        return [str(buffer[base + offsets[i]:base + offsets[i + 1]], 'utf-8')
+                for i in range(start, end)]
+
+
+class ColumnarCatalog:
+    """
+    Read-only view of a columnar catalog file.
+
+        catalog = ColumnarCatalog('translations/all_languages.col')
+        catalog.category('amharic', 'basics')
+        # [{'english': ..., 'amharic': ..., 'amharic_phonetic': ...}, ...]
+        catalog.get('amharic', phrase_id)   # phrase_id from phrase_ids.jsonl
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buffer = memoryview(self._mmap)
+
+        if bytes(self._buffer[:len(MAGIC)]) != MAGIC:
+            self.close()
+            raise ValueError(f"{self.path} is not a columnar catalog")
+        (header_len,) = struct.unpack_from('<I', self._mmap, len(MAGIC))
+        start = len(MAGIC) + 4
+        header = json.loads(str(self._buffer[start:start + header_len], 'utf-8'))
+        if header.get('version') != FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"Unsupported columnar catalog version in {self.path}")
+
+        self.phrase_count: int = header['phrases']
+        self.category_ranges: Dict[str, Tuple[int, int]] = {
+            name: (start, end) for name, start, end in header['categories']
+        }
+        self.row_ids = _u32_view(self._buffer, header['ids'], self.phrase_count)
+        self._rows_by_id: Optional[Dict[int, int]] = None
+        self._column_info = {column['field']: column for column in header['columns']}
+        self._columns: Dict[str, StringColumn] = {}
+        self._metadata_at = header['metadata']
+        self._metadata = None
+
+    def close(self):
+        """Release the mapping (every column view must be released first)."""
+        for column in getattr(self, '_columns', {}).values():
+            if isinstance(column.offsets, memoryview):
+                column.offsets.release()
+        self._columns = {}
+        if isinstance(getattr(self, 'row_ids', None), memoryview):
+            self.row_ids.release()
+        self._buffer.release()
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return self.phrase_count
+
+    @property
+    def fields(self) -> List[str]:
+        return list(self._column_info)
+
+    @property
+    def categories(self) -> List[str]:
+        return list(self.category_ranges)
+
+    def languages(self) -> List[str]:
+        """Language fields (text columns other than english)."""
+        return [field for field, info in self._column_info.items()
+                if info['kind'] == 'text' and field != 'english']
+
+    def column(self, field: str) -> StringColumn:
+        column = self._columns.get(field)
+        if column is None:
+            info = self._column_info.get(field)
+            if info is None:
+                raise KeyError(f"No column '{field}' in {self.path}")
+            column = StringColumn(self._buffer, info['offsets'], info['data'], self.phrase_count)
+            self._columns[field] = column
+        return column
+
+    def has_field(self, field: str) -> bool:
+        return field in self._column_info
+
+    def phrase_ids(self, category: str) -> List[int]:
+        """Registry phrase IDs of a category, in catalog order."""
+        start, end = self.category_ranges[category]
+        return list(self.row_ids[start:end])
+
+    def row(self, phrase_id: int) -> int:
+        """Row holding a registry phrase ID (KeyError if the catalog lacks it)."""
+        if self._rows_by_id is None:
+            rows_by_id = {}
+            for row, row_id in enumerate(self.row_ids):
+                rows_by_id.setdefault(row_id, row)
+            self._rows_by_id = rows_by_id
+        return self._rows_by_id[phrase_id]
+
+    def category(self, language: str, category: str) -> List[Dict[str, str]]:
+        """Phrases of one category with english, the language and its phonetic field."""
+        start, end = self.category_ranges[category]
+        fields = ['english', language]
+        if self.has_field(language + PHONETIC_SUFFIX):
+            fields.append(language + PHONETIC_SUFFIX)
+        values = [self.column(field).slice(start, end) for field in fields]
+        return [dict(zip(fields, row)) for row in zip(*values)]
+
+    def get(self, field: str, phrase_id: int) -> str:
+        return self.column(field)[self.row(phrase_id)]
+
+    def iter_field(self, field: str) -> Iterator[Tuple[int, str]]:
+        """(phrase ID, value) of every row, in catalog order."""
+        column = self.column(field)
+        for row, phrase_id in enumerate(self.row_ids):
+            yield phrase_id, column[row]
+
+    def metadata(self, language: Optional[str] = None) -> Dict:
+        """Language metadata (ui, categoryNames, ...), decoded on first use."""
+        if self._metadata is None:
+            start, length = self._metadata_at
+            self._metadata = json.loads(str(self._buffer[start:start + length], 'utf-8'))
+        return self._metadata if language is None else self._metadata[language]
@@ -0,0 +1,196 @@
+"""
+Compact serializations of catalog files for shipping to the web tier.
+
+The committed files are indented JSON and repeat every field name
+(``amharic_phonetic``, ...) on every phrase. Two compact forms are written
+from the same streamed input:
+
+``min``   the same document minified (``CatalogWriter(indent=None)``); any
+          JSON consumer reads it unchanged.
+``rows``  field names interned in a schema header, each phrase a row array
+          in header order (absent fields are ``null``, trailing ones dropped):
+
+              {"format": "rows", "version": 1,
+               "fields": ["english", "spanish", "amharic", ...],
+               "language": "...", "ui": {...},
+               "categories": {"basics": [["hello", "hola", "ሰላም", ...], ...]}}
+
+          ``expand_rows`` turns it back into the phrase-dict shape.
+
+Each output gets precompressed ``.gz`` and (when the optional ``brotli``
+package is installed) ``.br`` siblings, so a server can send the encoded
+bytes directly with ``Content-Encoding``. Compression is deterministic
+(gzip mtime 0), so unchanged input gives byte-identical artifacts.
+
+    python -m translation_tools.compact translations/all_languages.json
+    python -m translation_tools.compact --rows translations/somali.json
+"""
+
+import argparse
+import gzip
+import os
+from pathlib import Path
+from typing import Dict, List
+
+from translation_tools.streaming import CatalogWriter, iter_events, iter_phrases
+
+try:
+    import brotli
+except ImportError:  # optional: pip install brotli
+    brotli = None
+
+ROOT = Path(__file__).resolve().parent.parent
+# Outside translations/*.json, which the language-file scripts glob
+DEFAULT_OUT_DIR = ROOT / 'translations' / 'build'
+
+ROWS_FORMAT = 'rows'
+ROWS_VERSION = 1
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+
+def collect_fields(path) -> List[str]:
+    """Phrase field names of a catalog, in first-seen order."""
+    fields: Dict[str, None] = {}
+    for _, phrase in iter_phrases(path):
+        for field in phrase:
+            fields.setdefault(field, None)
+    return list(fields)
+
+
+def to_row(phrase: Dict, fields: List[str]) -> List:
+    row = [phrase.get(field) for field in fields]
+    while row and row[-1] is None:
+        row.pop()
+    return row
+
+
+def write_min(source, dest) -> Path:
+    """Minified copy of a catalog file."""
+    with CatalogWriter(dest, indent=None) as writer:
+        for kind, name, item in iter_events(source):
+            if kind == 'meta':
+                writer.write_meta(name, item)
+            elif kind == 'categories':
+                writer.begin_categories()
+            elif kind == 'category':
+                writer.begin_category(name)
+            else:
+                writer.write_phrase(name, item)
+    return Path(dest)
+
+
+def write_rows(source, dest) -> Path:
+    """Schema-header/row-array copy of a catalog file."""
+    fields = collect_fields(source)
+    with CatalogWriter(dest, indent=None) as writer:
+        writer.write_meta('format', ROWS_FORMAT)
+        writer.write_meta('version', ROWS_VERSION)
+        writer.write_meta('fields', fields)
+        for kind, name, item in iter_events(source):
+            if kind == 'meta':
+                writer.write_meta(name, item)
+            elif kind == 'categories':
+                writer.begin_categories()
+            elif kind == 'category':
+                writer.begin_category(name)
+            else:
+                writer.write_phrase(name, to_row(item, fields))
+    return Path(dest)
+
+
+def expand_rows(data: Dict) -> Dict:
+    """Parsed ``rows`` document -> the usual ``{'categories': {name: [phrase, ...]}}`` dict."""
+    if data.get('format') != ROWS_FORMAT or data.get('version') != ROWS_VERSION:
+        raise ValueError(f"Not a version {ROWS_VERSION} '{ROWS_FORMAT}' document")
+    fields = data['fields']
+    expanded = {}
+    for key, value in data.items():
+        if key in ('format', 'version', 'fields'):
+            continue
+        if key != 'categories':
+            expanded[key] = value
+            continue
+        expanded[key] = {
+            category: [{field: item for field, item in zip(fields, row) if item is not None}
+                       for row in rows]
+            for category, rows in value.items()
+        }
+    return expanded
+
+
+def _write_bytes(path: Path, payload: bytes):
+    tmp_file = path.with_name(path.name + '.tmp')
+    with open(tmp_file, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_file, path)
+
+
+def write_compressed(path) -> List[Path]:
+    """Write ``<path>.gz`` and, if brotli is available, ``<path>.br``; returns them."""
+    path = Path(path)
+    raw = path.read_bytes()
+    gz_file = path.with_name(path.name + '.gz')
+    _write_bytes(gz_file, gzip.compress(raw, compresslevel=GZIP_LEVEL, mtime=0))
+    written = [gz_file]
+
+    br_file = path.with_name(path.name + '.br')
+    if brotli is not None:
+        _write_bytes(br_file, brotli.compress(raw, quality=BROTLI_QUALITY))
+        written.append(br_file)
+    elif br_file.exists():
+        br_file.unlink()  # would be stale
+    return written
+
+
+def compact_outputs(source, out_dir, rows: bool = True) -> List[Path]:
+    """
+    Write ``<stem>.min.json`` (and ``<stem>.rows.json``) for ``source`` into
+    ``out_dir``, each with its compressed siblings; returns every file written.
+    """
+    source = Path(source)
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    written = []
+    writers = [('min', write_min)] + ([('rows', write_rows)] if rows else [])
+    for suffix, write in writers:
+        dest = write(source, out_dir / f'{source.stem}.{suffix}.json')
+        written += [dest] + write_compressed(dest)
+    return written
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Write minified/row-format catalogs with gzip and brotli siblings")
+    parser.add_argument(
+        "files",
+        nargs="+",
+        help="Catalog or language files to compact"
+    )
+    parser.add_argument(
+        "--out",
+        default=str(DEFAULT_OUT_DIR),
+        help="Output directory (default: translations/build)"
+    )
+    parser.add_argument(
+        "--rows",
+        action="store_true",
+        help="Also write the row-array form with interned field names"
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if brotli is None:
+        print("⚠️  brotli not installed; writing .gz only")
+    for name in args.files:
+        source = Path(name)
+        original = source.stat().st_size
+        print(f"📦 {source} ({original:,} bytes)")
+        for path in compact_outputs(source, args.out, rows=args.rows):
+            size = path.stat().st_size
+            print(f"   {path.name:40} {size:>10,} bytes  {original / size:5.1f}x smaller")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+"""
+Shared driver for the per-language completion scripts.
+
+complete_all_languages.py, complete_new_languages.py and
+expand_translations.py each fill a set of language files from one
+reference file. ``run_languages`` parses the reference once, hands it to
+each worker of a process pool once (as the pool initializer's argument,
+not once per task) and runs the script's per-language function there:
+
+    results = run_languages(complete_language, NEW_LANGUAGES,
+                            reference_file='translations/spanish.json')
+
+Each language's printed output is captured in its worker and replayed in
+the order the languages were given, so the log and the returned results
+are the same as a sequential run. ``save_json`` writes through a temporary
+file and ``os.replace``, so an interrupted run leaves either the old or the
+new file, never half of one.
+"""
+
+import contextlib
+import io
+import json
+import os
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+_reference = None
+
+
+def load_json(filepath):
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_json(filepath, data):
+    """Write ``data`` as indented UTF-8 JSON, atomically."""
+    path = Path(filepath)
+    tmp_file = path.with_name(path.name + '.tmp')
+    try:
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, path)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+
+
+def _init_worker(reference):
+    global _reference
+    _reference = reference
+
+
+def _run_one(task, language):
+    """Run ``task(language, reference)``; returns (result, output, error)."""
+    output = io.StringIO()
+    result = error = None
+    with contextlib.redirect_stdout(output):
+        try:
+            result = task(language, _reference)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            traceback.print_exc(file=output)
+    return result, output.getvalue(), error
+
+
+def run_languages(task: Callable, languages: Iterable[str], reference=None,
+                  reference_file=None, jobs: Optional[int] = None) -> List[Dict]:
+    """
+    Run ``task(language, reference)`` for every language in a process pool.
+
+    ``reference`` (or the parsed ``reference_file``) is loaded once in this
+    process. ``task`` must be a module-level function. Returns one
+    ``{'language', 'result', 'error'}`` dict per language, in input order;
+    a failing language is reported and does not stop the others.
+    """
+    languages = list(languages)
+    if reference is None and reference_file is not None:
+        reference = load_json(reference_file)
+
+    results = []
+
+    def report(language, outcome):
+        result, output, error = outcome
+        print(output, end='', flush=True)
+        if error:
+            print(f"\n❌ Error processing {language}: {error}")
+        results.append({'language': language, 'result': result, 'error': error})
+
+    if jobs == 1 or len(languages) < 2:
+        _init_worker(reference)
+        for language in languages:
+            report(language, _run_one(task, language))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                 initargs=(reference,)) as pool:
+            # map() yields in submission order, so output is replayed in language order
+            outcomes = pool.map(_run_one, [task] * len(languages), languages)
+            for language, outcome in zip(languages, outcomes):
+                report(language, outcome)
+    return results
@@ -0,0 +1,196 @@
+"""
+Compile contextual_conversations/ into one preindexed conversation store.
+
+server.js used to read and parse ``index.json`` or a conversation file
+on every conversation request. This module compiles ``index.json``, every
+``multilanguage_<context>.json`` and the older ``<context>_<language>.json``
+files into ``translations/build/conversations.json``. The server keeps it
+resident, answers each route with a lookup and reloads it when it
+changes:
+
+    index          index.json as-is                 /api/conversations
+    by_context     context -> index entries         /api/conversations/context/:context
+    by_language    language -> index entries        /api/conversations/language/:language
+    contexts       context -> multi-language file   /api/conversation/:context
+    conversations  context -> language -> single-language conversation
+                                                    /api/conversations/:context/:language
+    etags          route path -> SHA-256 of that response
+    sources        contextual_conversations/<file>.json -> {sha256, size, mtime_ns}
+                   of every file it was compiled from (as in api_manifest.py)
+
+server.js checks ``sources`` against contextual_conversations/ when it
+loads the store and whenever a file there changes; while they differ it
+serves the files directly, so an edit is never answered from a stale
+store.
+
+``conversations`` holds the ``<context>_<language>.json`` files and, for
+every other language of a multi-language file, a projection in the same
+single-language shape (``{"conversation_title": "...", "stages": [{"stage":
+"...", "exchanges": [{"speaker": ..., "<language>": ..., "phonetic": ...}]}]}``).
+
+    python -m translation_tools.conversations
+"""
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import Dict, List
+
+from translation_tools.api_manifest import file_entry
+
+ROOT = Path(__file__).resolve().parent.parent
+CONVERSATIONS_DIR = ROOT / 'contextual_conversations'
+STORE_FILE = ROOT / 'translations' / 'build' / 'conversations.json'
+STORE_VERSION = 2
+
+MULTILANGUAGE_PREFIX = 'multilanguage_'
+PHONETIC_SUFFIXES = ('_phonetic', '_pinyin')
+_SINGLE_FILE = re.compile(r'^([a-z_]+?)_([a-z]+)\.json$')
+
+
+def _dumps(value) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+def _etag(value) -> str:
+    return hashlib.sha256(_dumps(value).encode('utf-8')).hexdigest()
+
+
+def _load(path: Path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def index_entries(index: Dict) -> List[Dict]:
+    """Conversation entries of index.json (``contexts`` now, ``conversations`` formerly)."""
+    return index.get('conversations') or index.get('contexts') or []
+
+
+def entry_context(entry: Dict):
+    return entry.get('context', entry.get('context_id'))
+
+
+def entry_languages(entry: Dict) -> List[str]:
+    if 'language' in entry:
+        return [entry['language']]
+    return entry.get('available_languages', [])
+
+
+def conversation_languages(conversation: Dict) -> List[str]:
+    """Languages of a multi-language conversation (the keys of its title)."""
+    title = conversation.get('conversation_title', {})
+    return [key for key in title if not key.endswith(PHONETIC_SUFFIXES)]
+
+
+def project(value, language: str, languages: List[str]):
+    """
+    One language's view of a multi-language value: ``{lang: text, ...}`` dicts
+    become the text (English when the language is missing), dicts that also
+    carry other keys (exchanges) keep those keys plus ``language`` and
+    ``phonetic``.
+    """
+    if isinstance(value, list):
+        return [project(item, language, languages) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if 'english' not in value:
+        return {key: project(item, language, languages) for key, item in value.items()}
+
+    localized = {key for key in value
+                 if key in languages or key.endswith(PHONETIC_SUFFIXES)}
+    text = value.get(language, value['english'])
+    if len(localized) == len(value):
+        return text
+
+    projected = {key: project(item, language, languages)
+                 for key, item in value.items() if key not in localized}
+    projected[language] = text
+    for suffix in PHONETIC_SUFFIXES:
+        if value.get(language + suffix):
+            projected['phonetic'] = value[language + suffix]
+            break
+    return projected
+
+
+def compile_store(conversations_dir: Path = CONVERSATIONS_DIR) -> Dict:
+    """Build the store dict from the conversation files."""
+    conversations_dir = Path(conversations_dir)
+    index = _load(conversations_dir / 'index.json')
+    entries = index_entries(index)
+    sources = {}
+
+    by_context: Dict[str, List[Dict]] = {}
+    by_language: Dict[str, List[Dict]] = {}
+    for entry in entries:
+        by_context.setdefault(entry_context(entry), []).append(entry)
+        for language in entry_languages(entry):
+            by_language.setdefault(language, []).append(entry)
+
+    contexts: Dict[str, Dict] = {}
+    conversations: Dict[str, Dict[str, Dict]] = {}
+    for path in sorted(conversations_dir.glob('*.json')):
+        sources[f'{conversations_dir.name}/{path.name}'] = file_entry(path)
+        if path.name == 'index.json':
+            continue
+        if path.name.startswith(MULTILANGUAGE_PREFIX):
+            context = path.stem[len(MULTILANGUAGE_PREFIX):]
+            contexts[context] = _load(path)
+            continue
+        match = _SINGLE_FILE.match(path.name)
+        if match:
+            context, language = match.groups()
+            conversations.setdefault(context, {})[language] = _load(path)
+
+    # Single-language files win over projections, as the file route did
+    for context, conversation in contexts.items():
+        languages = conversation_languages(conversation)
+        projections = conversations.setdefault(context, {})
+        for language in languages:
+            projections.setdefault(language, project(conversation, language, languages))
+
+    etags = {'/api/conversations': _etag(index)}
+    for context, matching in by_context.items():
+        etags[f'/api/conversations/context/{context}'] = _etag({'conversations': matching})
+    for language, matching in by_language.items():
+        etags[f'/api/conversations/language/{language}'] = _etag({'conversations': matching})
+    for context, conversation in contexts.items():
+        etags[f'/api/conversation/{context}'] = _etag(conversation)
+    for context, languages in conversations.items():
+        for language, conversation in languages.items():
+            etags[f'/api/conversations/{context}/{language}'] = _etag(conversation)
+
+    return {
+        'version': STORE_VERSION,
+        'index': index,
+        'by_context': by_context,
+        'by_language': by_language,
+        'contexts': contexts,
+        'conversations': conversations,
+        'etags': etags,
+        'sources': sources,
+    }
+
+
+def write_store(store: Dict, path: Path = STORE_FILE) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = path.with_suffix('.tmp')
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        f.write(_dumps(store))
+    os.replace(tmp_file, path)
+    return path
+
+
+def main():
+    store = compile_store()
+    path = write_store(store)
+    count = sum(len(languages) for languages in store['conversations'].values())
+    print(f"✅ {len(store['contexts'])} contexts, {count} single-language conversations, "
+          f"{len(store['etags'])} responses -> {path.relative_to(ROOT)} "
+          f"({path.stat().st_size:,} bytes)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,256 @@
+"""
+Translation coverage statistics shared by calculate_stats.py, check_empty.py
+and final_report.py.
+
+Each language file is read once (streamed one category at a time) and
+reduced to a language x category x field matrix of filled counts:
+
+    {'native_field': 'amharic',
+     'categories': {'greetings': {'total': 12, 'filled': {'amharic': 12, ...}}},
+     'missing_native': [['greetings', 'Good night'], ...]}
+
+A value counts as filled when it is a non-blank string. The native field
+is the file's ``nativeLanguageField`` when phrases actually use it,
+otherwise the field named after the file (hadiyaa.json declares "hadiya"
+but its phrases use "hadiyaa").
+
+Per-file results are cached in .coverage_cache.json keyed by the file's
+SHA-256 (size and mtime are stored too so unchanged files are not
+re-hashed); editing one language file recomputes only that file.
+
+The reports read the language files by default because they audit those
+files: which file lacks its native text, which other-language copies it
+carries, whether all files have the same phrases. The unified catalog is
+merged from them and cannot show any of that. ``catalog_coverage`` builds
+the same matrix for the catalog itself from the SQLite export
+(catalog.py), one entry per catalog language, with grouped queries
+instead of reading any JSON (``--catalog`` in the reports).
+"""
+
+import hashlib
+import json
+import os
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from translation_tools.catalog import DEFAULT_DB, PhraseCatalog
+from translation_tools.streaming import iter_events
+
+ROOT = Path(__file__).resolve().parent.parent
+TRANSLATIONS_DIR = ROOT / 'translations'
+DEFAULT_CACHE_FILE = ROOT / '.coverage_cache.json'
+CACHE_VERSION = 1
+
+PHONETIC_SUFFIX = '_phonetic'
+
+
+def language_files(translations_dir: Path = TRANSLATIONS_DIR) -> Dict[str, Path]:
+    """Every per-language file (the all_languages* catalogs excluded), by language."""
+    return {path.stem: path for path in sorted(Path(translations_dir).glob('*.json'))
+            if not path.stem.startswith('all_languages')}
+
+
+def select_files(languages: Iterable[str] = ()) -> Dict[str, Path]:
+    """Language files for the named languages (all of them when none are named)."""
+    files = language_files()
+    languages = list(languages)
+    unknown = [lang for lang in languages if lang not in files]
+    if unknown:
+        raise ValueError(f"No translations/<language>.json for: {', '.join(unknown)}")
+    return {lang: files[lang] for lang in languages} if languages else files
+
+
+def is_filled(value) -> bool:
+    return isinstance(value, str) and bool(value.strip())
+
+
+def compute_file_coverage(path, language: Optional[str] = None) -> Dict:
+    """Coverage counts for one file in a single streamed pass."""
+    path = Path(path)
+    language = language or path.stem
+    declared = None
+    categories: Dict[str, Dict] = {}
+    # (category, english, native-declared value, native-by-name value) per phrase
+    native_values: List[Tuple[str, str, bool, bool]] = []
+    current = None
+
+    for kind, name, value in iter_events(path):
+        if kind == 'meta':
+            if name == 'nativeLanguageField' and isinstance(value, str):
+                declared = value
+        elif kind == 'category':
+            current = categories[name] = {'total': 0, 'filled': Counter()}
+        elif kind == 'phrase':
+            if not isinstance(value, dict):
+                continue
+            current['total'] += 1
+            current['filled'].update(field for field, text in value.items() if is_filled(text))
+            native_values.append((name, value.get('english', ''),
+                                  is_filled(value.get(declared)) if declared else False,
+                                  is_filled(value.get(language))))
+
+    fields = set()
+    for stats in categories.values():
+        fields.update(stats['filled'])
+        stats['filled'] = dict(stats['filled'])
+
+    by_declared = declared is not None and (declared in fields or language not in fields)
+    native_field = declared if by_declared else (language if language in fields else None)
+    missing = []
+    if native_field is not None:
+        # Unified catalogs have no native field and nothing is reported missing
+        missing = [[category, english] for category, english, declared_ok, named_ok in native_values
+                   if not (declared_ok if by_declared else named_ok)]
+
+    return {'native_field': native_field, 'categories': categories, 'missing_native': missing}
+
+
+def _file_digest(path: Path, cached: Optional[Dict]) -> Tuple[str, int, int]:
+    stat = path.stat()
+    if cached and cached.get('size') == stat.st_size and cached.get('mtime_ns') == stat.st_mtime_ns:
+        return cached['sha256'], stat.st_size, stat.st_mtime_ns
+    sha = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            sha.update(chunk)
+    return sha.hexdigest(), stat.st_size, stat.st_mtime_ns
+
+
+def _load_cache(cache_file: Path) -> Dict:
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if cache.get('version') == CACHE_VERSION:
+            return cache
+    except (OSError, ValueError):
+        pass
+    return {'version': CACHE_VERSION, 'files': {}}
+
+
+def _save_cache(cache: Dict, cache_file: Path):
+    tmp_file = cache_file.with_suffix('.tmp')
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, ensure_ascii=False)
+    os.replace(tmp_file, cache_file)
+
+
+class CoverageMatrix:
+    """Filled counts per language file, category and field."""
+
+    def __init__(self, stats: Dict[str, Dict]):
+        self.stats = stats
+
+    @property
+    def languages(self) -> List[str]:
+        return list(self.stats)
+
+    def categories(self, language: str) -> List[str]:
+        return list(self.stats[language]['categories'])
+
+    def fields(self, language: Optional[str] = None, phonetic: bool = False) -> List[str]:
+        """
+        Language fields of one file, or of all files in first-seen order.
+        English is left out; ``phonetic=True`` lists the ``*_phonetic``
+        fields instead of the translations.
+        """
+        seen = {}
+        for lang in ([language] if language else self.stats):
+            for category in self.stats[lang]['categories'].values():
+                for field in category['filled']:
+                    seen.setdefault(field, None)
+        return [field for field in seen
+                if field != 'english' and field.endswith(PHONETIC_SUFFIX) == phonetic]
+
+    def native_field(self, language: str) -> Optional[str]:
+        return self.stats[language]['native_field']
+
+    def missing_native(self, language: str) -> List[Tuple[str, str]]:
+        """(category, english) of phrases without a native translation."""
+        return [tuple(entry) for entry in self.stats[language]['missing_native']]
+
+    def total(self, language: str, category: Optional[str] = None) -> int:
+        categories = self.stats[language]['categories']
+        if category is not None:
+            return categories[category]['total'] if category in categories else 0
+        return sum(stats['total'] for stats in categories.values())
+
+    def filled(self, language: str, field: str, category: Optional[str] = None) -> int:
+        categories = self.stats[language]['categories']
+        if category is not None:
+            return categories[category]['filled'].get(field, 0) if category in categories else 0
+        return sum(stats['filled'].get(field, 0) for stats in categories.values())
+
+    def percent(self, language: str, field: str, category: Optional[str] = None) -> float:
+        total = self.total(language, category)
+        return self.filled(language, field, category) / total * 100 if total else 0.0
+
+    def field_summary(self, field: str, languages: Optional[Iterable[str]] = None) -> Tuple[int, int]:
+        """(filled, total) for one field summed over language files."""
+        languages = list(languages or self.stats)
+        return (sum(self.filled(lang, field) for lang in languages),
+                sum(self.total(lang) for lang in languages))
+
+
+def load_coverage(files: Optional[Dict[str, Path]] = None,
+                  cache_file: Optional[Path] = DEFAULT_CACHE_FILE) -> CoverageMatrix:
+    """
+    Coverage of ``files`` ({language: path}, default every language file).
+    Unchanged files come from the cache; pass ``cache_file=None`` to skip it.
+    """
+    files = language_files() if files is None else files
+    cache = _load_cache(Path(cache_file)) if cache_file else {'files': {}}
+    dirty = False
+    stats = {}
+
+    for language, path in files.items():
+        path = Path(path)
+        key = path.resolve().as_posix()
+        cached = cache['files'].get(key)
+        digest, size, mtime_ns = _file_digest(path, cached)
+        if cached and cached['sha256'] == digest and cached['language'] == language:
+            stats[language] = cached['stats']
+            if (cached['size'], cached['mtime_ns']) != (size, mtime_ns):
+                cached.update(size=size, mtime_ns=mtime_ns)
+                dirty = True
+            continue
+        stats[language] = compute_file_coverage(path, language)
+        cache['files'][key] = {'language': language, 'sha256': digest, 'size': size,
+                               'mtime_ns': mtime_ns, 'stats': stats[language]}
+        dirty = True
+
+    if cache_file and dirty:
+        _save_cache(cache, Path(cache_file))
+    return CoverageMatrix(stats)
+
+
+def catalog_coverage(db_path: Path = DEFAULT_DB,
+                     languages: Iterable[str] = ()) -> CoverageMatrix:
+    """
+    Coverage of the unified catalog database: each language's own field and
+    its phonetic field per category, and its untranslated phrases.
+    """
+    with PhraseCatalog(db_path) as catalog:
+        known = [lang for lang in catalog.coverage() if lang != 'english']
+        languages = list(languages)
+        unknown = [lang for lang in languages if lang not in known]
+        if unknown:
+            raise ValueError(f"Not in {db_path}: {', '.join(unknown)}")
+        by_category = catalog.category_coverage()
+
+        stats = {}
+        for language in languages or known:
+            phonetic_field = language + PHONETIC_SUFFIX
+            categories = {}
+            for category, counts in by_category.items():
+                filled = {language: counts['translated'].get(language, 0)}
+                if language in counts['phonetic']:
+                    filled[phonetic_field] = counts['phonetic'][language]
+                categories[category] = {'total': counts['total'], 'filled': filled}
+            stats[language] = {
+                'native_field': language,
+                'categories': categories,
+                'missing_native': [[row['category'], row['english']]
+                                   for row in catalog.missing(language)],
+            }
+    return CoverageMatrix(stats)
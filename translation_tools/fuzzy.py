@@ -0,0 +1,250 @@
+"""
+Fuzzy matching of English phrase keys.
+
+Scripts join phrases across files by their ``english`` text, sometimes
+lowercased and sometimes not, so "thank you" and "Thank you!" end up as two
+phrases. Keys are first normalized (case, accents, punctuation and spacing
+removed); remaining near-duplicates are found with a symmetric-delete
+index: every key is stored under each variant obtained by deleting up to
+``max_distance`` characters, and a query looks up its own delete variants.
+Candidates are then verified with the (optimal string alignment) edit
+distance, so a lookup costs a few dictionary probes instead of a scan.
+
+The allowed distance grows with key length so short words such as "cat"
+and "hat" are never merged. Letter substitutions turn one real word into
+another ("donkey"/"monkey", "grandfather"/"grandmother") and a trailing
+"s" makes a plural ("finger"/"fingers"), so strict lookups - used for
+merging - only accept other insertions, deletions and transpositions
+("colour"/"color", "thnak you"/"thank you"). Loose lookups accept any edit
+and suit interactive search.
+"""
+
+import argparse
+import glob
+import json
+import re
+import unicodedata
+from typing import Dict, Generic, Iterable, List, Optional, Set, Tuple, TypeVar
+
+T = TypeVar('T')
+
+DEFAULT_MAX_DISTANCE = 2
+
+_PUNCTUATION = re.compile(r"[^\w\s]")
+
+
+def normalize_key(text: str) -> str:
+    """Case-, accent-, punctuation- and whitespace-insensitive form of an English key."""
+    text = unicodedata.normalize('NFKD', text)
+    text = ''.join(c for c in text if not unicodedata.combining(c)).casefold()
+    return ' '.join(_PUNCTUATION.sub(' ', text).split())
+
+
+def allowed_distance(key: str, max_distance: int = DEFAULT_MAX_DISTANCE) -> int:
+    """Edits tolerated for a key of this length: 0 up to 4 chars, 1 up to 10, then ``max_distance``."""
+    if len(key) <= 4:
+        return 0
+    if len(key) <= 10:
+        return min(1, max_distance)
+    return max_distance
+
+
+def edit_distance(a: str, b: str, limit: Optional[int] = None,
+                  substitution_cost: int = 1) -> int:
+    """
+    Optimal string alignment distance (insertions, deletions, substitutions
+    and adjacent transpositions). With ``substitution_cost=2`` a
+    substitution is never cheaper than a deletion plus an insertion. Stops
+    early once every path exceeds ``limit`` and returns ``limit + 1``.
+    """
+    if a == b:
+        return 0
+    if limit is not None and abs(len(a) - len(b)) > limit:
+        return limit + 1
+
+    previous2: List[int] = []
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i] + [0] * len(b)
+        for j, cb in enumerate(b, 1):
+            cost = 0 if ca == cb else substitution_cost
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and ca == b[j - 2] and a[i - 2] == cb:
+                value = min(value, previous2[j - 2] + 1)
+            current[j] = value
+        if limit is not None and min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return previous[-1]
+
+
+def _deletes(key: str, distance: int) -> Set[str]:
+    """``key`` and every string reachable by deleting up to ``distance`` characters."""
+    variants = {key}
+    frontier = {key}
+    for _ in range(distance):
+        next_frontier = set()
+        for variant in frontier:
+            for i in range(len(variant)):
+                next_frontier.add(variant[:i] + variant[i + 1:])
+        next_frontier -= variants
+        variants |= next_frontier
+        frontier = next_frontier
+    return variants
+
+
+def _plural_pair(a: str, b: str) -> bool:
+    """True if one key is the other with a trailing "s"/"es" on its last word."""
+    if len(a) > len(b):
+        a, b = b, a
+    return b.startswith(a) and b[len(a):] in ('s', 'es')
+
+
+class FuzzyIndex(Generic[T]):
+    """Symmetric-delete index from normalized English keys to values."""
+
+    def __init__(self, max_distance: int = DEFAULT_MAX_DISTANCE):
+        self.max_distance = max_distance
+        self.keys: List[str] = []
+        self.values: List[List[T]] = []
+        self._key_ids: Dict[str, int] = {}
+        self._deletes: Dict[str, List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def add(self, text: str, value: T) -> str:
+        """Index ``value`` under the normalized form of ``text``; returns the key."""
+        key = normalize_key(text)
+        key_id = self._key_ids.get(key)
+        if key_id is None:
+            key_id = len(self.keys)
+            self.keys.append(key)
+            self.values.append([])
+            self._key_ids[key] = key_id
+            for variant in _deletes(key, allowed_distance(key, self.max_distance)):
+                self._deletes.setdefault(variant, []).append(key_id)
+        self.values[key_id].append(value)
+        return key
+
+    def lookup(self, text: str, max_distance: Optional[int] = None,
+               strict: bool = False) -> List[Tuple[str, int, List[T]]]:
+        """
+        Keys within the allowed distance of ``text``, closest first:
+        ``[(key, distance, values), ...]``. With ``strict`` substitutions
+        and singular/plural pairs do not count as close.
+        """
+        query = normalize_key(text)
+        exact = self._key_ids.get(query)
+        limit = allowed_distance(query, self.max_distance if max_distance is None else max_distance)
+        if limit == 0:
+            return [(query, 0, list(self.values[exact]))] if exact is not None else []
+
+        candidates = set()
+        for variant in _deletes(query, limit):
+            candidates.update(self._deletes.get(variant, ()))
+
+        matches = []
+        for key_id in candidates:
+            key = self.keys[key_id]
+            # Both sides must tolerate the distance (short keys match exactly only)
+            key_limit = min(limit, allowed_distance(key, self.max_distance))
+            if strict and _plural_pair(query, key):
+                continue
+            distance = edit_distance(query, key, key_limit, 2 if strict else 1)
+            if distance <= key_limit:
+                matches.append((key, distance, list(self.values[key_id])))
+        matches.sort(key=lambda match: (match[1], match[0]))
+        return matches
+
+    def match(self, text: str, last: bool = False) -> Optional[T]:
+        """
+        Value to merge ``text`` with: the first value of the same normalized
+        key, else of the single closest key under a strict lookup. Ties
+        give None. With ``last`` the key's last value is used instead, as a
+        dict filled by assignment would hold.
+        """
+        matches = self.lookup(text, strict=True)
+        if not matches:
+            return None
+        if matches[0][1] > 0 and len(matches) > 1 and matches[1][1] == matches[0][1]:
+            return None
+        return matches[0][2][-1 if last else 0]
+
+    def near_duplicates(self, strict: bool = True) -> List[Tuple[str, str, int]]:
+        """Pairs of distinct indexed keys within the allowed distance of each other."""
+        pairs = set()
+        for key in self.keys:
+            for other, distance, _ in self.lookup(key, strict=strict):
+                if other != key:
+                    pairs.add((min(key, other), max(key, other), distance))
+        return sorted(pairs, key=lambda pair: (pair[2], pair[0], pair[1]))
+
+
+def build_phrase_index(phrases: Iterable[dict], max_distance: int = DEFAULT_MAX_DISTANCE) -> 'FuzzyIndex[int]':
+    """Fuzzy index from a phrase list's English keys to list positions."""
+    index: FuzzyIndex[int] = FuzzyIndex(max_distance)
+    for i, phrase in enumerate(phrases):
+        english = phrase.get('english')
+        if english:
+            index.add(english, i)
+    return index
+
+
+def find_duplicates(categories: Dict[str, List[dict]],
+                    max_distance: int = DEFAULT_MAX_DISTANCE,
+                    strict: bool = True) -> List[Dict]:
+    """Near-duplicate English keys within each category of a language file."""
+    report = []
+    for category, phrases in categories.items():
+        if not isinstance(phrases, list):
+            continue
+        index = build_phrase_index(phrases, max_distance)
+        for key_id, positions in enumerate(index.values):
+            if len(positions) > 1:
+                report.append({'category': category, 'distance': 0,
+                               'phrases': [phrases[i]['english'] for i in positions]})
+        for a, b, distance in index.near_duplicates(strict):
+            report.append({'category': category, 'distance': distance,
+                           'phrases': [a, b]})
+    return report
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Report near-duplicate English phrases per category")
+    parser.add_argument(
+        "files",
+        nargs="*",
+        help="Language files to check (default: translations/*.json)"
+    )
+    parser.add_argument(
+        "--max-distance",
+        type=int,
+        default=DEFAULT_MAX_DISTANCE,
+        help="Maximum edit distance for long phrases"
+    )
+    parser.add_argument(
+        "--loose",
+        action="store_true",
+        help="Also report substitutions and plurals (many are distinct phrases)"
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    files = args.files or sorted(glob.glob('translations/*.json'))
+    found = 0
+    for filepath in files:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        for entry in find_duplicates(data.get('categories', {}), args.max_distance,
+                                     not args.loose):
+            found += 1
+            print(f"{filepath}: [{entry['category']}] distance {entry['distance']}: "
+                  f"{' | '.join(entry['phrases'])}")
+    print(f"\n{'✅ No' if not found else f'⚠️  {found}'} near-duplicate phrase group(s) found")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,232 @@
+"""
+Append-only change journal and running coverage counters for the phrase store.
+
+Every phrase added to the store and every column value it changes is
+appended to ``translations/store/journal.jsonl`` when the store is saved:
+
+    {"t": 1760870000.0, "op": "phrase", "id": 12, "category": "food"}
+    {"t": 1760870000.0, "op": "set", "field": "somali", "id": 12,
+     "category": "food", "was": false, "now": true}
+
+``was``/``now`` record whether the field was filled before and after the
+change. ``CoverageCounters`` folds entries into per-category phrase totals
+and per-field filled counts; the store saves a snapshot of them together
+with the journal length (``coverage.json``), so current coverage is the
+snapshot plus the entries written after it - O(changes), without loading
+the columns. Coverage at any earlier time is a replay of the journal up to
+that timestamp; no historical language files are needed.
+
+    python -m translation_tools.journal                 # current coverage
+    python -m translation_tools.journal --at 2026-10-01 # coverage on a date
+    python -m translation_tools.journal --field somali --since 2026-10-01
+"""
+
+import argparse
+import json
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_STORE_DIR = ROOT / 'translations' / 'store'
+JOURNAL_FILE = 'journal.jsonl'
+COVERAGE_FILE = 'coverage.json'
+COVERAGE_VERSION = 1
+
+
+class ChangeJournal:
+    """JSON-lines journal of phrase-store changes; entries are only ever appended."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def size(self) -> int:
+        return self.path.stat().st_size if self.path.exists() else 0
+
+    def append(self, entries: Iterable[Dict], timestamp: Optional[float] = None) -> int:
+        """Append entries stamped with ``timestamp`` (default now); returns the new size."""
+        timestamp = time.time() if timestamp is None else timestamp
+        lines = [json.dumps({'t': timestamp, **entry}, ensure_ascii=False, separators=(',', ':'))
+                 for entry in entries]
+        if lines:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write('\n'.join(lines) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+        return self.size()
+
+    def entries(self, offset: int = 0, until: Optional[float] = None) -> Iterator[Dict]:
+        """Entries from byte ``offset`` on, stopping after timestamp ``until``."""
+        if not self.path.exists():
+            return
+        with open(self.path, 'rb') as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break  # partially written tail of an interrupted save
+                entry = json.loads(line)
+                if until is not None and entry['t'] > until:
+                    break
+                yield entry
+
+
+class CoverageCounters:
+    """Phrase totals per category and filled counts per field and category."""
+
+    def __init__(self):
+        self.totals: Dict[str, int] = {}
+        self.filled: Dict[str, Dict[str, int]] = {}
+        self.updated: Optional[float] = None
+
+    def apply(self, entry: Dict):
+        category = entry['category']
+        if entry['op'] == 'phrase':
+            self.totals[category] = self.totals.get(category, 0) + 1
+        elif entry['op'] == 'set' and entry['was'] != entry['now']:
+            counts = self.filled.setdefault(entry['field'], {})
+            counts[category] = counts.get(category, 0) + (1 if entry['now'] else -1)
+        self.updated = entry.get('t', self.updated)
+
+    def apply_all(self, entries: Iterable[Dict]) -> 'CoverageCounters':
+        for entry in entries:
+            self.apply(entry)
+        return self
+
+    def total(self, category: Optional[str] = None) -> int:
+        if category is not None:
+            return self.totals.get(category, 0)
+        return sum(self.totals.values())
+
+    def count(self, field: str, category: Optional[str] = None) -> int:
+        counts = self.filled.get(field, {})
+        if category is not None:
+            return counts.get(category, 0)
+        return sum(counts.values())
+
+    def percent(self, field: str, category: Optional[str] = None) -> float:
+        total = self.total(category)
+        return self.count(field, category) / total * 100 if total else 0.0
+
+    def to_dict(self) -> Dict:
+        return {'totals': self.totals, 'filled': self.filled, 'updated': self.updated}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'CoverageCounters':
+        counters = cls()
+        counters.totals = dict(data['totals'])
+        counters.filled = {field: dict(counts) for field, counts in data['filled'].items()}
+        counters.updated = data.get('updated')
+        return counters
+
+
+def save_snapshot(store_dir: Path, counters: CoverageCounters, journal_size: int):
+    """Record the counters as of ``journal_size`` bytes of journal."""
+    path = Path(store_dir) / COVERAGE_FILE
+    tmp_file = path.with_suffix('.tmp')
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump({'version': COVERAGE_VERSION, 'journal_size': journal_size,
+                   **counters.to_dict()}, f, ensure_ascii=False)
+    os.replace(tmp_file, path)
+
+
+def load_snapshot(store_dir: Path) -> Tuple[CoverageCounters, int]:
+    """Saved counters and the journal size they cover (empty counters, 0 if none)."""
+    path = Path(store_dir) / COVERAGE_FILE
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') == COVERAGE_VERSION:
+            return CoverageCounters.from_dict(data), data['journal_size']
+    except (OSError, ValueError, KeyError):
+        pass
+    return CoverageCounters(), 0
+
+
+def current_coverage(store_dir: Path = DEFAULT_STORE_DIR) -> CoverageCounters:
+    """Snapshot plus the journal entries appended after it."""
+    counters, offset = load_snapshot(store_dir)
+    journal = ChangeJournal(Path(store_dir) / JOURNAL_FILE)
+    if offset > journal.size():
+        # Journal was replaced; the snapshot no longer describes it
+        counters, offset = CoverageCounters(), 0
+    return counters.apply_all(journal.entries(offset))
+
+
+def coverage_at(timestamp: float, store_dir: Path = DEFAULT_STORE_DIR) -> CoverageCounters:
+    """Coverage as of ``timestamp``, replayed from the journal."""
+    journal = ChangeJournal(Path(store_dir) / JOURNAL_FILE)
+    return CoverageCounters().apply_all(journal.entries(until=timestamp))
+
+
+def changes(field: Optional[str] = None, since: Optional[float] = None,
+            store_dir: Path = DEFAULT_STORE_DIR) -> List[Dict]:
+    """Fill/empty transitions (optionally of one field) after ``since``."""
+    journal = ChangeJournal(Path(store_dir) / JOURNAL_FILE)
+    return [entry for entry in journal.entries()
+            if entry['op'] == 'set' and entry['was'] != entry['now']
+            and (field is None or entry['field'] == field)
+            and (since is None or entry['t'] > since)]
+
+
+def _parse_time(value: str) -> float:
+    try:
+        return float(value)
+    except ValueError:
+        return datetime.fromisoformat(value).timestamp()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Phrase store coverage from the change journal")
+    parser.add_argument(
+        "--at",
+        type=_parse_time,
+        help="Show coverage as of this time (ISO date/time or Unix timestamp)"
+    )
+    parser.add_argument(
+        "--since",
+        type=_parse_time,
+        help="List fill/empty changes after this time"
+    )
+    parser.add_argument(
+        "--field",
+        help="Only this language field"
+    )
+    parser.add_argument(
+        "--store",
+        default=str(DEFAULT_STORE_DIR),
+        help="Phrase store directory"
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    store_dir = Path(args.store)
+
+    if args.since is not None:
+        for entry in changes(args.field, args.since, store_dir):
+            when = datetime.fromtimestamp(entry['t']).isoformat(timespec='seconds')
+            status = 'filled' if entry['now'] else 'emptied'
+            print(f"{when}  {entry['field']:12} #{entry['id']:<6} {status:8} ({entry['category']})")
+        return
+
+    counters = current_coverage(store_dir) if args.at is None else coverage_at(args.at, store_dir)
+    total = counters.total()
+    label = 'now' if args.at is None else datetime.fromtimestamp(args.at).isoformat(timespec='seconds')
+    print(f"📊 Phrase store coverage ({label}): {total} phrases")
+    for field in sorted(counters.filled):
+        if args.field and field != args.field:
+            continue
+        if field.endswith('_phonetic'):
+            continue
+        print(f"  {field:14} {counters.count(field):5}/{total} ({counters.percent(field):5.1f}%)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+"""
+Detection and repair of mojibake: UTF-8 text that was decoded as a
+single-byte Windows/Latin codepage, e.g. 'ä¿˜è™\\x8f' for '俘虏'.
+
+Every UTF-8 multi-byte sequence is a lead byte (0xC2-0xF4) followed by
+continuation bytes (0x80-0xBF). Decoded as cp1252 or latin-1 those bytes
+become a fixed set of characters, so a precomputed table of them turns
+detection into a regex over each string: ASCII strings are skipped
+outright, and only strings containing a "lead char + continuation char"
+pair are suspects.
+
+Suspect runs are mapped back to bytes with each codec table and decoded as
+strict UTF-8; the first codec that succeeds wins. cp1252 leaves five bytes
+(0x81, 0x8D, 0x8F, 0x90, 0x9D) undefined and the broken data carries them
+through as the C1 controls U+0081... (the latin-1 reading), so the mixed
+``cp1252+latin-1`` table is tried after the two plain codecs. Text outside
+the runs - real CJK, Ge'ez or accented Latin - is left alone.
+"""
+
+import re
+from typing import Dict, Optional, Tuple
+
+CODECS = ('cp1252', 'latin-1', 'cp1252+latin-1')
+
+
+def _byte_table(codec: str) -> Dict[str, int]:
+    """Character -> byte for the upper half (0x80-0xFF) of a codepage."""
+    table = {}
+    for byte in range(0x80, 0x100):
+        for name in codec.split('+'):
+            try:
+                char = bytes([byte]).decode(name)
+            except UnicodeDecodeError:
+                continue
+            table.setdefault(char, byte)
+            break
+    return table
+
+
+BYTE_TABLES: Dict[str, Dict[str, int]] = {codec: _byte_table(codec) for codec in CODECS}
+
+
+def _char_class(predicate) -> str:
+    chars = {char for table in BYTE_TABLES.values()
+             for char, byte in table.items() if predicate(byte)}
+    return '[' + ''.join(re.escape(char) for char in sorted(chars)) + ']'
+
+
+_LEAD = _char_class(lambda byte: 0xC2 <= byte <= 0xF4)
+_CONTINUATION = _char_class(lambda byte: 0x80 <= byte <= 0xBF)
+_HIGH = _char_class(lambda byte: byte >= 0x80)
+
+# Cheap screen: a lead character directly followed by a continuation character
+SUSPECT = re.compile(_LEAD + _CONTINUATION)
+# Maximal runs of codepage characters (ASCII in between is kept as-is)
+_RUN = re.compile(_HIGH + '+')
+
+
+def is_suspect(text: str) -> bool:
+    """True if ``text`` may contain mojibake (never for ASCII-only text)."""
+    return not text.isascii() and SUSPECT.search(text) is not None
+
+
+def _decode_run(run: str) -> Optional[str]:
+    for codec in CODECS:
+        table = BYTE_TABLES[codec]
+        try:
+            raw = bytes(table[char] for char in run)
+        except KeyError:
+            continue
+        try:
+            return raw.decode('utf-8')
+        except UnicodeDecodeError:
+            continue
+    return None
+
+
+def repair_text(text: str) -> str:
+    """``text`` with every repairable mojibake run decoded; other text unchanged."""
+    if not is_suspect(text):
+        return text
+
+    def fix(match):
+        run = match.group(0)
+        if SUSPECT.search(run) is None:
+            return run
+        fixed = _decode_run(run)
+        return run if fixed is None else fixed
+
+    return _RUN.sub(fix, text)
+
+
+def repair_value(value) -> Tuple[object, int]:
+    """Repair every string in a JSON value; returns (value, strings changed)."""
+    if isinstance(value, str):
+        fixed = repair_text(value)
+        return fixed, int(fixed != value)
+    if isinstance(value, list):
+        changed = 0
+        items = []
+        for item in value:
+            item, count = repair_value(item)
+            items.append(item)
+            changed += count
+        return (items, changed) if changed else (value, 0)
+    if isinstance(value, dict):
+        changed = 0
+        fixed = {}
+        for key, item in value.items():
+            fixed[key], count = repair_value(item)
+            changed += count
+        return (fixed, changed) if changed else (value, 0)
+    return value, 0
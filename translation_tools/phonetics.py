@@ -0,0 +1,232 @@
+"""
+Phonetic normalization: convert IPA/special characters in phonetic fields to
+plain Latin letters (a-z, digits, spaces, hyphens, parentheses).
+
+Every step of the original algorithm (IPA mapping, NFD + dropping combining
+marks, extra Latin mappings, filtering to the allowed character set) works
+one character at a time, so the whole chain is folded into a single
+``str.translate`` table. Entries for characters outside the precomputed
+ranges are derived on first sight and cached in the table.
+
+Whole strings are memoized too: UI labels, category names and common words
+repeat across every language file. Results live in a bounded LRU and can be
+saved to .phonetic_cache.json between runs; the file is ignored unless it
+was written by the same normalizer version and Unicode database.
+"""
+
+import json
+import os
+import re
+import sys
+import unicodedata
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+# Bumped whenever the output for some input changes
+NORMALIZER_VERSION = 1
+
+# NFD data comes from unicodedata, so a Python upgrade can change results too
+CACHE_KEY = f"{NORMALIZER_VERSION}:{unicodedata.unidata_version}"
+CACHE_SIZE = 65536
+DEFAULT_CACHE_FILE = Path(__file__).resolve().parent.parent / '.phonetic_cache.json'
+
+# IPA character mappings
+IPA_MAP = {
+    'ɛ': 'e',   # open e
+    'ɔ': 'o',   # open o
+    'ə': 'e',   # schwa
+    'ʃ': 'sh',  # sh sound
+    'ʒ': 'zh',  # zh sound
+    'ŋ': 'ng',  # ng sound
+    'θ': 'th',  # th sound
+    'ð': 'th',  # voiced th
+    'ʔ': '',    # glottal stop (silent)
+    'ː': '',    # length marker (remove)
+    'ˈ': '',    # stress marker (remove)
+    'ˌ': '',    # secondary stress (remove)
+}
+
+# Additional character mappings after diacritic removal
+EXTRA_MAP = {
+    'ñ': 'n',
+    'ß': 'ss',
+    'æ': 'ae',
+    'œ': 'oe',
+    'ø': 'o',
+    'å': 'a',
+    '`': '',    # grave accent
+    '´': '',    # acute accent
+}
+
+# Keep only: a-z, A-Z, 0-9, hyphens, spaces, parentheses
+_DISALLOWED = re.compile(r'[^a-zA-Z0-9\s\-()]')
+_WHITESPACE = re.compile(r'\s')
+_SPACES = re.compile(r' {2,}')
+_HYPHENS = re.compile(r'-{2,}')
+
+
+def _normalize_char(char: str) -> str:
+    """Run the full per-character chain for one character."""
+    result = IPA_MAP.get(char, char)
+
+    # Remove combining diacritics (e.g. ɛ̈ → ɛ → e)
+    result = ''.join(
+        c for c in unicodedata.normalize('NFD', result)
+        if not unicodedata.combining(c)
+    )
+
+    result = ''.join(EXTRA_MAP.get(c, c) for c in result)
+    result = _DISALLOWED.sub('', result)
+
+    # Every kind of whitespace ends up as a plain space
+    return _WHITESPACE.sub(' ', result)
+
+
+class _TranslationTable(dict):
+    """``str.translate`` table that fills itself in for unseen characters."""
+
+    def __missing__(self, codepoint: int) -> str:
+        value = _normalize_char(chr(codepoint))
+        self[codepoint] = value
+        return value
+
+
+def _build_table() -> _TranslationTable:
+    table = _TranslationTable()
+    # Latin-1, Latin Extended, IPA and spacing modifiers cover the data we have
+    for codepoint in range(0x0300):
+        table[codepoint] = _normalize_char(chr(codepoint))
+    for char in IPA_MAP:
+        table[ord(char)] = _normalize_char(char)
+    return table
+
+
+_TABLE = _build_table()
+
+
+def _normalize(text: str) -> str:
+    """Uncached normalization of a non-empty string."""
+    result = text.translate(_TABLE)
+
+    # Clean up multiple spaces/hyphens
+    if '  ' in result:
+        result = _SPACES.sub(' ', result)
+    if '--' in result:
+        result = _HYPHENS.sub('-', result)
+
+    return result.strip()
+
+
+class PhoneticCache:
+    """Bounded LRU of normalized strings that can be persisted to disk."""
+
+    def __init__(self, maxsize: int = CACHE_SIZE):
+        self.maxsize = maxsize
+        self.entries: "OrderedDict[str, str]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.dirty = False
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def normalize(self, text: str) -> str:
+        entries = self.entries
+        result = entries.get(text)
+        if result is not None:
+            entries.move_to_end(text)
+            self.hits += 1
+            return result
+
+        self.misses += 1
+        # Interned so repeated labels share one object across loaded files
+        result = sys.intern(_normalize(text))
+        entries[sys.intern(text)] = result
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+        self.dirty = True
+        return result
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = self.misses = 0
+        self.dirty = False
+
+    def info(self) -> Dict[str, int]:
+        return {'size': len(self.entries), 'maxsize': self.maxsize,
+                'hits': self.hits, 'misses': self.misses}
+
+    def load(self, path: Path = DEFAULT_CACHE_FILE) -> int:
+        """Merge a saved cache into memory; returns the number of entries read."""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return 0
+        if not isinstance(saved, dict) or saved.get('version') != CACHE_KEY:
+            return 0
+
+        pairs = saved.get('entries', [])[-self.maxsize:]
+        for text, result in pairs:
+            self.entries.setdefault(sys.intern(text), sys.intern(result))
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+        return len(pairs)
+
+    def save(self, path: Path = DEFAULT_CACHE_FILE):
+        """Write the cache (least recently used first) if anything was added."""
+        if not self.dirty:
+            return
+        path = Path(path)
+        tmp_file = path.with_suffix('.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({'version': CACHE_KEY, 'entries': list(self.entries.items())},
+                      f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_file, path)
+        self.dirty = False
+
+
+_CACHE = PhoneticCache()
+
+
+def cache_info() -> Dict[str, int]:
+    """Size and hit/miss counters of the shared cache."""
+    return _CACHE.info()
+
+
+def clear_cache():
+    _CACHE.clear()
+
+
+def load_cache(path: Path = DEFAULT_CACHE_FILE) -> int:
+    return _CACHE.load(path)
+
+
+def save_cache(path: Path = DEFAULT_CACHE_FILE):
+    _CACHE.save(path)
+
+
+@contextmanager
+def persistent_cache(path: Path = DEFAULT_CACHE_FILE):
+    """Load the on-disk cache for the duration of a run and save it afterwards."""
+    load_cache(path)
+    try:
+        yield _CACHE
+    finally:
+        save_cache(path)
+
+
+def normalize_phonetic(text):
+    """Convert phonetic text to plain Latin letters only"""
+    if not text or not isinstance(text, str):
+        return text
+    return _CACHE.normalize(text)
+
+
+def normalize_phonetics(texts: Iterable) -> List:
+    """Normalize a batch of phonetic strings (non-strings pass through)."""
+    normalize = _CACHE.normalize
+    return [normalize(text) if text and isinstance(text, str) else text
+            for text in texts]
@@ -0,0 +1,406 @@
+"""
+Normalized phrase store.
+
+Translations are kept once: a phrase table (one row per category + English
+phrase, identified by its phrase ID from translations/phrase_ids.jsonl, the
+registry every catalog export keys on) and one column per language field
+mapping phrase IDs to values. The per-language files in translations/
+become views rendered from the store: each view remembers the file's
+metadata (ui, categoryNames, ...), its phrases in order and the fields it
+carries.
+
+The language files remain the source: the store is a derived cache,
+rebuilt from them by cross_populate_translations.py and not committed.
+
+On disk (translations/store/, gitignored):
+    phrases.json            [[id, category, english], ...]
+    columns/<field>.json    {id: value}
+    views/<language>.json   file metadata, field list, phrase IDs, row layouts and
+                            the untranslated values ("", English copies) rows carried
+    journal.jsonl           append-only log of added phrases and value changes
+    coverage.json           coverage counters as of a journal position
+
+The registry is only read: a phrase it does not list yet gets the next free
+ID in memory, and a saved store is re-keyed on load if the align stage has
+since registered its phrases under other IDs.
+
+Adding a language adds one column and one view; no other file changes.
+``store.coverage`` is kept current as values change (see journal.py).
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from translation_tools.alignment import PhraseIds
+from translation_tools.journal import (
+    COVERAGE_FILE, JOURNAL_FILE, ChangeJournal, CoverageCounters, current_coverage, save_snapshot,
+)
+
+ROOT = Path(__file__).resolve().parent.parent
+TRANSLATIONS_DIR = ROOT / 'translations'
+DEFAULT_STORE_DIR = TRANSLATIONS_DIR / 'store'
+STORE_VERSION = 1
+
+
+def _write_json(path: Path, data, indent: Optional[int] = None):
+    """Write JSON atomically (temp file + rename)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = path.with_suffix('.tmp')
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=indent)
+    os.replace(tmp_file, path)
+
+
+class PhraseStore:
+    """Phrase table plus per-field columns, with per-language file views."""
+
+    def __init__(self, store_dir: Path = DEFAULT_STORE_DIR, ids: Optional[PhraseIds] = None):
+        self.store_dir = Path(store_dir)
+        self.ids = ids if ids is not None else PhraseIds.load()
+        # Phrase table: phrase ID -> category and English text
+        self.categories: Dict[int, str] = {}
+        self.english: Dict[int, str] = {}
+        self.index: Dict[Tuple[str, str], int] = {}
+        # field -> {phrase_id: value}
+        self.columns: Dict[str, Dict[int, str]] = {}
+        # language -> view spec (file name, metadata, fields, phrase IDs per category)
+        self.views: Dict[str, Dict] = {}
+        self._english_ids: Optional[Tuple[int, Dict[str, List[int]]]] = None
+        self.journal = ChangeJournal(self.store_dir / JOURNAL_FILE)
+        self.coverage = CoverageCounters()
+        self._journal_pending: List[Dict] = []
+        self._dirty_columns = set()
+        self._dirty_views = set()
+        self._phrases_dirty = False
+
+    def __len__(self) -> int:
+        return len(self.english)
+
+    # ------------------------------------------------------------------
+    # Phrase table and columns
+    # ------------------------------------------------------------------
+
+    def add_phrase(self, category: str, english: str) -> int:
+        """Return the phrase ID for (category, english), adding a row if new."""
+        key = (category, english)
+        phrase_id = self.index.get(key)
+        if phrase_id is None:
+            phrase_id = self.ids.assign(category, english)
+            self.categories[phrase_id] = category
+            self.english[phrase_id] = english
+            self.index[key] = phrase_id
+            self._phrases_dirty = True
+            self._record({'op': 'phrase', 'id': phrase_id, 'category': category})
+        return phrase_id
+
+    def phrase_id(self, category: str, english: str) -> Optional[int]:
+        return self.index.get((category, english))
+
+    def add_column(self, field: str) -> Dict[int, str]:
+        """Create an (empty) column for a language field."""
+        column = self.columns.get(field)
+        if column is None:
+            column = self.columns[field] = {}
+            self._dirty_columns.add(field)
+        return column
+
+    def get(self, field: str, phrase_id: int) -> Optional[str]:
+        column = self.columns.get(field)
+        return column.get(phrase_id) if column else None
+
+    def set(self, field: str, phrase_id: int, value: str):
+        column = self.add_column(field)
+        old = column.get(phrase_id)
+        if old != value:
+            column[phrase_id] = value
+            self._dirty_columns.add(field)
+            self._record({'op': 'set', 'field': field, 'id': phrase_id,
+                          'category': self.categories[phrase_id],
+                          'was': bool(old), 'now': bool(value)})
+
+    def _record(self, entry: Dict):
+        """Queue a journal entry (written on save) and update the counters."""
+        self._journal_pending.append(entry)
+        self.coverage.apply(entry)
+
+    def missing(self, field: str, category: Optional[str] = None) -> List[int]:
+        """Phrase IDs without a stored value for ``field``."""
+        column = self.columns.get(field, {})
+        return [phrase_id for phrase_id, cat in self.categories.items()
+                if not column.get(phrase_id) and (category is None or cat == category)]
+
+    def is_translation(self, phrase_id: int, value) -> bool:
+        """Non-empty and not an English-copy placeholder."""
+        return bool(value) and isinstance(value, str) and value != self.english[phrase_id]
+
+    # ------------------------------------------------------------------
+    # Views
+    # ------------------------------------------------------------------
+
+    def ingest_file(self, language: str, data: Dict, filename: Optional[str] = None,
+                    native_field: Optional[str] = None) -> int:
+        """
+        Record ``data`` (a parsed language file) as the view for ``language``
+        and copy its translations into the columns.
+
+        A file is authoritative for its own language field; for other fields
+        an existing translation is kept. English-copy placeholders, empty and
+        non-string values are never stored; the view keeps them per row (with
+        each row's key order), so rendering the view gives the file back
+        unchanged unless a translation was stored since. Returns the number
+        of column values added or changed.
+        """
+        native_field = native_field or language
+        meta_keys = [key for key in data if key != 'categories']
+        fields: List[str] = []
+        view_categories: Dict[str, List[int]] = {}
+        layouts: Dict[Tuple[str, ...], int] = {}
+        row_layouts: Dict[str, List[int]] = {}
+        values: Dict[str, Dict[str, Dict]] = {}
+        changed = 0
+
+        for category, phrases in data.get('categories', {}).items():
+            if not isinstance(phrases, list):
+                continue
+            ids = view_categories.setdefault(category, [])
+            row_layout = row_layouts.setdefault(category, [])
+            for phrase in phrases:
+                if 'english' not in phrase:
+                    continue
+                phrase_id = self.add_phrase(category, phrase['english'])
+                row = len(ids)
+                ids.append(phrase_id)
+                row_layout.append(layouts.setdefault(tuple(phrase), len(layouts)))
+
+                for field, value in phrase.items():
+                    if field == 'english':
+                        continue
+                    if field not in fields:
+                        fields.append(field)
+                    if not self.is_translation(phrase_id, value):
+                        values.setdefault(category, {}).setdefault(str(row), {})[field] = value
+                        continue
+                    current = self.get(field, phrase_id)
+                    if current == value:
+                        continue
+                    if current is None or field == native_field:
+                        self.set(field, phrase_id, value)
+                        changed += 1
+
+        for field in fields:
+            self.add_column(field)
+
+        self.views[language] = {
+            'file': filename or f'{language}.json',
+            'meta': {key: data[key] for key in meta_keys},
+            'key_order': list(data.keys()),
+            'fields': fields,
+            'categories': view_categories,
+            'layouts': [list(layout) for layout in layouts],
+            'row_layouts': row_layouts,
+            'values': values,
+        }
+        self._dirty_views.add(language)
+        return changed
+
+    def add_language(self, language: str, field: Optional[str] = None,
+                     template: Optional[str] = None, meta: Optional[Dict] = None):
+        """
+        Add a language: one new column and a view over the same phrases as
+        ``template`` (english if present, else the first view). The view
+        starts with the template's ui/categoryNames unless ``meta``
+        overrides them. Existing views are left untouched.
+        """
+        field = field or language
+        if template is None:
+            template = 'english' if 'english' in self.views else next(iter(self.views))
+        self.add_column(field)
+        base = self.views[template]
+        view_meta = dict(base['meta'])
+        view_meta.update({'language': language, 'nativeLanguageField': field})
+        view_meta.update(meta or {})
+        fields = list(base['fields'])
+        if field not in fields:
+            fields.append(field)
+
+        self.views[language] = {
+            'file': f'{language}.json',
+            'meta': view_meta,
+            'key_order': list(base['key_order'])
+                         + [key for key in view_meta if key not in base['key_order']],
+            'fields': fields,
+            'categories': {cat: list(ids) for cat, ids in base['categories'].items()},
+        }
+        self._dirty_views.add(language)
+
+    def resolve(self, field: str, phrase_id: int) -> str:
+        """
+        Value of ``field`` for a phrase that does not carry it yet: the stored
+        translation, else one stored for the same English phrase in another
+        category, else the English text as a placeholder.
+        """
+        column = self.columns.get(field, {})
+        value = column.get(phrase_id)
+        if value is not None:
+            return value
+        english = self.english[phrase_id]
+        for other_id in self._ids_by_english().get(english, ()):
+            value = column.get(other_id)
+            if value is not None:
+                return value
+        return english
+
+    def _ids_by_english(self) -> Dict[str, List[int]]:
+        cached = self._english_ids
+        if cached is None or cached[0] != len(self.english):
+            by_english: Dict[str, List[int]] = {}
+            for phrase_id, english in self.english.items():
+                by_english.setdefault(english, []).append(phrase_id)
+            cached = self._english_ids = (len(self.english), by_english)
+        return cached[1]
+
+    def render_view(self, language: str, extra_fields: Iterable[str] = ()) -> Dict:
+        """
+        Build the per-language file contents from the store.
+
+        Each row keeps the keys it was ingested with, in the same order. A
+        key whose value was not a translation ("", an English copy, a
+        non-string) keeps that value unless a translation has been stored
+        for the phrase since. ``extra_fields`` a row lacks are added with
+        ``resolve``.
+        """
+        view = self.views[language]
+        default_layout = ['english'] + list(view['fields'])
+        layouts = view.get('layouts', [])
+        extra_fields = list(extra_fields)
+
+        categories = {}
+        for category, ids in view['categories'].items():
+            row_layouts = view.get('row_layouts', {}).get(category)
+            category_values = view.get('values', {}).get(category, {})
+            rows = []
+            for position, phrase_id in enumerate(ids):
+                layout = layouts[row_layouts[position]] if row_layouts else default_layout
+                kept = category_values.get(str(position), {})
+                row = {}
+                for field in layout:
+                    if field == 'english':
+                        row[field] = self.english[phrase_id]
+                        continue
+                    value = self.get(field, phrase_id)
+                    if value is None:
+                        value = kept[field] if field in kept else self.resolve(field, phrase_id)
+                    row[field] = value
+                for field in extra_fields:
+                    if field not in row:
+                        row[field] = self.resolve(field, phrase_id)
+                rows.append(row)
+            categories[category] = rows
+
+        data = {}
+        for key in view['key_order']:
+            data[key] = categories if key == 'categories' else view['meta'][key]
+        return data
+
+    def write_views(self, translations_dir: Path = TRANSLATIONS_DIR,
+                    languages: Optional[Iterable[str]] = None,
+                    extra_fields: Iterable[str] = ()) -> List[Path]:
+        """Render views to their language files; returns the paths written."""
+        translations_dir = Path(translations_dir)
+        extra_fields = list(extra_fields)
+        written = []
+        for language in (languages or self.views):
+            path = translations_dir / self.views[language]['file']
+            _write_json(path, self.render_view(language, extra_fields), indent=2)
+            written.append(path)
+        return written
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def load(cls, store_dir: Path = DEFAULT_STORE_DIR,
+             ids: Optional[PhraseIds] = None) -> 'PhraseStore':
+        """Load a saved store; a missing store loads as empty."""
+        store = cls(store_dir, ids)
+        phrases_file = store.store_dir / 'phrases.json'
+        if not phrases_file.exists():
+            return store
+
+        with open(phrases_file, 'r', encoding='utf-8') as f:
+            saved = json.load(f)
+        if saved.get('version') != STORE_VERSION:
+            raise ValueError(f"Unsupported phrase store version in {phrases_file}")
+        # Saved ID -> registry ID (the same unless the registry moved on)
+        rekey = {}
+        for saved_id, category, english in saved['phrases']:
+            phrase_id = rekey[saved_id] = store.ids.assign(category, english)
+            store.categories[phrase_id] = category
+            store.english[phrase_id] = english
+            store.index[(category, english)] = phrase_id
+        rekeyed = any(saved_id != phrase_id for saved_id, phrase_id in rekey.items())
+
+        for column_file in sorted((store.store_dir / 'columns').glob('*.json')):
+            with open(column_file, 'r', encoding='utf-8') as f:
+                values = json.load(f)
+            store.columns[column_file.stem] = {rekey[int(k)]: v for k, v in values.items()}
+
+        for view_file in sorted((store.store_dir / 'views').glob('*.json')):
+            with open(view_file, 'r', encoding='utf-8') as f:
+                view = json.load(f)
+            view['categories'] = {category: [rekey[i] for i in view_ids]
+                                  for category, view_ids in view['categories'].items()}
+            store.views[view_file.stem] = view
+
+        if rekeyed:
+            store._phrases_dirty = True
+            store._dirty_columns.update(store.columns)
+            store._dirty_views.update(store.views)
+
+        if store.journal.exists():
+            store.coverage = current_coverage(store.store_dir)
+        else:
+            # Store saved before journaling: record its contents as the first entries
+            for phrase_id, category in store.categories.items():
+                store._record({'op': 'phrase', 'id': phrase_id, 'category': category})
+            for field, column in store.columns.items():
+                for phrase_id in sorted(column):
+                    if column[phrase_id]:
+                        store._record({'op': 'set', 'field': field, 'id': phrase_id,
+                                       'category': store.categories[phrase_id],
+                                       'was': False, 'now': True})
+        return store
+
+    def save(self) -> List[Path]:
+        """Write the parts of the store that changed; returns the paths written."""
+        written = []
+        if self._phrases_dirty or not (self.store_dir / 'phrases.json').exists():
+            path = self.store_dir / 'phrases.json'
+            rows = [[i, self.categories[i], self.english[i]] for i in sorted(self.english)]
+            _write_json(path, {'version': STORE_VERSION, 'phrases': rows})
+            written.append(path)
+
+        for field in sorted(self._dirty_columns):
+            path = self.store_dir / 'columns' / f'{field}.json'
+            column = self.columns[field]
+            _write_json(path, {str(k): column[k] for k in sorted(column)})
+            written.append(path)
+
+        for language in sorted(self._dirty_views):
+            path = self.store_dir / 'views' / f'{language}.json'
+            _write_json(path, self.views[language])
+            written.append(path)
+
+        if self._journal_pending or not (self.store_dir / COVERAGE_FILE).exists():
+            journal_size = self.journal.append(self._journal_pending)
+            save_snapshot(self.store_dir, self.coverage, journal_size)
+            written += [self.journal.path, self.store_dir / COVERAGE_FILE]
+            self._journal_pending = []
+
+        self._dirty_columns.clear()
+        self._dirty_views.clear()
+        self._phrases_dirty = False
+        return written
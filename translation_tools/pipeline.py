@@ -0,0 +1,210 @@
+"""
+Incremental build pipeline for the translation files.
+
+Each stage declares the files it reads and writes. A stage is skipped when
+the content hashes of its inputs and outputs match what was recorded the
+last time it ran, so editing one language file only rebuilds the outputs
+that depend on it. Hashes are kept in .build_state.json in the repository
+root; file sizes and mtimes are stored next to them so unchanged files are
+not re-hashed.
+"""
+
+import hashlib
+import json
+import os
+import subprocess
+import sys
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+STATE_FILE = ROOT / '.build_state.json'
+STATE_VERSION = 1
+
+
+@dataclass
+class Stage:
+    """One build step and the files it depends on and produces."""
+    name: str
+    description: str
+    inputs: List[str]
+    outputs: List[str]
+    run: Callable[[], None]
+    # Default stages run on a plain build; the others only when named
+    default: bool = True
+
+
+@contextmanager
+def working_directory(path: Path):
+    """Temporarily run from ``path`` (the scripts use repo-relative paths)."""
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def run_script(script: str) -> Callable[[], None]:
+    """Stage runner that executes one of the repository's standalone scripts."""
+    def run():
+        subprocess.run([sys.executable, script], cwd=ROOT, check=True)
+    return run
+
+
+class Pipeline:
+    """Ordered set of stages with content-hash based skipping."""
+
+    def __init__(self, stages: List[Stage], root: Path = ROOT, state_file: Path = STATE_FILE):
+        self.stages = stages
+        self.by_name = {stage.name: stage for stage in stages}
+        self.root = Path(root)
+        self.state_file = Path(state_file)
+        self.state = self._load_state()
+
+    # ------------------------------------------------------------------
+    # State and hashing
+    # ------------------------------------------------------------------
+
+    def _load_state(self) -> Dict:
+        if self.state_file.exists():
+            try:
+                with open(self.state_file, 'r', encoding='utf-8') as f:
+                    state = json.load(f)
+                if state.get('version') == STATE_VERSION:
+                    return state
+            except (OSError, ValueError):
+                pass
+        return {'version': STATE_VERSION, 'files': {}, 'stages': {}}
+
+    def _save_state(self):
+        tmp_file = self.state_file.with_suffix('.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, indent=2, sort_keys=True)
+        os.replace(tmp_file, self.state_file)
+
+    def resolve(self, patterns: Iterable[str]) -> List[str]:
+        """Expand declared paths/globs to existing repo-relative file paths."""
+        paths = set()
+        for pattern in patterns:
+            if any(ch in pattern for ch in '*?['):
+                paths.update(p.relative_to(self.root).as_posix()
+                             for p in self.root.glob(pattern) if p.is_file())
+            elif (self.root / pattern).is_file():
+                paths.add(pattern)
+        return sorted(paths)
+
+    def digest(self, rel_path: str) -> Optional[str]:
+        """SHA-256 of a file, reusing the stored hash while size and mtime match."""
+        path = self.root / rel_path
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+
+        cached = self.state['files'].get(rel_path)
+        if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            return cached[2]
+
+        sha = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                sha.update(chunk)
+        digest = sha.hexdigest()
+        self.state['files'][rel_path] = [stat.st_size, stat.st_mtime_ns, digest]
+        return digest
+
+    def _snapshot(self, patterns: Iterable[str]) -> Dict[str, str]:
+        return {path: self.digest(path) for path in self.resolve(patterns)}
+
+    # ------------------------------------------------------------------
+    # Dependency graph
+    # ------------------------------------------------------------------
+
+    def dependencies(self) -> Dict[str, List[str]]:
+        """
+        Upstream stages of each stage.
+
+        A stage depends on every earlier-declared stage that writes one of
+        its inputs. Declaration order breaks ties between stages that edit
+        the same files in place, which keeps the graph acyclic.
+        """
+        resolved_outputs = {stage.name: set(self.resolve(stage.outputs)) | set(stage.outputs)
+                            for stage in self.stages}
+        deps = {}
+        for i, stage in enumerate(self.stages):
+            inputs = set(self.resolve(stage.inputs)) | set(stage.inputs)
+            deps[stage.name] = [
+                upstream.name for upstream in self.stages[:i]
+                if resolved_outputs[upstream.name] & inputs
+            ]
+        return deps
+
+    def select(self, names: Optional[List[str]] = None) -> List[Stage]:
+        """
+        Stages to consider for a build, in declaration order.
+
+        Without names this is every default stage. Named stages are added
+        together with the default stages downstream of them, so their
+        effects reach the published outputs.
+        """
+        if not names:
+            return [stage for stage in self.stages if stage.default]
+
+        unknown = [name for name in names if name not in self.by_name]
+        if unknown:
+            raise ValueError(f"Unknown stage(s): {', '.join(unknown)}")
+
+        deps = self.dependencies()
+        selected = set(names)
+        for stage in self.stages:
+            if stage.default and any(dep in selected for dep in deps[stage.name]):
+                selected.add(stage.name)
+        return [stage for stage in self.stages if stage.name in selected]
+
+    # ------------------------------------------------------------------
+    # Running
+    # ------------------------------------------------------------------
+
+    def is_up_to_date(self, stage: Stage) -> bool:
+        """True when inputs and outputs still hash to what the last run recorded."""
+        record = self.state['stages'].get(stage.name)
+        if not record:
+            return False
+        if record['inputs'] != self._snapshot(stage.inputs):
+            return False
+        outputs = self._snapshot(stage.outputs)
+        if not outputs or record['outputs'] != outputs:
+            return False
+        return True
+
+    def run(self, names: Optional[List[str]] = None, force: bool = False,
+            dry_run: bool = False) -> List[str]:
+        """Run stale stages; returns the names of the stages that ran (or would run)."""
+        ran = []
+        with working_directory(self.root):
+            for stage in self.select(names):
+                if not force and self.is_up_to_date(stage):
+                    print(f"✓ {stage.name}: up to date")
+                    continue
+
+                ran.append(stage.name)
+                if dry_run:
+                    print(f"• {stage.name}: would run")
+                    continue
+
+                print(f"▶ {stage.name}: {stage.description}")
+                stage.run()
+
+                # Record post-run hashes; in-place stages change their inputs too
+                self.state['stages'][stage.name] = {
+                    'inputs': self._snapshot(stage.inputs),
+                    'outputs': self._snapshot(stage.outputs),
+                }
+                self._save_state()
+
+        if not dry_run:
+            self._save_state()
+        return ran
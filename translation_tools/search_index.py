@@ -0,0 +1,403 @@
+"""
+Accent- and script-insensitive search index over the unified catalog.
+
+Every phrase is indexed through three kinds of fields:
+
+- ``english``;
+- native-script language fields (English-copy placeholders are skipped);
+- ``*_phonetic`` fields, passed through the shared phonetic normalizer so
+  IPA and accented romanizations match plain ASCII input.
+
+Text is folded (NFKD, combining marks dropped, IPA mapped, casefolded) and
+split into terms; hyphenated syllables are joined, so ``a-me-seg-na-le-hu``
+is found by typing "amesegnalehu". CJK runs are also indexed per
+character. Queries match terms exactly, by prefix, and by character
+trigram similarity for partial or misspelled words. Hits carry the
+registry phrase ID (translations/phrase_ids.jsonl) shared with the
+columnar file and the SQLite catalog.
+
+The on-disk form is a single binary file:
+
+    b'PHRSRCH1' | uint32 header length | header JSON | uint32 arrays and UTF-8 blobs
+
+Loading reads the file and turns each section into an array without
+parsing per-term structures, which takes a few milliseconds.
+"""
+
+import argparse
+import bisect
+import json
+import math
+import os
+import re
+import struct
+import sys
+import unicodedata
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from translation_tools.alignment import PhraseIds
+from translation_tools.phonetics import EXTRA_MAP, IPA_MAP, normalize_phonetic
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_INDEX = ROOT / 'translations' / 'all_languages.search'
+DEFAULT_CATALOG = ROOT / 'translations' / 'all_languages.json'
+
+MAGIC = b'PHRSRCH1'
+FORMAT_VERSION = 2
+
+PHONETIC_SUFFIX = '_phonetic'
+GRAM_SIZE = 3
+
+# Match weights per kind of term match and per kind of field
+EXACT_WEIGHT = 1.0
+PREFIX_WEIGHT = 0.7
+NGRAM_WEIGHT = 0.5
+NGRAM_MIN_SIMILARITY = 0.45
+MAX_PREFIX_TERMS = 256
+FIELD_WEIGHTS = {'english': 1.0, 'native': 1.0, 'phonetic': 0.9}
+
+_FOLD_TABLE = str.maketrans({**IPA_MAP, **EXTRA_MAP})
+_TOKEN = re.compile(r"\w+(?:['\-]\w+)*")
+_JOINERS = re.compile(r"['\-_]")
+
+
+def _is_cjk(char: str) -> bool:
+    code = ord(char)
+    return (0x4E00 <= code <= 0x9FFF or 0x3400 <= code <= 0x4DBF
+            or 0x3040 <= code <= 0x30FF or 0xAC00 <= code <= 0xD7AF)
+
+
+def fold(text: str) -> str:
+    """Remove accents and case, map IPA letters to their Latin spelling."""
+    text = unicodedata.normalize('NFKD', text.translate(_FOLD_TABLE))
+    return ''.join(c for c in text if not unicodedata.combining(c)).casefold()
+
+
+def tokenize(text: str) -> List[str]:
+    """Folded search terms of ``text`` (syllable hyphens joined, CJK per character)."""
+    terms = []
+    for token in _TOKEN.findall(fold(text)):
+        term = _JOINERS.sub('', token)
+        if not term:
+            continue
+        terms.append(term)
+        if any(_is_cjk(c) for c in term):
+            terms.extend(c for c in term if _is_cjk(c))
+    return terms
+
+
+def grams(term: str) -> List[str]:
+    """Padded character trigrams of a term."""
+    padded = f"^{term}$"
+    if len(padded) <= GRAM_SIZE:
+        return [padded]
+    return [padded[i:i + GRAM_SIZE] for i in range(len(padded) - GRAM_SIZE + 1)]
+
+
+def _field_kind(field: str) -> Tuple[str, str]:
+    """(language, kind) of a phrase field."""
+    if field == 'english':
+        return 'english', 'english'
+    if field.endswith(PHONETIC_SUFFIX):
+        return field[:-len(PHONETIC_SUFFIX)], 'phonetic'
+    return field, 'native'
+
+
+# ----------------------------------------------------------------------
+# Building
+# ----------------------------------------------------------------------
+
+def _u32(values: Iterable[int]) -> bytes:
+    data = array('I', values)
+    if sys.byteorder != 'little':
+        data.byteswap()
+    return data.tobytes()
+
+
+def build_index(catalog: Dict, path=DEFAULT_INDEX, ids: Optional[PhraseIds] = None) -> Path:
+    """
+    Index ``catalog`` (the all_languages.json structure) and write it to
+    ``path``. Phrase IDs come from ``ids`` (default: the registry, read-only).
+    """
+    path = Path(path)
+    ids = ids if ids is not None else PhraseIds.load()
+    # [phrase ID, category, english]; documents point at these slots
+    phrases: List[list] = []
+    fields: List[str] = []
+    field_ids: Dict[str, int] = {}
+    doc_phrase, doc_field, doc_texts = [], [], []
+    postings: Dict[str, List[int]] = {}
+
+    for category, entries in catalog.get('categories', {}).items():
+        for entry in entries:
+            english = entry.get('english')
+            if not isinstance(english, str) or not english:
+                continue
+            slot = len(phrases)
+            phrases.append([ids.assign(category, english), category, english])
+
+            for field, value in entry.items():
+                if not isinstance(value, str) or not value:
+                    continue
+                _, kind = _field_kind(field)
+                if kind == 'native' and value == english:
+                    continue  # English-copy placeholder
+                indexed = normalize_phonetic(value) if kind == 'phonetic' else value
+                terms = set(tokenize(indexed))
+                if not terms:
+                    continue
+
+                if field not in field_ids:
+                    field_ids[field] = len(fields)
+                    fields.append(field)
+                doc_id = len(doc_phrase)
+                doc_phrase.append(slot)
+                doc_field.append(field_ids[field])
+                doc_texts.append(value)
+                for term in terms:
+                    postings.setdefault(term, []).append(doc_id)
+
+    terms = sorted(postings)
+    term_ptr, term_docs = [0], []
+    for term in terms:
+        term_docs.extend(postings[term])
+        term_ptr.append(len(term_docs))
+
+    gram_postings: Dict[str, List[int]] = {}
+    for term_id, term in enumerate(terms):
+        for gram in set(grams(term)):
+            gram_postings.setdefault(gram, []).append(term_id)
+    gram_list = sorted(gram_postings)
+    gram_ptr, gram_terms = [0], []
+    for gram in gram_list:
+        gram_terms.extend(gram_postings[gram])
+        gram_ptr.append(len(gram_terms))
+
+    text_blob = bytearray()
+    text_ptr = [0]
+    for text in doc_texts:
+        text_blob += text.encode('utf-8')
+        text_ptr.append(len(text_blob))
+
+    sections = [
+        ('doc_phrase', _u32(doc_phrase)),
+        ('doc_field', _u32(doc_field)),
+        ('text_ptr', _u32(text_ptr)),
+        ('texts', bytes(text_blob)),
+        ('terms', '\0'.join(terms).encode('utf-8')),
+        ('term_ptr', _u32(term_ptr)),
+        ('term_docs', _u32(term_docs)),
+        ('grams', '\0'.join(gram_list).encode('utf-8')),
+        ('gram_ptr', _u32(gram_ptr)),
+        ('gram_terms', _u32(gram_terms)),
+    ]
+    header = {
+        'version': FORMAT_VERSION,
+        'phrases': phrases,
+        'fields': fields,
+        'sections': [[name, len(data)] for name, data in sections],
+    }
+    header_bytes = json.dumps(header, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    tmp_file = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp_file, 'wb') as f:
+        f.write(MAGIC)
+        f.write(struct.pack('<I', len(header_bytes)))
+        f.write(header_bytes)
+        for _, data in sections:
+            f.write(data)
+    os.replace(tmp_file, path)
+    return path
+
+
+# ----------------------------------------------------------------------
+# Querying
+# ----------------------------------------------------------------------
+
+class SearchIndex:
+    """Loaded search index with a ranked, cross-language query API."""
+
+    def __init__(self, header: Dict, sections: Dict[str, bytes]):
+        self.phrases: List[list] = header['phrases']
+        self.fields: List[str] = header['fields']
+        self.field_info = [_field_kind(field) for field in self.fields]
+
+        def u32(name):
+            data = array('I')
+            data.frombytes(sections[name])
+            if sys.byteorder != 'little':
+                data.byteswap()
+            return data
+
+        self.doc_phrase = u32('doc_phrase')
+        self.doc_field = u32('doc_field')
+        self.text_ptr = u32('text_ptr')
+        self._texts = sections['texts']
+        self.terms = sections['terms'].decode('utf-8').split('\0') if sections['terms'] else []
+        self.term_ptr = u32('term_ptr')
+        self.term_docs = u32('term_docs')
+        self.grams = sections['grams'].decode('utf-8').split('\0') if sections['grams'] else []
+        self.gram_ptr = u32('gram_ptr')
+        self.gram_terms = u32('gram_terms')
+        self.doc_count = len(self.doc_phrase)
+
+    @classmethod
+    def load(cls, path=DEFAULT_INDEX) -> 'SearchIndex':
+        with open(path, 'rb') as f:
+            data = f.read()
+        if data[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not a search index")
+        (header_len,) = struct.unpack_from('<I', data, len(MAGIC))
+        position = len(MAGIC) + 4
+        header = json.loads(data[position:position + header_len].decode('utf-8'))
+        if header.get('version') != FORMAT_VERSION:
+            raise ValueError(f"Unsupported search index version in {path}")
+        position += header_len
+
+        sections = {}
+        for name, length in header['sections']:
+            sections[name] = data[position:position + length]
+            position += length
+        return cls(header, sections)
+
+    def doc_text(self, doc_id: int) -> str:
+        return self._texts[self.text_ptr[doc_id]:self.text_ptr[doc_id + 1]].decode('utf-8')
+
+    def _idf(self, term_id: int) -> float:
+        df = self.term_ptr[term_id + 1] - self.term_ptr[term_id]
+        return math.log(1.0 + self.doc_count / df)
+
+    def _gram_terms(self, gram: str) -> range:
+        i = bisect.bisect_left(self.grams, gram)
+        if i < len(self.grams) and self.grams[i] == gram:
+            return range(self.gram_ptr[i], self.gram_ptr[i + 1])
+        return range(0)
+
+    def match_terms(self, token: str, prefix: bool = True, ngrams: bool = True) -> Dict[int, float]:
+        """Index terms matching one query token, with match weights."""
+        matches: Dict[int, float] = {}
+        terms = self.terms
+
+        i = bisect.bisect_left(terms, token)
+        if i < len(terms) and terms[i] == token:
+            matches[i] = EXACT_WEIGHT
+
+        if prefix:
+            j = i
+            end = min(len(terms), i + MAX_PREFIX_TERMS)
+            while j < end and terms[j].startswith(token):
+                if j not in matches:
+                    # Shorter completions are closer to what was typed
+                    matches[j] = PREFIX_WEIGHT * (0.5 + 0.5 * len(token) / len(terms[j]))
+                j += 1
+
+        if ngrams and len(token) >= GRAM_SIZE - 1:
+            query_grams = set(grams(token))
+            overlap: Dict[int, int] = {}
+            for gram in query_grams:
+                for k in self._gram_terms(gram):
+                    term_id = self.gram_terms[k]
+                    overlap[term_id] = overlap.get(term_id, 0) + 1
+            for term_id, shared in overlap.items():
+                if term_id in matches:
+                    continue
+                term_grams = len(terms[term_id]) + 2 - GRAM_SIZE + 1
+                similarity = 2.0 * shared / (len(query_grams) + max(term_grams, 1))
+                if similarity >= NGRAM_MIN_SIMILARITY:
+                    matches[term_id] = NGRAM_WEIGHT * similarity
+        return matches
+
+    def search(self, query: str, language: Optional[str] = None, limit: int = 10,
+               prefix: bool = True, ngrams: bool = True) -> List[Dict]:
+        """
+        Ranked hits for ``query`` across languages.
+
+        Each hit is one phrase in one language: ``{'phrase_id', 'category',
+        'english', 'language', 'field', 'text', 'score'}``. ``language``
+        restricts hits to one language (its native and phonetic fields).
+        """
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+
+        doc_scores: Dict[int, float] = {}
+        for token in tokens:
+            token_scores: Dict[int, float] = {}
+            for term_id, weight in self.match_terms(token, prefix, ngrams).items():
+                score = weight * self._idf(term_id)
+                for k in range(self.term_ptr[term_id], self.term_ptr[term_id + 1]):
+                    doc_id = self.term_docs[k]
+                    if score > token_scores.get(doc_id, 0.0):
+                        token_scores[doc_id] = score
+            for doc_id, score in token_scores.items():
+                doc_scores[doc_id] = doc_scores.get(doc_id, 0.0) + score
+
+        # Best field per (phrase slot, language)
+        best: Dict[Tuple[int, str], Tuple[float, int]] = {}
+        for doc_id, score in doc_scores.items():
+            hit_language, kind = self.field_info[self.doc_field[doc_id]]
+            if language is not None and hit_language != language:
+                continue
+            score *= FIELD_WEIGHTS[kind]
+            key = (self.doc_phrase[doc_id], hit_language)
+            if key not in best or score > best[key][0]:
+                best[key] = (score, doc_id)
+
+        ranked = sorted(best.items(), key=lambda item: (-item[1][0], item[0]))[:limit]
+        hits = []
+        for (slot, hit_language), (score, doc_id) in ranked:
+            phrase_id, category, english = self.phrases[slot]
+            hits.append({
+                'phrase_id': phrase_id,
+                'category': category,
+                'english': english,
+                'language': hit_language,
+                'field': self.fields[self.doc_field[doc_id]],
+                'text': self.doc_text(doc_id),
+                'score': round(score, 4),
+            })
+        return hits
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Build or query the phrase search index")
+    parser.add_argument(
+        "query",
+        nargs="*",
+        help="Words to search for (omit with --build)"
+    )
+    parser.add_argument(
+        "--build",
+        action="store_true",
+        help=f"Rebuild the index from {DEFAULT_CATALOG.name}"
+    )
+    parser.add_argument(
+        "--language",
+        help="Only return hits in this language"
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=10,
+        help="Maximum number of hits"
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.build:
+        with open(DEFAULT_CATALOG, 'r', encoding='utf-8') as f:
+            path = build_index(json.load(f))
+        print(f"✅ Search index written to {path}")
+    if args.query:
+        index = SearchIndex.load()
+        for hit in index.search(' '.join(args.query), language=args.language, limit=args.limit):
+            print(f"{hit['score']:7.3f}  {hit['language']:12} {hit['text']:30} "
+                  f"({hit['category']}: {hit['english']})")
+
+
+if __name__ == '__main__':
+    main()
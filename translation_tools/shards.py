@@ -0,0 +1,135 @@
+"""
+Per-(language, category) shards of the published catalog for the web tier.
+
+``GET /api/phrases/:language/:category`` in server.js answers with
+
+    {"language": ..., "nativeLanguageField": ..., "category": ...,
+     "categoryName": ..., "phrases": [...]}
+
+built from the whole in-memory all_languages.json on every request. This
+module writes exactly that body (minified, as ``res.json`` would send it)
+once per language and category, each with ``.gz`` and ``.br`` siblings
+(see compact.py), under a content-hashed name so a shard URL never changes
+meaning and can be cached forever:
+
+    translations/build/shards/somali/greetings.3f9c1a2b7d4e.json
+    translations/build/shards/manifest.json
+
+The manifest maps language -> category -> file, SHA-256 and sizes, and
+records the SHA-256 of the source catalog. When that matches the
+all_languages.json the server loaded, it streams the matching shard
+instead of serializing JSON per request. Clients and edge caches can
+fetch single categories from ``/shards/<file>``. Shards no longer listed
+in the manifest are deleted on export.
+
+    python -m translation_tools.shards [translations/all_languages.json]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict
+
+from translation_tools.compact import write_compressed
+from translation_tools.streaming import iter_categories, read_metadata
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_SOURCE = ROOT / 'translations' / 'all_languages.json'
+DEFAULT_OUT_DIR = ROOT / 'translations' / 'build' / 'shards'
+MANIFEST_NAME = 'manifest.json'
+MANIFEST_VERSION = 1
+HASH_LENGTH = 12
+
+
+def shard_body(language: str, meta: Dict, category: str, phrases) -> bytes:
+    """The /api/phrases response body; keys the server would leave undefined are omitted."""
+    body = {
+        'language': meta.get('language'),
+        'nativeLanguageField': meta.get('nativeLanguageField'),
+        'category': category,
+        'categoryName': (meta.get('categoryNames') or {}).get(category),
+        'phrases': phrases,
+    }
+    body = {key: value for key, value in body.items() if value is not None}
+    return json.dumps(body, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _write_bytes(path: Path, payload: bytes):
+    tmp_file = path.with_name(path.name + '.tmp')
+    with open(tmp_file, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_file, path)
+
+
+def export_shards(source=DEFAULT_SOURCE, out_dir=DEFAULT_OUT_DIR) -> Dict:
+    """Write every shard of ``source`` plus the manifest; returns the manifest."""
+    out_dir = Path(out_dir)
+    languages = {name: meta for name, meta in read_metadata(source).items()
+                 if isinstance(meta, dict)}
+    shards: Dict[str, Dict[str, Dict]] = {language: {} for language in languages}
+    keep = {out_dir / MANIFEST_NAME}
+
+    for category, phrases in iter_categories(source):
+        for language, meta in languages.items():
+            payload = shard_body(language, meta, category, phrases)
+            digest = hashlib.sha256(payload).hexdigest()
+            rel_path = f'{language}/{category}.{digest[:HASH_LENGTH]}.json'
+            path = out_dir / rel_path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if not path.exists() or path.read_bytes() != payload:
+                _write_bytes(path, payload)
+                compressed = write_compressed(path)
+            else:
+                compressed = [p for p in (path.with_name(path.name + ext) for ext in ('.gz', '.br'))
+                              if p.exists()]
+            keep.update([path, *compressed])
+            shards[language][category] = {
+                'file': rel_path,
+                'sha256': digest,
+                'bytes': len(payload),
+                'encodings': {p.suffix[1:]: p.stat().st_size for p in compressed},
+            }
+
+    # The server ignores the shards unless this matches the file it loaded
+    source_sha256 = hashlib.sha256(Path(source).read_bytes()).hexdigest()
+    manifest = {'version': MANIFEST_VERSION, 'source': Path(source).name,
+                'source_sha256': source_sha256, 'shards': shards}
+    _write_bytes(out_dir / MANIFEST_NAME,
+                 json.dumps(manifest, ensure_ascii=False, indent=2).encode('utf-8'))
+
+    for path in out_dir.rglob('*'):
+        if path.is_file() and path not in keep:
+            path.unlink()
+    return manifest
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Export per-language, per-category shards of the published catalog")
+    parser.add_argument(
+        "source",
+        nargs="?",
+        default=str(DEFAULT_SOURCE),
+        help="Catalog to shard (default: translations/all_languages.json)"
+    )
+    parser.add_argument(
+        "--out",
+        default=str(DEFAULT_OUT_DIR),
+        help="Output directory (default: translations/build/shards)"
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    manifest = export_shards(args.source, args.out)
+    count = sum(len(categories) for categories in manifest['shards'].values())
+    raw = sum(shard['bytes'] for categories in manifest['shards'].values()
+              for shard in categories.values())
+    print(f"✅ {count} shards for {len(manifest['shards'])} languages "
+          f"({raw:,} bytes minified) in {args.out}")
+
+
+if __name__ == '__main__':
+    main()
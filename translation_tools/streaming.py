@@ -0,0 +1,373 @@
+"""
+Streaming reader and writer for the ``{..., 'categories': {name: [phrase, ...]}}``
+shape shared by the language files and the merged catalogs.
+
+``json.load`` builds the whole document before anything can be used, so a
+catalog's memory grows with every phrase of every language. The reader here
+walks the top-level object itself and decodes one metadata value or one
+phrase at a time (``json.JSONDecoder.raw_decode`` on a sliding buffer), so
+only the current phrase - or, for ``iter_categories``, the current
+category - is held in memory:
+
+    for category, phrase in iter_phrases('translations/all_languages.json'):
+        ...
+
+``CatalogWriter`` is the matching incremental writer. Its ``indent=2`` output
+is byte-identical to ``json.dump(data, f, ensure_ascii=False, indent=2)``,
+so switching a script to it does not change any generated file;
+``indent=None`` writes the compact form (no whitespace), about half the size.
+
+``StreamedCatalog`` wraps a file as a read-only mapping for code written
+against the parsed dict (``catalog['english']``,
+``catalog['categories'].items()``): metadata is decoded once, categories are
+re-read from disk one at a time on every iteration.
+"""
+
+import json
+import os
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+CHUNK_SIZE = 1 << 16
+
+_WHITESPACE = ' \t\n\r'
+_decoder = json.JSONDecoder()
+
+
+class _Reader:
+    """Character-level cursor over a JSON file with a growing read buffer."""
+
+    def __init__(self, f, chunk_size: int = CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Read more text (at least as much as is buffered); False at end of file."""
+        if self.eof:
+            return False
+        chunk = self.f.read(max(self.chunk_size, len(self.buf) - self.pos))
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character (not consumed), '' at end of file."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return ''
+
+    def expect(self, char: str):
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} but found {found or 'end of file'!r} "
+                             f"in {getattr(self.f, 'name', 'stream')}")
+        self.pos += 1
+
+    def value(self):
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if self.fill():
+                    continue
+                raise
+            # A number at the end of the buffer may continue in the next chunk
+            if end == len(self.buf) and not self.eof and self.fill():
+                continue
+            self.pos = end
+            return value
+
+    def members(self) -> Iterator[str]:
+        """Consume ``{`` and yield each key; the caller must consume the value."""
+        self.expect('{')
+        if self.peek() == '}':
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            if not isinstance(key, str):
+                raise ValueError(f"Object key is not a string: {key!r}")
+            self.expect(':')
+            yield key
+            if self.peek() == ',':
+                self.pos += 1
+                continue
+            self.expect('}')
+            return
+
+    def elements(self) -> Iterator[object]:
+        """Consume an array, decoding and yielding one element at a time."""
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.peek() == ',':
+                self.pos += 1
+                continue
+            self.expect(']')
+            return
+
+
+def iter_events(path) -> Iterator[Tuple[str, str, object]]:
+    """
+    Walk a catalog file in order, yielding:
+
+        ('meta', key, value)          a top-level key other than categories
+        ('categories', key, None)     start of the categories object
+        ('category', name, None)      start of a category
+        ('phrase', name, phrase)      one phrase of that category
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        reader = _Reader(f)
+        for key in reader.members():
+            if key != 'categories' or reader.peek() != '{':
+                yield 'meta', key, reader.value()
+                continue
+            yield 'categories', key, None
+            for category in reader.members():
+                yield 'category', category, None
+                if reader.peek() != '[':
+                    reader.value()  # not a phrase list; skipped like the scripts do
+                    continue
+                for phrase in reader.elements():
+                    yield 'phrase', category, phrase
+        if reader.peek():
+            raise ValueError(f"Trailing data after the catalog in {path}")
+
+
+def iter_phrases(path) -> Iterator[Tuple[str, Dict]]:
+    """``(category, phrase)`` for every phrase, one decoded at a time."""
+    for kind, name, value in iter_events(path):
+        if kind == 'phrase':
+            yield name, value
+
+
+def iter_categories(path) -> Iterator[Tuple[str, List[Dict]]]:
+    """``(category, phrases)`` per category; only one category is in memory."""
+    current, phrases = None, None
+    for kind, name, value in iter_events(path):
+        if kind == 'category':
+            if current is not None:
+                yield current, phrases
+            current, phrases = name, []
+        elif kind == 'phrase':
+            phrases.append(value)
+    if current is not None:
+        yield current, phrases
+
+
+def read_metadata(path) -> Dict:
+    """Top-level keys other than categories (ui, categoryNames, ...)."""
+    return {name: value for kind, name, value in iter_events(path) if kind == 'meta'}
+
+
+class CatalogWriter:
+    """
+    Incremental writer for the catalog shape. Metadata keys and categories
+    are written in the order they are given; phrases of one category must be
+    consecutive. The file is written next to ``path`` and renamed into place
+    on ``close`` (or at the end of a ``with`` block that did not raise).
+
+        with CatalogWriter('translations/all_languages.json') as writer:
+            writer.write_meta('english', {...})
+            for category, phrase in phrases:
+                writer.write_phrase(category, phrase)
+    """
+
+    def __init__(self, path, indent: Optional[int] = 2):
+        self.path = Path(path)
+        self.indent = indent
+        self._tmp_file = self.path.with_suffix(self.path.suffix + '.tmp')
+        self._f = open(self._tmp_file, 'w', encoding='utf-8')
+        self._key_separator = ': ' if indent is not None else ':'
+        self._keys = 0
+        self._in_categories = False
+        self._categories_written = False
+        self._category_count = 0
+        self._category: Optional[str] = None
+        self._seen_categories = set()
+        self._phrases = 0
+        self._f.write('{')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def _newline(self, level: int) -> str:
+        return '' if self.indent is None else '\n' + ' ' * (self.indent * level)
+
+    def _dumps(self, value, level: int) -> str:
+        if self.indent is None:
+            return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+        text = json.dumps(value, ensure_ascii=False, indent=self.indent)
+        return text.replace('\n', self._newline(level))
+
+    def _write_key(self, key: str, level: int, first: bool):
+        self._f.write(('' if first else ',') + self._newline(level)
+                      + json.dumps(key, ensure_ascii=False) + self._key_separator)
+
+    def write_meta(self, key: str, value):
+        """Write a top-level key (language metadata) and its value."""
+        if key == 'categories':
+            raise ValueError("Write categories with write_phrase/begin_category")
+        self._end_categories()
+        self._write_key(key, 1, self._keys == 0)
+        self._f.write(self._dumps(value, 1))
+        self._keys += 1
+
+    def begin_categories(self):
+        """Open the categories object (implicit on the first phrase)."""
+        if self._in_categories:
+            return
+        if self._categories_written:
+            raise ValueError("Categories were already written")
+        self._write_key('categories', 1, self._keys == 0)
+        self._f.write('{')
+        self._keys += 1
+        self._in_categories = True
+
+    def begin_category(self, category: str):
+        """Start a category; an empty one is written as ``[]``."""
+        if category in self._seen_categories:
+            raise ValueError(f"Category '{category}' was already written")
+        self.begin_categories()
+        self._end_category()
+        self._write_key(category, 2, self._category_count == 0)
+        self._f.write('[')
+        self._category_count += 1
+        self._category = category
+        self._seen_categories.add(category)
+        self._phrases = 0
+
+    def write_phrase(self, category: str, phrase: Dict):
+        if category != self._category:
+            self.begin_category(category)
+        self._f.write(('' if self._phrases == 0 else ',') + self._newline(3)
+                      + self._dumps(phrase, 3))
+        self._phrases += 1
+
+    def write_category(self, category: str, phrases: Iterable[Dict]):
+        self.begin_category(category)
+        for phrase in phrases:
+            self.write_phrase(category, phrase)
+
+    def _end_category(self):
+        if self._category is None:
+            return
+        self._f.write((self._newline(2) if self._phrases else '') + ']')
+        self._category = None
+
+    def _end_categories(self):
+        if not self._in_categories:
+            return
+        self._end_category()
+        self._f.write((self._newline(1) if self._category_count else '') + '}')
+        self._in_categories = False
+        self._categories_written = True
+
+    def close(self) -> Path:
+        """Finish the document and move it into place."""
+        if self._f.closed:
+            return self.path
+        self._end_categories()
+        self._f.write((self._newline(0) if self._keys else '') + '}')
+        self._f.close()
+        os.replace(self._tmp_file, self.path)
+        return self.path
+
+    def abort(self):
+        """Discard the partial output."""
+        if not self._f.closed:
+            self._f.close()
+        if self._tmp_file.exists():
+            self._tmp_file.unlink()
+
+
+def write_catalog(data: Dict, path, indent: Optional[int] = 2) -> Path:
+    """Write a parsed catalog (or ``StreamedCatalog``) through ``CatalogWriter``."""
+    with CatalogWriter(path, indent) as writer:
+        for key, value in data.items():
+            if key != 'categories':
+                writer.write_meta(key, value)
+                continue
+            writer.begin_categories()
+            for category, phrases in value.items():
+                writer.write_category(category, phrases)
+    return Path(path)
+
+
+class StreamedCategories(Mapping):
+    """The categories of a catalog file, decoded one category at a time."""
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    def __iter__(self) -> Iterator[str]:
+        for kind, name, _ in iter_events(self.path):
+            if kind == 'category':
+                yield name
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __getitem__(self, category: str) -> List[Dict]:
+        for name, phrases in iter_categories(self.path):
+            if name == category:
+                return phrases
+        raise KeyError(category)
+
+    def items(self) -> Iterator[Tuple[str, List[Dict]]]:
+        return iter_categories(self.path)
+
+    def values(self) -> Iterator[List[Dict]]:
+        return (phrases for _, phrases in iter_categories(self.path))
+
+
+class StreamedCatalog(Mapping):
+    """
+    Read-only mapping over a catalog file. Metadata is decoded on creation;
+    ``catalog['categories']`` streams from disk on every iteration.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._keys: List[str] = []
+        self._metadata: Dict = {}
+        for kind, name, value in iter_events(self.path):
+            if kind == 'meta':
+                self._keys.append(name)
+                self._metadata[name] = value
+            elif kind == 'categories':
+                self._keys.append(name)
+        self._categories = StreamedCategories(self.path)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __getitem__(self, key: str):
+        if key == 'categories' and key in self._keys:
+            return self._categories
+        return self._metadata[key]
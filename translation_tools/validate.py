@@ -0,0 +1,298 @@
+"""
+Encoding and integrity checks for translation catalogs.
+
+One streamed pass over a catalog checks every phrase value with
+precompiled per-script character classes and placeholder detectors:
+
+    error    mojibake      UTF-8 read as cp1252/latin-1 (see mojibake.py)
+    error    control       control characters or U+FFFD replacement marks
+    error    stub          "[Amharic: ...]" templates from ContextualGenerator
+    error    script        letters of a third script (e.g. Ethiopic in a Chinese field)
+    warning  untranslated  no letters of the field's own script (Amharic, Arabic,
+                           Chinese, Tigrinya fields holding Latin text)
+    warning  english_copy  value identical to the English phrase, the placeholder
+                           complete_all_languages.generate_translation writes
+    warning  whitespace    leading/trailing or doubled spaces
+
+Metadata strings (ui, categoryNames, ...) get the encoding and stub checks.
+For ``published`` languages (the build passes every language of the catalog
+it is about to publish) the placeholder checks (untranslated, english_copy)
+are errors too, so a placeholder blocks the ``publish`` stage.
+The report is JSON; ``validate_files`` checks several files in a process
+pool. Run as a build gate (the ``validate`` stage) or directly:
+
+    python -m translation_tools.validate translations/all_languages_2.json
+    python -m translation_tools.validate --strict --report report.json
+    python -m translation_tools.validate --published translations/all_languages_2.json
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from translation_tools.mojibake import is_suspect, repair_text
+from translation_tools.streaming import iter_events, read_metadata
+
+ROOT = Path(__file__).resolve().parent.parent
+REPORT_VERSION = 1
+
+PHONETIC_SUFFIX = '_phonetic'
+
+ERROR = 'error'
+WARNING = 'warning'
+SEVERITY = {
+    'mojibake': ERROR,
+    'control': ERROR,
+    'stub': ERROR,
+    'script': ERROR,
+    'untranslated': WARNING,
+    'english_copy': WARNING,
+    'whitespace': WARNING,
+}
+
+# Values these checks flag are placeholders, not translations
+PLACEHOLDER_CHECKS = ('stub', 'untranslated', 'english_copy')
+
+# Letters (and marks) of each script; everything in COMMON is allowed anywhere
+SCRIPT_RANGES = {
+    'latin': 'A-Za-zÀ-ÖØ-öø-ɏɐ-ʯ'
+             'Ḁ-ỿⱠ-Ɀ꜠-ꟿ',
+    'ethiopic': 'ሀ-᎟ⶀ-⷟꬀-꬯',
+    'arabic': '؀-ۿݐ-ݿࢠ-ࣿﭐ-﷿ﹰ-﻿',
+    'cjk': '⺀-⿟぀-ヿ㄀-ㄯ㐀-䶿一-鿿'
+           '豈-﫿\U00020000-\U0002fa1f',
+}
+COMMON = ('\u0000-@[-`{-¿×÷ʰ-ͯ'
+          ' -⯿　-〿︰-﹏＀-￯')
+
+FIELD_SCRIPTS = {
+    'amharic': 'ethiopic',
+    'tigrinya': 'ethiopic',
+    'tigrigna': 'ethiopic',
+    'arabic': 'arabic',
+    'chinese': 'cjk',
+}
+
+# Letters outside the field's script, Latin and COMMON
+_FOREIGN = {script: re.compile(f"[^{ranges}{SCRIPT_RANGES['latin']}{COMMON}]")
+            for script, ranges in SCRIPT_RANGES.items()}
+_OWN_SCRIPT = {script: re.compile(f"[{ranges}]") for script, ranges in SCRIPT_RANGES.items()}
+_LETTER = re.compile(r'[^\W\d_]')
+_CONTROL = re.compile('[\u0000-\u0008\u000b\u000c\u000e-\u001f\u007f-\u009f�]')
+_STUB = re.compile(r'\[\s*[A-Z][A-Za-z ]*:\s.*\]')
+
+
+def field_script(field: str) -> str:
+    if field.endswith(PHONETIC_SUFFIX):
+        return 'latin'
+    return FIELD_SCRIPTS.get(field, 'latin')
+
+
+def encoding_issues(value: str) -> List[str]:
+    """Checks that apply to any string."""
+    issues = []
+    if is_suspect(value) and repair_text(value) != value:
+        issues.append('mojibake')
+    if _CONTROL.search(value):
+        issues.append('control')
+    if _STUB.search(value):
+        issues.append('stub')
+    return issues
+
+
+def value_issues(field: str, value: str, english: Optional[str]) -> List[str]:
+    """Names of the checks a phrase value fails."""
+    issues = encoding_issues(value)
+    script = field_script(field)
+    if not value.isascii() and _FOREIGN[script].search(value):
+        issues.append('script')
+    if script != 'latin' and not _OWN_SCRIPT[script].search(value) and _LETTER.search(value):
+        issues.append('untranslated')
+    elif (value == english and field != 'english' and not field.endswith(PHONETIC_SUFFIX)
+          and _LETTER.search(value)):
+        issues.append('english_copy')
+    if value != value.strip() or '  ' in value:
+        issues.append('whitespace')
+    return issues
+
+
+def is_placeholder(field: str, value, english: Optional[str]) -> bool:
+    """A stub, untranslated or English-copy value: not a translation to publish."""
+    return isinstance(value, str) and bool(set(value_issues(field, value, english))
+                                           & set(PLACEHOLDER_CHECKS))
+
+
+def _strings(value, path: str):
+    if isinstance(value, str):
+        yield path, value
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            yield from _strings(item, f"{path}.{key}")
+    elif isinstance(value, list):
+        for i, item in enumerate(value):
+            yield from _strings(item, f"{path}[{i}]")
+
+
+def severity(check: str, field: Optional[str] = None,
+             published: Optional[Iterable[str]] = None) -> str:
+    """Severity of a check; placeholders in a published language's fields are errors."""
+    if check in PLACEHOLDER_CHECKS and field and published:
+        language = field[:-len(PHONETIC_SUFFIX)] if field.endswith(PHONETIC_SUFFIX) else field
+        if language in published:
+            return ERROR
+    return SEVERITY[check]
+
+
+def validate_file(path, published: Optional[Iterable[str]] = None) -> Dict:
+    """Check one catalog or language file; returns its part of the report."""
+    path = Path(path)
+    published = frozenset(published or ())
+    issues = []
+    phrases = values = 0
+
+    def add(check, value, field=None, **where):
+        if field is not None:
+            where['field'] = field
+        issues.append({'check': check, 'severity': severity(check, field, published),
+                       **where, 'value': value})
+
+    for kind, name, item in iter_events(path):
+        if kind == 'meta':
+            for location, text in _strings(item, name):
+                for check in encoding_issues(text):
+                    add(check, text, location=location)
+        elif kind == 'phrase' and isinstance(item, dict):
+            phrases += 1
+            english = item.get('english')
+            for field, value in item.items():
+                if not isinstance(value, str) or not value:
+                    continue
+                values += 1
+                for check in value_issues(field, value, english):
+                    add(check, value, category=name, english=english, field=field)
+
+    counts: Dict[str, int] = {}
+    for issue in issues:
+        counts[issue['check']] = counts.get(issue['check'], 0) + 1
+    return {'file': path.as_posix(), 'phrases': phrases, 'values': values,
+            'counts': counts, 'issues': issues}
+
+
+def validate_files(paths: Iterable, jobs: Optional[int] = None,
+                   published: Optional[Iterable[str]] = None) -> Dict:
+    """
+    Validate files (in a process pool when there are several) into one
+    report. Placeholders in ``published`` languages count as errors.
+    """
+    paths = [Path(p) for p in paths]
+    published = sorted(published or ())
+    started = time.perf_counter()
+    if len(paths) > 1 and jobs != 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(validate_file, paths, [published] * len(paths)))
+    else:
+        results = [validate_file(path, published) for path in paths]
+
+    summary = {ERROR: 0, WARNING: 0}
+    by_check: Dict[str, int] = {}
+    for result in results:
+        for issue in result['issues']:
+            summary[issue['severity']] += 1
+        for check, count in result['counts'].items():
+            by_check[check] = by_check.get(check, 0) + count
+    return {
+        'version': REPORT_VERSION,
+        'errors': summary[ERROR],
+        'warnings': summary[WARNING],
+        'by_check': dict(sorted(by_check.items())),
+        'seconds': round(time.perf_counter() - started, 4),
+        'files': results,
+    }
+
+
+def published_languages(path) -> List[str]:
+    """Languages with metadata in a catalog (the languages it publishes)."""
+    return [name for name, meta in read_metadata(path).items() if isinstance(meta, dict)]
+
+
+def write_report(report: Dict, path):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_file, path)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Check translation catalogs for encoding and placeholder problems")
+    parser.add_argument(
+        "files",
+        nargs="*",
+        help="Files to check (default: translations/*.json)"
+    )
+    parser.add_argument(
+        "--report",
+        help="Write the JSON report to this file (default: print a summary)"
+    )
+    parser.add_argument(
+        "--published",
+        action="store_true",
+        help="Treat placeholders as errors for the languages published in translations/all_languages.json"
+    )
+    parser.add_argument(
+        "--strict",
+        action="store_true",
+        help="Fail on warnings as well as errors"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes (default: one per CPU)"
+    )
+    parser.add_argument(
+        "--show",
+        type=int,
+        default=5,
+        help="Issues to print per check"
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    files = args.files or sorted(str(p) for p in (ROOT / 'translations').glob('*.json'))
+    published = published_languages(ROOT / 'translations' / 'all_languages.json') if args.published else None
+    report = validate_files(files, args.jobs, published)
+    if args.report:
+        write_report(report, args.report)
+
+    for result in report['files']:
+        if not result['counts']:
+            continue
+        counts = ', '.join(f"{check} {n}" for check, n in sorted(result['counts'].items()))
+        print(f"{result['file']}: {counts}")
+        shown: Dict[str, int] = {}
+        for issue in result['issues']:
+            if shown.get(issue['check'], 0) >= args.show:
+                continue
+            shown[issue['check']] = shown.get(issue['check'], 0) + 1
+            where = issue.get('location') or f"{issue['category']} / {issue['english']} / {issue['field']}"
+            print(f"    [{issue['severity']}] {issue['check']}: {where}: {issue['value']!r}")
+
+    print(f"\n{'❌' if report['errors'] else '✅'} {report['errors']} error(s), "
+          f"{report['warnings']} warning(s) in {len(report['files'])} file(s) "
+          f"({report['seconds']:.3f}s)")
+    failed = report['errors'] or (args.strict and report['warnings'])
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""
+Cold-start benchmark for the priority API.
+Times `from priority_api import PriorityAPI; PriorityAPI()` in fresh
+interpreters and fails if it exceeds the latency budget or if plotting /
+graph-analysis libraries get imported on the way.
+
+Usage:
+    python benchmark_startup.py
+    python benchmark_startup.py --runs 10 --budget-ms 50
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+# Modules that must stay out of a plain PriorityAPI() start-up
+HEAVY_MODULES = ['matplotlib', 'networkx']
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+from priority_api import PriorityAPI
+api = PriorityAPI()
+api.get_learning_path('asylum_seeker')
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    'elapsed_ms': elapsed * 1000,
+    'heavy_modules': [m for m in %r if m in sys.modules],
+}))
+""" % (HEAVY_MODULES,)
+
+
+def run_probe() -> dict:
+    """Run one cold start in a fresh interpreter and return its measurements."""
+    result = subprocess.run(
+        [sys.executable, '-c', PROBE],
+        cwd=Path(__file__).parent,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark PriorityAPI cold start")
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=5,
+        help="Number of fresh interpreters to time"
+    )
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=100.0,
+        help="Maximum allowed median cold-start time in milliseconds"
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    timings = []
+    heavy = set()
+    for _ in range(args.runs):
+        probe = run_probe()
+        timings.append(probe['elapsed_ms'])
+        heavy.update(probe['heavy_modules'])
+
+    median = statistics.median(timings)
+    print(f"PriorityAPI() cold start over {args.runs} runs:")
+    print(f"  median: {median:.1f} ms")
+    print(f"  min:    {min(timings):.1f} ms")
+    print(f"  max:    {max(timings):.1f} ms")
+    print(f"  budget: {args.budget_ms:.1f} ms")
+
+    failed = False
+    if heavy:
+        print(f"❌ Heavy modules imported at start-up: {', '.join(sorted(heavy))}")
+        failed = True
+    if median > args.budget_ms:
+        print(f"❌ Median cold start exceeds budget")
+        failed = True
+
+    if failed:
+        sys.exit(1)
+    print("✅ Cold start within budget")
+
+
+if __name__ == "__main__":
+    main()
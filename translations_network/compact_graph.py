@@ -0,0 +1,216 @@
+"""
+Compact array-backed representation of the learning network.
+Stores nodes as integer IDs and edges as CSR adjacency arrays, built directly
+from categories.json without importing networkx.
+"""
+
+from array import array
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Node type codes stored in CompactGraph.node_types
+ROOT = 0
+PERSONA = 1
+CATEGORY = 2
+SUBCATEGORY = 3
+
+NODE_TYPE_NAMES = ('root', 'persona', 'category', 'subcategory')
+
+
+class CompactGraph:
+    """
+    Directed graph with integer node IDs and CSR adjacency.
+
+    Successors of node ``i`` are ``indices[indptr[i]:indptr[i + 1]]`` with
+    parallel ``weights`` / ``priorities`` / ``persona_weights`` /
+    ``edge_sources`` arrays indexed by edge position. A reverse CSR (``rev_indptr`` / ``rev_edges``) gives
+    predecessors in the order their edges were added.
+    """
+
+    def __init__(self):
+        """Create an empty graph; use from_categories() to populate it."""
+        self.node_ids: List[str] = []
+        self.index: Dict[str, int] = {}
+        self.node_types = array('b')
+
+        # Per-node attributes (None where not applicable to the node type)
+        self.names: List[Optional[str]] = []
+        self.descriptions: List[Optional[str]] = []
+        self.node_priorities = array('l')
+        self.subcategories: List[Optional[List[str]]] = []
+        self.parent_category = array('l')
+
+        # Forward CSR and parallel edge attribute arrays
+        self.indptr = array('l', [0])
+        self.indices = array('l')
+        self.weights = array('d')
+        self.priorities = array('l')
+        self.persona_weights = array('d')
+        self.edge_sources = array('l')
+
+        # Reverse CSR: positions into the forward edge arrays
+        self.rev_indptr = array('l', [0])
+        self.rev_edges = array('l')
+
+    @classmethod
+    def from_categories(cls, categories_data: Dict) -> 'CompactGraph':
+        """Build the graph from parsed categories.json data."""
+        graph = cls()
+        personas = categories_data['personas']
+        categories = categories_data['categories']
+
+        graph._add_node("ROOT", ROOT, priority=0)
+        for persona in personas:
+            graph._add_node(
+                persona['id'], PERSONA,
+                name=persona['name'],
+                description=persona['description']
+            )
+
+        # Edges are collected per source so they can be laid out as CSR
+        out_edges: Dict[int, List[Tuple[int, float, int, float]]] = {}
+        root = graph.index["ROOT"]
+        for persona in personas:
+            out_edges.setdefault(root, []).append(
+                (graph.index[persona['id']], 1.0, -1, -1.0)
+            )
+
+        for category in categories:
+            cat_id = category['id']
+            priority = category['priority']
+            cat_idx = graph._add_node(
+                cat_id, CATEGORY,
+                name=category['name'],
+                description=category['description'],
+                priority=priority,
+                subcategories=category['subcategories']
+            )
+
+            for persona in personas:
+                persona_id = persona['id']
+                if category['personas'][0] == "all" or persona_id in category['personas']:
+                    weight = persona.get('priority_weights', {}).get(cat_id, 0.5)
+                    if weight > 0:
+                        # Lower priority number = higher importance, so invert it
+                        combined_weight = (1.0 / priority) * weight
+                        out_edges.setdefault(graph.index[persona_id], []).append(
+                            (cat_idx, combined_weight, priority, weight)
+                        )
+
+            for subcat in category['subcategories']:
+                subcat_idx = graph._add_node(
+                    f"{cat_id}.{subcat}", SUBCATEGORY,
+                    name=subcat.replace('_', ' ').title(),
+                    parent=cat_idx
+                )
+                out_edges.setdefault(cat_idx, []).append((subcat_idx, 1.0, -1, -1.0))
+
+        graph._build_csr(out_edges)
+        return graph
+
+    def _add_node(self, node_id: str, node_type: int, name: str = None,
+                  description: str = None, priority: int = -1,
+                  subcategories: List[str] = None, parent: int = -1) -> int:
+        """Append a node and return its integer ID."""
+        idx = len(self.node_ids)
+        self.node_ids.append(node_id)
+        self.index[node_id] = idx
+        self.node_types.append(node_type)
+        self.names.append(name)
+        self.descriptions.append(description)
+        self.node_priorities.append(priority)
+        self.subcategories.append(subcategories)
+        self.parent_category.append(parent)
+        return idx
+
+    def _build_csr(self, out_edges: Dict[int, List[Tuple[int, float, int, float]]]):
+        """Lay out collected edges as forward and reverse CSR arrays."""
+        n = len(self.node_ids)
+        in_edges: List[List[int]] = [[] for _ in range(n)]
+
+        for source in range(n):
+            for target, weight, priority, persona_weight in out_edges.get(source, ()):
+                in_edges[target].append(len(self.indices))
+                self.indices.append(target)
+                self.weights.append(weight)
+                self.priorities.append(priority)
+                self.persona_weights.append(persona_weight)
+                self.edge_sources.append(source)
+            self.indptr.append(len(self.indices))
+
+        # Sources are visited in node order, so predecessors come out in the
+        # same order networkx reports them
+        for target in range(n):
+            self.rev_edges.extend(in_edges[target])
+            self.rev_indptr.append(len(self.rev_edges))
+
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self.index
+
+    def __len__(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def number_of_edges(self) -> int:
+        """Total number of directed edges."""
+        return len(self.indices)
+
+    def out_edges(self, idx: int) -> range:
+        """Edge positions for the successors of node ``idx``."""
+        return range(self.indptr[idx], self.indptr[idx + 1])
+
+    def in_edges(self, idx: int) -> Iterator[int]:
+        """Edge positions for the predecessors of node ``idx``."""
+        for k in range(self.rev_indptr[idx], self.rev_indptr[idx + 1]):
+            yield self.rev_edges[k]
+
+    def node_type(self, idx: int) -> str:
+        """Type name ('root', 'persona', ...) of node ``idx``."""
+        return NODE_TYPE_NAMES[self.node_types[idx]]
+
+    def nodes_of_type(self, node_type: int) -> List[int]:
+        """Integer IDs of all nodes with the given type code."""
+        return [i for i, t in enumerate(self.node_types) if t == node_type]
+
+    def node_attributes(self, idx: int) -> Dict:
+        """Attribute dict for node ``idx``, matching the networkx node data."""
+        node_type = self.node_types[idx]
+        attrs = {'type': NODE_TYPE_NAMES[node_type]}
+        if node_type == ROOT:
+            attrs['priority'] = self.node_priorities[idx]
+        elif node_type == PERSONA:
+            attrs['name'] = self.names[idx]
+            attrs['description'] = self.descriptions[idx]
+        elif node_type == CATEGORY:
+            attrs['name'] = self.names[idx]
+            attrs['priority'] = self.node_priorities[idx]
+            attrs['description'] = self.descriptions[idx]
+            attrs['subcategories'] = self.subcategories[idx]
+        else:
+            attrs['name'] = self.names[idx]
+            attrs['parent_category'] = self.node_ids[self.parent_category[idx]]
+        return attrs
+
+    def edge_attributes(self, e: int) -> Dict:
+        """Attribute dict for edge position ``e``, matching the networkx edge data."""
+        attrs = {'weight': self.weights[e]}
+        if self.priorities[e] >= 0:
+            attrs['priority'] = self.priorities[e]
+            attrs['persona_weight'] = self.persona_weights[e]
+        return attrs
+
+    def edges(self) -> Iterator[Tuple[int, int, int]]:
+        """Yield (source, target, edge position) for every edge."""
+        for e, target in enumerate(self.indices):
+            yield self.edge_sources[e], target, e
+
+    def to_networkx(self):
+        """Build an equivalent networkx DiGraph for analysis and visualization."""
+        import networkx as nx
+
+        G = nx.DiGraph()
+        for idx, node_id in enumerate(self.node_ids):
+            G.add_node(node_id, **self.node_attributes(idx))
+        for source, target, e in self.edges():
+            G.add_edge(self.node_ids[source], self.node_ids[target],
+                       **self.edge_attributes(e))
+        return G
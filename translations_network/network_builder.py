@@ -4,243 +4,297 @@ Builds a graph connecting personas, categories, and sentences for smart prioriti
 """
 
 import json
-import networkx as nx
 from pathlib import Path
-import matplotlib.pyplot as plt
 from typing import Dict, List, Tuple, Optional
 
+from compact_graph import CompactGraph, PERSONA, CATEGORY, SUBCATEGORY
+
+# Ranking modes accepted by get_personalized_priorities() / get_learning_path()
+#   weight   - direct persona -> category edge weight, then static priority
+#   pagerank - personalized PageRank over categories, subcategories and phrases
+SCORING_MODES = ('weight', 'pagerank')
+
 class LanguageLearningNetwork:
     """Creates and manages a network of learning priorities."""
     
-    def __init__(self, categories_file: str = None):
+    def __init__(self, categories_file: str = None, phrases_file: str = None):
         """Initialize the network."""
-        self.G = nx.DiGraph()
+        self.graph = CompactGraph()
         self.categories_data = None
+        self._G = None
+        self._clear_caches()
         
         if categories_file is None:
             categories_file = Path(__file__).parent / "categories.json"
+        if phrases_file is None:
+            phrases_file = Path(__file__).parent.parent / "translations" / "english.json"
         
+        self.categories_file = categories_file
+        self.phrases_file = phrases_file
         self.load_categories(categories_file)
         self.build_network()
     
+    @property
+    def G(self):
+        """
+        networkx view of the network, built on first access.
+        
+        Only analysis and visualization need networkx; queries are answered
+        from the compact graph and the precomputed caches.
+        """
+        if self._G is None:
+            self._G = self.graph.to_networkx()
+        return self._G
+    
     def load_categories(self, filepath: str):
         """Load categories and personas from JSON file."""
         with open(filepath, 'r', encoding='utf-8') as f:
             self.categories_data = json.load(f)
+        
+        # Anything precomputed from the previous categories is now stale
+        self._G = None
+        self._clear_caches()
+    
+    def reload_categories(self, filepath: str = None):
+        """Reload categories from disk and rebuild the network and its caches."""
+        if filepath is None:
+            filepath = self.categories_file
+        
+        self.categories_file = filepath
+        self.load_categories(filepath)
+        self.build_network()
+    
+    def _clear_caches(self):
+        """Drop all precomputed query results."""
+        self._personas = ()
+        self._persona_index = {}
+        self._priorities = {}
+        self._learning_paths = {}
+        self._category_info = {}
+        self._persona_view_nodes = {}
+        self._pagerank_priorities = None
+        self._pagerank_paths = None
     
     def build_network(self):
         """Build the complete network graph."""
-        # Add root node
-        self.G.add_node("ROOT", type="root", priority=0)
+        self.graph = CompactGraph.from_categories(self.categories_data)
+        self._G = None
+        self._precompute()
+    
+    def _precompute(self):
+        """
+        Precompute persona lists, priorities, learning paths and category info.
         
-        # Add persona nodes
-        for persona in self.categories_data['personas']:
-            persona_id = persona['id']
-            self.G.add_node(
-                persona_id,
-                type="persona",
-                name=persona['name'],
-                description=persona['description']
-            )
-            self.G.add_edge("ROOT", persona_id, weight=1.0)
+        The graph does not change after build_network(), so every query the API
+        makes can be answered from these plain dicts and tuples instead of
+        walking the graph on each request.
+        """
+        self._clear_caches()
+        graph = self.graph
         
-        # Add category nodes and connect to personas
-        for category in self.categories_data['categories']:
-            cat_id = category['id']
-            priority = category['priority']
+        personas = []
+        for idx in graph.nodes_of_type(PERSONA):
+            personas.append({
+                'id': graph.node_ids[idx],
+                'name': graph.names[idx],
+                'description': graph.descriptions[idx]
+            })
+        self._personas = tuple(personas)
+        self._persona_index = {p['id']: p for p in self._personas}
+        
+        for persona in self._personas:
+            persona_id = persona['id']
+            categories = []
+            for e in graph.out_edges(graph.index[persona_id]):
+                target = graph.indices[e]
+                if graph.node_types[target] == CATEGORY:
+                    categories.append((
+                        target,
+                        graph.weights[e],
+                        graph.node_priorities[target]
+                    ))
             
-            self.G.add_node(
-                cat_id,
-                type="category",
-                name=category['name'],
-                priority=priority,
-                description=category['description'],
-                subcategories=category['subcategories']
+            # Sort by weight (descending) and then by priority (ascending)
+            categories.sort(key=lambda x: (-x[1], x[2]))
+            self._priorities[persona_id] = tuple(
+                (graph.node_ids[target], weight) for target, weight, _ in categories
             )
             
-            # Connect categories to relevant personas
-            for persona in self.categories_data['personas']:
-                persona_id = persona['id']
-                
-                # Check if this category applies to this persona
-                if category['personas'][0] == "all" or persona_id in category['personas']:
-                    # Get weight from persona's priority weights
-                    weight = persona.get('priority_weights', {}).get(cat_id, 0.5)
-                    
-                    if weight > 0:
-                        # Edge weight combines category priority and persona-specific weight
-                        # Lower priority number = higher importance, so invert it
-                        priority_score = 1.0 / priority
-                        combined_weight = priority_score * weight
-                        
-                        self.G.add_edge(
-                            persona_id,
-                            cat_id,
-                            weight=combined_weight,
-                            priority=priority,
-                            persona_weight=weight
-                        )
+            self._learning_paths[persona_id] = tuple(
+                self._path_item(target, weight) for target, weight, _ in categories[:20]
+            )
+        
+        for idx in graph.nodes_of_type(CATEGORY):
+            # Get all personas that use this category
+            relevant_personas = []
+            for e in graph.in_edges(idx):
+                source = graph.edge_sources[e]
+                if graph.node_types[source] == PERSONA:
+                    relevant_personas.append({
+                        'id': graph.node_ids[source],
+                        'name': graph.names[source],
+                        'weight': graph.persona_weights[e]
+                    })
             
-            # Add subcategory nodes
-            for subcat in category['subcategories']:
-                subcat_id = f"{cat_id}.{subcat}"
-                self.G.add_node(
-                    subcat_id,
-                    type="subcategory",
-                    name=subcat.replace('_', ' ').title(),
-                    parent_category=cat_id
-                )
-                self.G.add_edge(cat_id, subcat_id, weight=1.0)
+            category_id = graph.node_ids[idx]
+            self._category_info[category_id] = {
+                'id': category_id,
+                'name': graph.names[idx],
+                'priority': graph.node_priorities[idx],
+                'description': graph.descriptions[idx],
+                'subcategories': graph.subcategories[idx],
+                'relevant_personas': tuple(relevant_personas)
+            }
     
-    def get_personalized_priorities(self, persona_id: str, top_n: int = 10) -> List[Tuple[str, float]]:
-        """Get prioritized categories for a specific persona."""
-        if persona_id not in self.G:
-            raise ValueError(f"Persona '{persona_id}' not found in network")
+    def _path_item(self, target: int, weight: float) -> Dict:
+        """Learning path entry for a category node reached with ``weight``."""
+        graph = self.graph
+        return {
+            'category_id': graph.node_ids[target],
+            'category_name': graph.names[target],
+            'priority': graph.node_priorities[target],
+            'weight': weight,
+            'description': graph.descriptions[target],
+            'subcategories': graph.subcategories[target]
+        }
+    
+    def _precompute_pagerank(self):
+        """
+        Score categories for every persona with personalized PageRank.
+        
+        Phrases from the phrases file are attached to subcategories with the
+        SentenceMapper keywords, then one batched random walk with restart
+        is run from all personas. Done once, on the first 'pagerank' query,
+        so plain priority lookups keep their fast start-up.
+        """
+        from sentence_mapper import SentenceMapper
+        from pagerank import build_walk_graph, batch_personalized_pagerank
+        
+        mapper = SentenceMapper(self.categories_file)
+        phrase_subcategories = {}
+        if Path(self.phrases_file).exists():
+            with open(self.phrases_file, 'r', encoding='utf-8') as f:
+                phrases_data = json.load(f)
+            for phrases in phrases_data.get('categories', {}).values():
+                for phrase in phrases:
+                    english = phrase.get('english', '')
+                    if english and english not in phrase_subcategories:
+                        phrase_subcategories[english] = mapper.categorize_sentence(english)
+        
+        walk = build_walk_graph(self.graph, phrase_subcategories)
+        persona_ids = [p['id'] for p in self._personas]
+        scores = batch_personalized_pagerank(walk, persona_ids)
         
-        # Get all categories connected to this persona
-        categories = []
-        for successor in self.G.successors(persona_id):
-            if self.G.nodes[successor]['type'] == 'category':
-                edge_data = self.G[persona_id][successor]
-                priority = self.G.nodes[successor]['priority']
-                weight = edge_data['weight']
-                
-                categories.append({
-                    'id': successor,
-                    'name': self.G.nodes[successor]['name'],
-                    'priority': priority,
-                    'weight': weight,
-                    'persona_weight': edge_data['persona_weight']
-                })
+        priorities = {}
+        paths = {}
+        for persona_id in persona_ids:
+            persona_scores = scores[persona_id]
+            # Only categories the persona is linked to are eligible
+            ranked = [
+                (cat_id, persona_scores[walk.index[cat_id]], weight)
+                for cat_id, weight in self._priorities[persona_id]
+            ]
+            ranked.sort(key=lambda x: (-x[1], self.graph.node_priorities[self.graph.index[x[0]]]))
+            priorities[persona_id] = tuple((cat_id, score) for cat_id, score, _ in ranked)
+            
+            # The PageRank top 20 can include categories outside the weight top 20
+            paths[persona_id] = tuple(
+                {**self._path_item(self.graph.index[cat_id], weight), 'score': score}
+                for cat_id, score, weight in ranked[:20]
+            )
+        
+        self._pagerank_priorities = priorities
+        self._pagerank_paths = paths
+    
+    def _ranking_tables(self, scoring: str) -> Tuple[Dict, Dict]:
+        """Priorities and learning paths for a scoring mode."""
+        if scoring == 'weight':
+            return self._priorities, self._learning_paths
+        if scoring == 'pagerank':
+            if self._pagerank_priorities is None:
+                self._precompute_pagerank()
+            return self._pagerank_priorities, self._pagerank_paths
+        raise ValueError(f"Unknown scoring mode '{scoring}' (expected one of {SCORING_MODES})")
+    
+    def get_personalized_priorities(self, persona_id: str, top_n: int = 10,
+                                    scoring: str = 'weight') -> List[Tuple[str, float]]:
+        """
+        Get prioritized categories for a specific persona.
         
-        # Sort by weight (descending) and then by priority (ascending)
-        categories.sort(key=lambda x: (-x['weight'], x['priority']))
+        With scoring='pagerank' the second tuple element is the persona's
+        PageRank score for the category instead of the edge weight.
+        """
+        priorities, _ = self._ranking_tables(scoring)
+        if persona_id not in priorities:
+            if persona_id not in self.graph:
+                raise ValueError(f"Persona '{persona_id}' not found in network")
+            # Non-persona nodes have no category edges
+            return []
         
-        return [(cat['id'], cat['weight']) for cat in categories[:top_n]]
+        return list(priorities[persona_id][:top_n])
     
-    def get_learning_path(self, persona_id: str) -> List[Dict]:
-        """Generate a recommended learning path for a persona."""
-        priorities = self.get_personalized_priorities(persona_id, top_n=20)
+    def get_learning_path(self, persona_id: str, scoring: str = 'weight') -> List[Dict]:
+        """
+        Generate a recommended learning path for a persona.
         
-        learning_path = []
-        for cat_id, weight in priorities:
-            cat_node = self.G.nodes[cat_id]
-            learning_path.append({
-                'category_id': cat_id,
-                'category_name': cat_node['name'],
-                'priority': cat_node['priority'],
-                'weight': weight,
-                'description': cat_node['description'],
-                'subcategories': cat_node['subcategories']
-            })
+        With scoring='pagerank' the path is ordered by PageRank and each item
+        carries an extra 'score' field.
+        """
+        _, learning_paths = self._ranking_tables(scoring)
+        if persona_id not in learning_paths:
+            if persona_id not in self.graph:
+                raise ValueError(f"Persona '{persona_id}' not found in network")
+            return []
         
-        return learning_path
+        return [dict(item) for item in learning_paths[persona_id]]
     
     def get_all_personas(self) -> List[Dict]:
         """Get list of all available personas."""
-        personas = []
-        for node_id in self.G.nodes():
-            node = self.G.nodes[node_id]
-            if node['type'] == 'persona':
-                personas.append({
-                    'id': node_id,
-                    'name': node['name'],
-                    'description': node['description']
-                })
-        return personas
+        return [dict(persona) for persona in self._personas]
+    
+    def get_persona(self, persona_id: str) -> Optional[Dict]:
+        """Get a single persona by ID, or None if it does not exist."""
+        persona = self._persona_index.get(persona_id)
+        return dict(persona) if persona else None
     
     def get_category_info(self, category_id: str) -> Optional[Dict]:
         """Get detailed information about a category."""
-        if category_id not in self.G:
-            return None
-        
-        node = self.G.nodes[category_id]
-        if node['type'] != 'category':
+        info = self._category_info.get(category_id)
+        if info is None:
             return None
         
-        # Get all personas that use this category
-        relevant_personas = []
-        for persona_id in self.G.predecessors(category_id):
-            if self.G.nodes[persona_id]['type'] == 'persona':
-                edge_data = self.G[persona_id][category_id]
-                relevant_personas.append({
-                    'id': persona_id,
-                    'name': self.G.nodes[persona_id]['name'],
-                    'weight': edge_data['persona_weight']
-                })
-        
         return {
-            'id': category_id,
-            'name': node['name'],
-            'priority': node['priority'],
-            'description': node['description'],
-            'subcategories': node['subcategories'],
-            'relevant_personas': relevant_personas
+            **info,
+            'relevant_personas': [dict(p) for p in info['relevant_personas']]
         }
     
-    def visualize_network(self, output_file: str = None, persona_filter: str = None):
-        """Create a visualization of the network."""
-        plt.figure(figsize=(20, 16))
+    def get_persona_view_nodes(self, persona_id: str) -> frozenset:
+        """Node IDs within 2 hops of a persona (plus ROOT), as drawn by visualize_network()."""
+        if persona_id in self._persona_view_nodes:
+            return self._persona_view_nodes[persona_id]
         
-        # Create subgraph if filtering by persona
-        if persona_filter:
-            if persona_filter not in self.G:
-                raise ValueError(f"Persona '{persona_filter}' not found")
-            
-            # Get nodes within 2 hops of the persona
-            nodes = set([persona_filter])
-            nodes.add("ROOT")
-            for successor in self.G.successors(persona_filter):
-                nodes.add(successor)
-                for sub_successor in self.G.successors(successor):
-                    nodes.add(sub_successor)
-            
-            G_viz = self.G.subgraph(nodes)
-        else:
-            G_viz = self.G
-        
-        # Position nodes using hierarchical layout
-        pos = nx.spring_layout(G_viz, k=2, iterations=50, seed=42)
-        
-        # Color nodes by type
-        color_map = {
-            'root': '#FF6B6B',
-            'persona': '#4ECDC4',
-            'category': '#95E1D3',
-            'subcategory': '#F3E8D0'
-        }
-        
-        node_colors = [color_map.get(G_viz.nodes[node].get('type', 'unknown'), '#CCCCCC') 
-                      for node in G_viz.nodes()]
+        if persona_id not in self.graph:
+            raise ValueError(f"Persona '{persona_id}' not found")
         
-        # Draw nodes
-        nx.draw_networkx_nodes(G_viz, pos, node_color=node_colors, 
-                              node_size=1000, alpha=0.9)
+        graph = self.graph
+        start = graph.index[persona_id]
+        nodes = {start, graph.index["ROOT"]}
+        for e in graph.out_edges(start):
+            successor = graph.indices[e]
+            nodes.add(successor)
+            for sub_e in graph.out_edges(successor):
+                nodes.add(graph.indices[sub_e])
         
-        # Draw edges with varying thickness based on weight
-        edges = G_viz.edges()
-        weights = [G_viz[u][v].get('weight', 0.5) for u, v in edges]
-        nx.draw_networkx_edges(G_viz, pos, width=[w*3 for w in weights], 
-                              alpha=0.5, arrows=True, arrowsize=15)
-        
-        # Draw labels
-        labels = {node: G_viz.nodes[node].get('name', node) 
-                 if G_viz.nodes[node]['type'] in ['persona', 'category'] 
-                 else '' 
-                 for node in G_viz.nodes()}
-        nx.draw_networkx_labels(G_viz, pos, labels, font_size=8)
-        
-        plt.title(f"Language Learning Network" + 
-                 (f" - {persona_filter}" if persona_filter else ""), 
-                 fontsize=16)
-        plt.axis('off')
-        plt.tight_layout()
+        view = frozenset(graph.node_ids[idx] for idx in nodes)
+        self._persona_view_nodes[persona_id] = view
+        return view
+    
+    def visualize_network(self, output_file: str = None, persona_filter: str = None):
+        """Create a visualization of the network (requires matplotlib)."""
+        # Plotting pulls in matplotlib and networkx, so load it only when asked
+        from network_visualization import visualize_network
         
-        if output_file:
-            plt.savefig(output_file, dpi=300, bbox_inches='tight')
-            print(f"Network visualization saved to {output_file}")
-        else:
-            plt.show()
+        visualize_network(self, output_file=output_file, persona_filter=persona_filter)
     
     def export_to_json(self, output_file: str):
         """Export the network structure to JSON for use in web applications."""
@@ -250,22 +304,21 @@ class LanguageLearningNetwork:
             'personas': self.get_all_personas()
         }
         
+        graph = self.graph
+        
         # Export nodes
-        for node_id in self.G.nodes():
-            node = self.G.nodes[node_id]
+        for idx, node_id in enumerate(graph.node_ids):
             export_data['nodes'].append({
                 'id': node_id,
-                'type': node['type'],
-                **{k: v for k, v in node.items() if k != 'type'}
+                **graph.node_attributes(idx)
             })
         
         # Export edges
-        for source, target in self.G.edges():
-            edge = self.G[source][target]
+        for source, target, e in graph.edges():
             export_data['edges'].append({
-                'source': source,
-                'target': target,
-                **edge
+                'source': graph.node_ids[source],
+                'target': graph.node_ids[target],
+                **graph.edge_attributes(e)
             })
         
         with open(output_file, 'w', encoding='utf-8') as f:
@@ -275,17 +328,20 @@ class LanguageLearningNetwork:
     
     def get_network_stats(self) -> Dict:
         """Get statistics about the network."""
+        graph = self.graph
+        n = len(graph)
+        e = graph.number_of_edges
+        
         return {
-            'total_nodes': self.G.number_of_nodes(),
-            'total_edges': self.G.number_of_edges(),
-            'personas': len([n for n in self.G.nodes() 
-                           if self.G.nodes[n]['type'] == 'persona']),
-            'categories': len([n for n in self.G.nodes() 
-                             if self.G.nodes[n]['type'] == 'category']),
-            'subcategories': len([n for n in self.G.nodes() 
-                                if self.G.nodes[n]['type'] == 'subcategory']),
-            'avg_degree': sum(dict(self.G.degree()).values()) / self.G.number_of_nodes(),
-            'density': nx.density(self.G)
+            'total_nodes': n,
+            'total_edges': e,
+            'personas': len(graph.nodes_of_type(PERSONA)),
+            'categories': len(graph.nodes_of_type(CATEGORY)),
+            'subcategories': len(graph.nodes_of_type(SUBCATEGORY)),
+            # Every edge adds one to the out-degree and one to the in-degree
+            'avg_degree': 2 * e / n,
+            # Directed density, as computed by networkx.density()
+            'density': e / (n * (n - 1)) if n > 1 else 0
         }
 
 
@@ -0,0 +1,206 @@
+"""
+Plotting for the language learning network.
+Kept separate from network_builder so matplotlib and networkx are only
+imported when a visualization is actually requested.
+
+Spring layouts are cached on disk per view, keyed by a hash of the graph
+structure. When a view changes only slightly, the new layout is seeded from
+the cached positions and relaxed with a few iterations instead of being
+recomputed from scratch.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import matplotlib
+import matplotlib.pyplot as plt
+import networkx as nx
+
+DEFAULT_CACHE_DIR = Path(__file__).parent / ".layout_cache"
+
+# Layout parameters for a full (uncached) layout
+LAYOUT_K = 2
+LAYOUT_ITERATIONS = 50
+LAYOUT_SEED = 42
+
+# A seeded relayout is used when at most this fraction of nodes changed
+RELAYOUT_MAX_CHANGED = 0.2
+RELAYOUT_ITERATIONS = 15
+
+# Color nodes by type
+COLOR_MAP = {
+    'root': '#FF6B6B',
+    'persona': '#4ECDC4',
+    'category': '#95E1D3',
+    'subcategory': '#F3E8D0'
+}
+
+
+def graph_structure_hash(G) -> str:
+    """Hash of the node and edge sets; attribute changes do not affect layout."""
+    structure = {
+        'nodes': sorted(str(n) for n in G.nodes()),
+        'edges': sorted([str(u), str(v)] for u, v in G.edges()),
+        'params': [LAYOUT_K, LAYOUT_ITERATIONS, LAYOUT_SEED]
+    }
+    payload = json.dumps(structure, separators=(',', ':')).encode('utf-8')
+    return hashlib.sha256(payload).hexdigest()
+
+
+def _load_cached_layout(cache_file: Path) -> Optional[Dict]:
+    """Read a cached layout, ignoring missing or unreadable files."""
+    if not cache_file.exists():
+        return None
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def compute_layout(G, view: str = "full", cache_dir: Optional[Path] = DEFAULT_CACHE_DIR) -> Dict:
+    """
+    Return node positions for ``G``, reusing the on-disk cache for ``view``.
+
+    - Same structure hash as the cache: positions are returned as-is.
+    - Few nodes changed: spring layout seeded from the cached positions.
+    - Otherwise (or no cache): full spring layout.
+
+    Pass ``cache_dir=None`` to always compute a fresh layout.
+    """
+    if cache_dir is None:
+        return nx.spring_layout(G, k=LAYOUT_K, iterations=LAYOUT_ITERATIONS, seed=LAYOUT_SEED)
+
+    cache_dir = Path(cache_dir)
+    cache_file = cache_dir / f"{view}.json"
+    structure_hash = graph_structure_hash(G)
+
+    cached = _load_cached_layout(cache_file)
+    if cached and cached.get('structure_hash') == structure_hash:
+        return {node: tuple(cached['positions'][str(node)]) for node in G.nodes()}
+
+    seed_pos = None
+    if cached:
+        previous = cached.get('positions', {})
+        current = {str(node) for node in G.nodes()}
+        changed = len(current.symmetric_difference(previous))
+        if changed <= RELAYOUT_MAX_CHANGED * max(len(current), 1):
+            seed_pos = {node: previous[str(node)] for node in G.nodes()
+                        if str(node) in previous}
+
+    if seed_pos:
+        pos = nx.spring_layout(G, pos=seed_pos, k=LAYOUT_K,
+                               iterations=RELAYOUT_ITERATIONS, seed=LAYOUT_SEED)
+    else:
+        pos = nx.spring_layout(G, k=LAYOUT_K, iterations=LAYOUT_ITERATIONS, seed=LAYOUT_SEED)
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    with open(cache_file, 'w', encoding='utf-8') as f:
+        json.dump({
+            'structure_hash': structure_hash,
+            'positions': {str(node): [float(x), float(y)] for node, (x, y) in pos.items()}
+        }, f)
+
+    return pos
+
+
+def _view_graph(network, persona_filter: Optional[str]):
+    """Full graph, or the 2-hop view around a persona."""
+    if not persona_filter:
+        return network.G
+    # Node set comes from the network's compact graph, memoized per persona
+    return network.G.subgraph(network.get_persona_view_nodes(persona_filter))
+
+
+def _draw(G_viz, pos, title: str):
+    """Draw a view onto a new figure and return it."""
+    fig = plt.figure(figsize=(20, 16))
+
+    node_colors = [COLOR_MAP.get(G_viz.nodes[node].get('type', 'unknown'), '#CCCCCC')
+                   for node in G_viz.nodes()]
+
+    # Draw nodes
+    nx.draw_networkx_nodes(G_viz, pos, node_color=node_colors,
+                           node_size=1000, alpha=0.9)
+
+    # Draw edges with varying thickness based on weight
+    edges = G_viz.edges()
+    weights = [G_viz[u][v].get('weight', 0.5) for u, v in edges]
+    nx.draw_networkx_edges(G_viz, pos, width=[w*3 for w in weights],
+                           alpha=0.5, arrows=True, arrowsize=15)
+
+    # Draw labels
+    labels = {node: G_viz.nodes[node].get('name', node)
+              if G_viz.nodes[node]['type'] in ['persona', 'category']
+              else ''
+              for node in G_viz.nodes()}
+    nx.draw_networkx_labels(G_viz, pos, labels, font_size=8)
+
+    plt.title(title, fontsize=16)
+    plt.axis('off')
+    plt.tight_layout()
+    return fig
+
+
+def visualize_network(network, output_file: str = None, persona_filter: str = None,
+                      cache_dir: Optional[Path] = DEFAULT_CACHE_DIR):
+    """Create a visualization of a LanguageLearningNetwork."""
+    G_viz = _view_graph(network, persona_filter)
+    pos = compute_layout(G_viz, view=persona_filter or "full", cache_dir=cache_dir)
+
+    fig = _draw(G_viz, pos, f"Language Learning Network" +
+                (f" - {persona_filter}" if persona_filter else ""))
+
+    if output_file:
+        fig.savefig(output_file, dpi=300, bbox_inches='tight')
+        plt.close(fig)
+        print(f"Network visualization saved to {output_file}")
+    else:
+        plt.show()
+
+
+def render_all_views(network, output_dir: Path, dpi: int = 150,
+                     cache_dir: Optional[Path] = DEFAULT_CACHE_DIR,
+                     include_full: bool = True) -> List[Path]:
+    """
+    Render every persona's view (and optionally the full network) in one process.
+
+    The networkx graph, the layout cache and matplotlib are set up once and
+    shared by all views; figures are closed after saving to keep memory flat.
+    """
+    matplotlib.use('Agg')
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    views = [p['id'] for p in network.get_all_personas()]
+    if include_full:
+        views.insert(0, None)
+
+    written = []
+    for persona_id in views:
+        G_viz = _view_graph(network, persona_id)
+        pos = compute_layout(G_viz, view=persona_id or "full", cache_dir=cache_dir)
+        fig = _draw(G_viz, pos, f"Language Learning Network" +
+                    (f" - {persona_id}" if persona_id else ""))
+
+        output_file = output_dir / f"network_{persona_id or 'full'}.png"
+        fig.savefig(output_file, dpi=dpi, bbox_inches='tight')
+        plt.close(fig)
+        written.append(output_file)
+        print(f"Network visualization saved to {output_file}")
+
+    return written
+
+
+def main():
+    """Render all persona views for the site."""
+    from network_builder import LanguageLearningNetwork
+
+    network = LanguageLearningNetwork()
+    render_all_views(network, Path(__file__).parent / "network_views")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,40 +4,159 @@ Provides functions to get personalized sentence recommendations.
 """
 
 import json
+import sys
 from pathlib import Path
 from typing import Dict, List, Optional
 from network_builder import LanguageLearningNetwork
 
+REPO_ROOT = Path(__file__).parent.parent
+
 class PriorityAPI:
     """API for accessing personalized learning priorities."""
     
     def __init__(self):
         """Initialize the API with the network."""
         self.network = LanguageLearningNetwork()
-        self.translations_cache = {}
-        self._load_translations()
-    
-    def _load_translations(self):
-        """Load all translation files into cache."""
-        translations_dir = Path(__file__).parent.parent / "translations"
-        if not translations_dir.exists():
-            return
-        
-        for json_file in translations_dir.glob('*.json'):
-            language = json_file.stem.replace('_translations', '')
-            try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    self.translations_cache[language] = json.load(f)
-            except Exception as e:
-                print(f"Error loading {json_file}: {e}")
+        self.translations_dir = REPO_ROOT / "translations"
+        self._catalog = None
+        self._search_index = None
+        self._category_phrases = None
+    
+    def _get_catalog(self):
+        """
+        Open the SQLite phrase catalog (built by build_translations.py) on
+        first use; None when it has not been built.
+        """
+        if self._catalog is None:
+            if str(REPO_ROOT) not in sys.path:
+                sys.path.append(str(REPO_ROOT))
+            from translation_tools.catalog import DEFAULT_DB, PhraseCatalog
+            
+            if not DEFAULT_DB.exists():
+                return None
+            self._catalog = PhraseCatalog(DEFAULT_DB)
+        return self._catalog
+    
+    def _get_search_index(self):
+        """
+        Load the phrase search index (built by build_translations.py) on
+        first use; None when it has not been built.
+        """
+        if self._search_index is None:
+            if str(REPO_ROOT) not in sys.path:
+                sys.path.append(str(REPO_ROOT))
+            from translation_tools.search_index import DEFAULT_INDEX, SearchIndex
+            
+            if not DEFAULT_INDEX.exists():
+                return None
+            self._search_index = SearchIndex.load(DEFAULT_INDEX)
+        return self._search_index
+    
+    def _get_category_phrases(self) -> Dict[str, List[Dict]]:
+        """
+        Catalog phrases grouped by network category, assigned by the
+        SentenceMapper keywords matching their English text (the same text
+        in several catalog categories is listed once). Built once, on first
+        use; empty when the catalog has not been built.
+        """
+        if self._category_phrases is None:
+            catalog = self._get_catalog()
+            if catalog is None:
+                return {}
+            from sentence_mapper import SentenceMapper
+            
+            mapper = SentenceMapper()
+            # A subcategory can belong to several categories (e.g. complaints)
+            subcategory_parents = {}
+            for category in self.network.categories_data['categories']:
+                for subcategory in category['subcategories']:
+                    subcategory_parents.setdefault(subcategory, []).append(category['id'])
+            
+            grouped = {}
+            grouped_english = {}
+            for phrase in catalog.phrases():
+                parents = dict.fromkeys(
+                    parent
+                    for subcategory in mapper.categorize_sentence(phrase['english'])
+                    for parent in subcategory_parents.get(subcategory, [])
+                )
+                for parent in parents:
+                    english = grouped_english.setdefault(parent, set())
+                    if phrase['english'] not in english:
+                        english.add(phrase['english'])
+                        grouped.setdefault(parent, []).append(phrase)
+            self._category_phrases = grouped
+        return self._category_phrases
+    
+    def _translated(self, phrases: List[Dict], language: str, limit: int, **extra) -> List[Dict]:
+        """Up to ``limit`` of ``phrases`` that have a ``language`` translation."""
+        catalog = self._get_catalog()
+        sentences = []
+        for phrase in phrases:
+            if len(sentences) >= limit:
+                break
+            found = catalog.translation(language, phrase['phrase_id'])
+            if found is None:
+                continue
+            sentences.append({
+                'phrase_id': phrase['phrase_id'],
+                'english': phrase['english'],
+                'translation': found['text'],
+                'phonetic': found['phonetic'],
+                'language': language,
+                **extra
+            })
+        return sentences
+    
+    def translate_phrase(
+        self,
+        english: str,
+        source_language: str,
+        target_language: str,
+        category: Optional[str] = None
+    ) -> Optional[Dict]:
+        """Look up a phrase's source and target text by its English text (indexed)."""
+        catalog = self._get_catalog()
+        if catalog is None:
+            return None
+        return catalog.translate(english, source_language, target_language, category)
+    
+    def get_catalog_phrases(self, language: str, category: str) -> List[Dict]:
+        """Phrases of a catalog category (e.g. 'food') with their translation."""
+        catalog = self._get_catalog()
+        if catalog is None:
+            return []
+        return catalog.category_phrases(language, category)
+    
+    def search_phrases(self, query: str, language: str = None, limit: int = 20) -> List[Dict]:
+        """
+        Ranked accent- and script-insensitive search over English, translations
+        and phonetics ("amesegnalehu" finds a-me-seg-na-le-hu).
+        """
+        index = self._get_search_index()
+        if index is None:
+            return []
+        return index.search(query, language=language, limit=limit)
+    
+    def get_available_languages(self) -> List[str]:
+        """List languages that have a translation file."""
+        if not self.translations_dir.exists():
+            return []
+        return [json_file.stem.replace('_translations', '')
+                for json_file in self.translations_dir.glob('*.json')]
     
     def get_personas(self) -> List[Dict]:
         """Get list of all available personas."""
         return self.network.get_all_personas()
     
-    def get_learning_path(self, persona_id: str, limit: int = None) -> List[Dict]:
-        """Get personalized learning path for a persona."""
-        path = self.network.get_learning_path(persona_id)
+    def get_learning_path(
+        self,
+        persona_id: str,
+        limit: int = None,
+        scoring: str = 'weight'
+    ) -> List[Dict]:
+        """Get personalized learning path for a persona ('weight' or 'pagerank' scoring)."""
+        path = self.network.get_learning_path(persona_id, scoring=scoring)
         if limit:
             path = path[:limit]
         return path
@@ -46,7 +165,8 @@ class PriorityAPI:
         self, 
         persona_id: str, 
         language: str,
-        limit: int = 50
+        limit: int = 50,
+        scoring: str = 'weight'
     ) -> List[Dict]:
         """
         Get prioritized sentences for a persona in a specific language.
@@ -55,48 +175,37 @@ class PriorityAPI:
             persona_id: ID of the learner persona
             language: Target language code
             limit: Maximum number of sentences to return
+            scoring: Category ranking mode ('weight' or 'pagerank')
         
         Returns:
             List of sentence dictionaries with priority scores
         """
         # Get learning path for this persona
-        learning_path = self.get_learning_path(persona_id)
+        learning_path = self.get_learning_path(persona_id, scoring=scoring)
         
-        # Get translations for the language
-        if language not in self.translations_cache:
-            return []
-        
-        translations = self.translations_cache[language]
-        
-        # For now, return sentences in priority order
-        # In a full implementation, this would map sentences to categories
+        category_phrases = self._get_category_phrases()
         prioritized = []
+        seen = set()
         
-        for i, item in enumerate(learning_path):
-            # Add category information to help with future mapping
+        # Catalog phrases in learning-path order, each under its first category
+        for item in learning_path:
             category_info = {
                 'category_id': item['category_id'],
                 'category_name': item['category_name'],
                 'priority': item['priority'],
                 'weight': item['weight']
             }
-            
-            # This is a placeholder - in production, you'd map actual sentences
-            # to categories using the SentenceMapper
-            for key, value in list(translations.items())[:5]:
-                if key not in ['language', 'code', 'direction']:
-                    prioritized.append({
-                        'english': key,
-                        'translation': value,
-                        'language': language,
-                        'priority_score': item['weight'],
-                        'category': category_info
-                    })
+            phrases = [phrase for phrase in category_phrases.get(item['category_id'], [])
+                       if phrase['english'] not in seen]
+            sentences = self._translated(phrases, language, limit - len(prioritized),
+                                         priority_score=item['weight'], category=category_info)
+            seen.update(sentence['english'] for sentence in sentences)
+            prioritized.extend(sentences)
             
             if len(prioritized) >= limit:
                 break
         
-        return prioritized[:limit]
+        return prioritized
     
     def get_category_sentences(
         self,
@@ -109,29 +218,15 @@ class PriorityAPI:
         if not category_info:
             return []
         
-        if language not in self.translations_cache:
-            return []
-        
-        translations = self.translations_cache[language]
-        
-        # Placeholder - would use SentenceMapper in production
-        sentences = []
-        for key, value in list(translations.items())[:limit]:
-            if key not in ['language', 'code', 'direction']:
-                sentences.append({
-                    'english': key,
-                    'translation': value,
-                    'language': language,
-                    'category': category_info['name']
-                })
-        
-        return sentences
+        phrases = self._get_category_phrases().get(category_id, [])
+        return self._translated(phrases, language, limit, category=category_info['name'])
     
     def get_recommendation(
         self,
         persona_id: str,
         languages: List[str],
-        sentences_per_language: int = 10
+        sentences_per_language: int = 10,
+        scoring: str = 'weight'
     ) -> Dict:
         """
         Get comprehensive learning recommendations.
@@ -140,19 +235,17 @@ class PriorityAPI:
             persona_id: ID of the learner persona
             languages: List of target languages
             sentences_per_language: Number of sentences per language
+            scoring: Category ranking mode ('weight' or 'pagerank')
         
         Returns:
             Dictionary with learning recommendations
         """
-        persona = next(
-            (p for p in self.get_personas() if p['id'] == persona_id),
-            None
-        )
+        persona = self.network.get_persona(persona_id)
         
         if not persona:
             return {'error': 'Persona not found'}
         
-        learning_path = self.get_learning_path(persona_id, limit=10)
+        learning_path = self.get_learning_path(persona_id, limit=10, scoring=scoring)
         
         recommendations = {
             'persona': persona,
@@ -164,7 +257,8 @@ class PriorityAPI:
             sentences = self.get_prioritized_sentences(
                 persona_id,
                 language,
-                limit=sentences_per_language
+                limit=sentences_per_language,
+                scoring=scoring
             )
             recommendations['languages'][language] = sentences
         
@@ -175,7 +269,7 @@ class PriorityAPI:
         web_data = {
             'personas': self.get_personas(),
             'categories': [],
-            'available_languages': list(self.translations_cache.keys())
+            'available_languages': self.get_available_languages()
         }
         
         # Get all categories with their info